@@ -2,15 +2,21 @@
 Example: PredicateBrowserAgent with compact prompt customization.
 
 This shows how to override the compact prompt used for action proposal.
+Instead of truncating the default DOM context string, the builder projects the
+snapshot itself into a token-budgeted element list (most actionable elements first).
 
 Usage:
   python examples/agent/predicate_browser_agent_custom_prompt.py
 """
 
-import asyncio
 import os
 
-from predicate import AsyncSentienceBrowser, PredicateBrowserAgent, PredicateBrowserAgentConfig
+try:
+    import tiktoken  # optional: exact token counts for the DOM budget
+except ImportError:
+    tiktoken = None
+
+from predicate import AsyncSentienceBrowser, PredicateBrowserAgent, PredicateBrowserAgentConfig, run
 from predicate.agent_runtime import AgentRuntime
 from predicate.llm_provider import LLMProvider, LLMResponse
 from predicate.models import Snapshot
@@ -45,6 +51,90 @@ class RecordingProvider(LLMProvider):
         return "recording-provider"
 
 
+# Token budget for the DOM section of the user prompt.
+DOM_TOKEN_BUDGET = 1500
+
+# Elements are packed in priority order: actionable controls, then headings, then the rest.
+_ROLE_RANK = {
+    "button": 0,
+    "link": 0,
+    "textbox": 0,
+    "searchbox": 0,
+    "combobox": 0,
+    "checkbox": 0,
+    "radio": 0,
+    "heading": 1,
+}
+
+
+def _token_counter():
+    if tiktoken is not None:
+        try:
+            enc = tiktoken.get_encoding("cl100k_base")
+            return lambda text: len(enc.encode(text))
+        except Exception:
+            pass
+    # Rough fallback: ~4 characters per token.
+    return lambda text: len(text) // 4 + 1
+
+
+_count_tokens = _token_counter()
+
+
+def project_snapshot(snap: Snapshot, token_budget: int = DOM_TOKEN_BUDGET) -> str:
+    """
+    Serialize snapshot elements as `id role "name" [state]` lines within a token budget.
+
+    Element fields are gathered into parallel columns in one pass, the indices are
+    ordered by role priority (stable, so snapshot importance order is kept within a
+    rank), and lines are emitted until the budget is spent.
+    """
+    ids: list[int] = []
+    roles: list[str] = []
+    names: list[str] = []
+    states: list[str] = []
+    for el in snap.elements:
+        ids.append(el.id)
+        roles.append(el.role)
+        names.append((el.name or el.text or "")[:80])
+        flags = []
+        if el.disabled:
+            flags.append("disabled")
+        if el.checked:
+            flags.append("checked")
+        if el.expanded:
+            flags.append("expanded")
+        if el.value:
+            flags.append(f"value={el.value[:40]}")
+        states.append(",".join(flags))
+
+    order = sorted(range(len(ids)), key=lambda i: _ROLE_RANK.get(roles[i], 2))
+
+    lines: list[str] = []
+    used = 0
+    for i in order:
+        line = f'{ids[i]} {roles[i]} "{names[i]}"' + (f" [{states[i]}]" if states[i] else "")
+        cost = _count_tokens(line) + 1  # +1 for the newline
+        if used + cost > token_budget:
+            break
+        lines.append(line)
+        used += cost
+    return "\n".join(lines)
+
+
+# Kept constant so every step sends a byte-identical system prompt; providers with
+# prefix caching (OpenAI automatically, Anthropic with cache_system_prompt=True) can reuse it.
+_SYSTEM_PROMPT = (
+    "You are a web automation executor.\n"
+    "Return ONLY ONE action in this format:\n"
+    "- CLICK(id)\n"
+    '- TYPE(id, "text")\n'
+    "- PRESS('key')\n"
+    "- FINISH()\n"
+    "No prose."
+)
+
+
 def compact_prompt_builder(
     task_goal: str,
     step_goal: str,
@@ -52,25 +142,14 @@ def compact_prompt_builder(
     snap: Snapshot,
     history_summary: str,
 ) -> tuple[str, str]:
-    _ = snap
-    system = (
-        "You are a web automation executor.\n"
-        "Return ONLY ONE action in this format:\n"
-        "- CLICK(id)\n"
-        '- TYPE(id, "text")\n'
-        "- PRESS('key')\n"
-        "- FINISH()\n"
-        "No prose."
-    )
-    # Optional: aggressively control token usage by truncating DOM context.
-    dom_context = dom_context[:4000]
-    user = (
-        f"TASK GOAL:\n{task_goal}\n\n"
-        + (f"RECENT STEPS:\n{history_summary}\n\n" if history_summary else "")
-        + f"STEP GOAL:\n{step_goal}\n\n"
-        f"DOM CONTEXT:\n{dom_context}\n"
-    )
-    return system, user
+    # Build the DOM section from the snapshot directly; the default dom_context string is unused.
+    _ = dom_context
+    dom_context = project_snapshot(snap)
+    parts = ["TASK GOAL:\n", task_goal, "\n\n"]
+    if history_summary:
+        parts += ("RECENT STEPS:\n", history_summary, "\n\n")
+    parts += ("STEP GOAL:\n", step_goal, "\n\nDOM CONTEXT:\n", dom_context, "\n")
+    return _SYSTEM_PROMPT, "".join(parts)
 
 
 async def main() -> None:
@@ -113,5 +192,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
 
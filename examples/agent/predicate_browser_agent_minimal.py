@@ -8,10 +8,9 @@ Usage:
   python examples/agent/predicate_browser_agent_minimal.py
 """
 
-import asyncio
 import os
 
-from predicate import AsyncSentienceBrowser, PredicateBrowserAgent, PredicateBrowserAgentConfig
+from predicate import AsyncSentienceBrowser, PredicateBrowserAgent, PredicateBrowserAgentConfig, run
 from predicate.agent_runtime import AgentRuntime
 from predicate.llm_provider import LLMProvider, LLMResponse
 from predicate.runtime_agent import RuntimeStep, StepVerification
@@ -97,5 +96,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
 
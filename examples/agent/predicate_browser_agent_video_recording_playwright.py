@@ -11,13 +11,12 @@ Usage:
   python examples/agent/predicate_browser_agent_video_recording_playwright.py
 """
 
-import asyncio
 import os
 from pathlib import Path
 
 from playwright.async_api import async_playwright
 
-from predicate import AsyncSentienceBrowser, PredicateBrowserAgent, PredicateBrowserAgentConfig
+from predicate import AsyncSentienceBrowser, PredicateBrowserAgent, PredicateBrowserAgentConfig, run
 from predicate.agent_runtime import AgentRuntime
 from predicate.llm_provider import LLMProvider, LLMResponse
 from predicate.runtime_agent import RuntimeStep
@@ -88,5 +87,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
 
@@ -18,10 +18,9 @@ Usage:
     python examples/agent_runtime_verification.py
 """
 
-import asyncio
 import os
 
-from predicate import AsyncSentienceBrowser
+from predicate import AsyncSentienceBrowser, run
 from predicate.agent_runtime import AgentRuntime
 from predicate.tracing import JsonlTraceSink, Tracer
 from predicate.verification import all_of, exists, not_exists, url_contains, url_matches
@@ -114,4 +113,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
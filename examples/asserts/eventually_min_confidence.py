@@ -7,10 +7,9 @@ This example shows:
 - structured assertion records in traces
 """
 
-import asyncio
 import os
 
-from predicate import AgentRuntime, AsyncSentienceBrowser
+from predicate import AgentRuntime, AsyncSentienceBrowser, run
 from predicate.tracing import JsonlTraceSink, Tracer
 from predicate.verification import exists
 
@@ -47,4 +46,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
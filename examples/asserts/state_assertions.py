@@ -8,10 +8,9 @@ Env vars:
   - SENTIENCE_API_KEY (optional but recommended for v1 state assertions)
 """
 
-import asyncio
 import os
 
-from predicate import AgentRuntime, AsyncSentienceBrowser
+from predicate import AgentRuntime, AsyncSentienceBrowser, run
 from predicate.tracing import JsonlTraceSink, Tracer
 from predicate.verification import (
     exists,
@@ -44,17 +43,16 @@ async def main() -> None:
         await runtime.snapshot()
 
         # v1: state-aware assertions (examples)
-        runtime.assert_(exists("role=heading"), label="has_heading")
-        runtime.assert_(is_enabled("role=link"), label="some_link_enabled")
-        runtime.assert_(
-            is_disabled("role=button text~'continue'"), label="continue_disabled_if_present"
-        )
-        runtime.assert_(
-            is_checked("role=checkbox name~'subscribe'"), label="subscribe_checked_if_present"
-        )
-        runtime.assert_(is_expanded("role=button name~'more'"), label="more_is_expanded_if_present")
-        runtime.assert_(
-            value_contains("role=textbox name~'email'", "@"), label="email_has_at_if_present"
+        # assert_many evaluates them all against the same snapshot, scanning each selector once.
+        runtime.assert_many(
+            [
+                (exists("role=heading"), "has_heading"),
+                (is_enabled("role=link"), "some_link_enabled"),
+                (is_disabled("role=button text~'continue'"), "continue_disabled_if_present"),
+                (is_checked("role=checkbox name~'subscribe'"), "subscribe_checked_if_present"),
+                (is_expanded("role=button name~'more'"), "more_is_expanded_if_present"),
+                (value_contains("role=textbox name~'email'", "@"), "email_has_at_if_present"),
+            ]
         )
 
         # Failure intelligence: if something fails you’ll see:
@@ -65,4 +63,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
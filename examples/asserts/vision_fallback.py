@@ -10,10 +10,9 @@ Env vars:
   - SENTIENCE_API_KEY (optional, recommended so diagnostics/confidence is present)
 """
 
-import asyncio
 import os
 
-from predicate import AgentRuntime, AsyncSentienceBrowser
+from predicate import AgentRuntime, AsyncSentienceBrowser, run
 from predicate.llm_provider import OpenAIProvider
 from predicate.tracing import JsonlTraceSink, Tracer
 from predicate.verification import exists
@@ -55,4 +54,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -8,9 +8,7 @@ Usage:
   python examples/runtime_agent_minimal.py
 """
 
-import asyncio
-
-from predicate import AsyncSentienceBrowser
+from predicate import AsyncSentienceBrowser, run
 from predicate.agent_runtime import AgentRuntime
 from predicate.llm_provider import LLMProvider, LLMResponse
 from predicate.runtime_agent import RuntimeAgent, RuntimeStep, StepVerification
@@ -101,4 +99,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -11,6 +11,7 @@ from ._extension_loader import (
     verify_extension_version,
     verify_extension_version_async,
 )
+from ._runner import run
 from .actions import (
     back,
     check,
@@ -119,7 +120,7 @@ from .ordinal import OrdinalIntent, boost_ordinal_elements, detect_ordinal_inten
 from .overlay import clear_overlay, show_overlay
 from .permissions import PermissionPolicy
 from .query import find, query
-from .read import extract, extract_async, read, read_best_effort
+from .read import extract, extract_async, read, read_best_effort, read_formats
 from .recorder import Recorder, Trace, TraceStep, record
 from .runtime_agent import RuntimeAgent, RuntimeStep, StepVerification
 from .screenshot import screenshot
@@ -197,6 +198,8 @@ __all__ = [
     "verify_extension_injected_async",
     "verify_extension_version",
     "verify_extension_version_async",
+    # Script entry point (uvloop when installed)
+    "run",
     # Browser backends (for browser-use integration)
     "BrowserBackend",
     "CDPTransport",
@@ -246,6 +249,7 @@ __all__ = [
     "generate",
     "read",
     "read_best_effort",
+    "read_formats",
     "screenshot",
     "show_overlay",
     "clear_overlay",
@@ -0,0 +1,38 @@
+"""
+Entry-point helper for async SDK scripts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    # Windows keeps asyncio's default Proactor loop, which Playwright needs for subprocesses.
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run(main: Coroutine[Any, Any, T], *, debug: bool | None = None) -> T:
+    """
+    Run a coroutine to completion, on uvloop when it is installed.
+
+    Drop-in replacement for `asyncio.run(main())` in scripts. Without uvloop
+    (`pip install uvloop`) or on Windows, this is exactly `asyncio.run`.
+
+    Example:
+        >>> from predicate import run
+        >>> run(main())
+    """
+    with asyncio.Runner(debug=debug, loop_factory=_loop_factory()) as runner:
+        return runner.run(main)
@@ -64,10 +64,17 @@ Example usage with AsyncSentienceBrowser (backward compatible):
 from __future__ import annotations
 
 import asyncio
-import difflib
+import binascii
 import hashlib
+import heapq
+import inspect
+import json
+import re
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 from .captcha import (
@@ -92,6 +99,14 @@ from .tools import BackendCapabilities, ToolRegistry
 from .trace_event_builder import TraceEventBuilder
 from .verification import AssertContext, AssertOutcome, Predicate
 
+# orjson is optional: much faster encoding when installed, stdlib json otherwise
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 if TYPE_CHECKING:
     from playwright.async_api import Page
 
@@ -101,6 +116,94 @@ if TYPE_CHECKING:
     from predicate_contracts import ActionRequest
 
 
+# Bounded scroll-metrics reader, shared by _get_scroll_metrics() and the fused JS scroll fallback.
+_SCROLL_METRICS_JS = """
+() => {
+  try {
+    const el = document.scrollingElement || document.documentElement || document.body;
+    const top =
+      (el && typeof el.scrollTop === 'number')
+        ? el.scrollTop
+        : (typeof window.scrollY === 'number' ? window.scrollY : 0);
+    const height = (el && typeof el.scrollHeight === 'number') ? el.scrollHeight : null;
+    const client = (el && typeof el.clientHeight === 'number') ? el.clientHeight : null;
+    return { top, height, client };
+  } catch (e) {
+    return { top: null, height: null, client: null, error: String(e && e.message ? e.message : e) };
+  }
+}
+""".strip()
+
+# _SCROLL_METRICS_JS bound once per document, so polls send a short call instead of the source.
+# The call yields null when a navigation has dropped the binding.
+_SCROLL_METRICS_GLOBAL = "__predicateScrollMetrics"
+_SCROLL_METRICS_INSTALL_JS = f"(window.{_SCROLL_METRICS_GLOBAL} = ({_SCROLL_METRICS_JS}))()"
+_SCROLL_METRICS_CALL_JS = (
+    f"typeof window.{_SCROLL_METRICS_GLOBAL} === 'function' "
+    f"? window.{_SCROLL_METRICS_GLOBAL}() : null"
+)
+
+
+def _eval_value_json(value: Any) -> str:
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except (TypeError, orjson.JSONEncodeError):
+            pass  # e.g. ints beyond 64 bits; stdlib json handles those
+    try:
+        # Same compact form as orjson, so output doesn't depend on what's installed.
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    except Exception:
+        return str(value)
+
+
+# Exact-type formatters for the shapes backend.eval() returns; see _stringify_eval_value().
+_EVAL_VALUE_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    type(None): lambda _: "null",
+    str: str,
+    bool: str,
+    int: str,
+    float: str,
+    dict: _eval_value_json,
+    list: _eval_value_json,
+}
+
+
+# Reads the "passed" flag of an assertion record; see all_assertions_passed().
+_PASSED = itemgetter("passed")
+
+# Vision fallback answers kept per runtime (LRU); see AssertionHandle.eventually().
+_VISION_VERDICT_CACHE_SIZE = 64
+
+
+def _any_of(*needles: str) -> re.Pattern[str]:
+    return re.compile("|".join(map(re.escape, needles)))
+
+
+# CAPTCHA evidence that indicates an interactive challenge (see _is_captcha_detected).
+_CAPTCHA_STRONG_TEXT = (
+    "i'm not a robot",
+    "verify you are human",
+    "human verification",
+    "complete the security check",
+    "please verify",
+)
+_CAPTCHA_STRONG_IFRAME = ("api2/bframe", "hcaptcha", "turnstile")
+_CAPTCHA_STRONG_SELECTOR = (
+    "g-recaptcha-response",
+    "h-captcha-response",
+    "cf-turnstile-response",
+    "recaptcha-checkbox",
+    "hcaptcha-checkbox",
+)
+# Every strong needle in one alternation, so each lowercased hit is scanned once.
+_CAPTCHA_STRONG_HIT_RE = _any_of(
+    *_CAPTCHA_STRONG_TEXT, *_CAPTCHA_STRONG_IFRAME, *_CAPTCHA_STRONG_SELECTOR
+)
+# Text needles contain spaces, so they are also matched across the space-joined hits.
+_CAPTCHA_STRONG_TEXT_RE = _any_of(*_CAPTCHA_STRONG_TEXT)
+
+
 class AgentRuntime:
     """
     Runtime wrapper for agent verification loops.
@@ -121,6 +224,53 @@ class AgentRuntime:
         last_snapshot: Most recent snapshot (for assertion context)
     """
 
+    # Runtime state lives in slots. "__dict__" is kept so callers and tests can
+    # still override methods per instance (e.g. runtime.snapshot = AsyncMock()),
+    # and subclasses that add attributes keep working without their own __slots__.
+    __slots__ = (
+        "backend",
+        "tracer",
+        "tool_registry",
+        "_default_snapshot_options",
+        "_snapshot_options_dump",
+        "step_id",
+        "step_index",
+        "last_snapshot",
+        "_step_pre_snapshot",
+        "_step_pre_url",
+        "_artifact_buffer",
+        "_artifact_timer_task",
+        "_cached_url",
+        "_nav_id",
+        "_mutation_id",
+        "_nav_watch_page",
+        "_page_changed",
+        "_snapshot_cache",
+        "_snapshot_digest_cache",
+        "_tab_backend_cache",
+        "_static_capabilities_cache",
+        "_downloads_cache",
+        "_nearest_matches_cache",
+        "_scroll_metrics_key",
+        "_vision_verdict_cache",
+        "_assertions_this_step",
+        "_step_goal",
+        "_last_action",
+        "_last_action_error",
+        "_last_action_outcome",
+        "_last_action_duration_ms",
+        "_last_action_success",
+        "_task_done",
+        "_task_done_label",
+        "_captcha_options",
+        "_captcha_retry_count",
+        "_captcha_page_control",
+        "_legacy_browser",
+        "_legacy_page",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         backend: BrowserBackend,
@@ -148,8 +298,11 @@ class AgentRuntime:
         self.tracer = tracer
         self.tool_registry = tool_registry
 
-        # Build default snapshot options with API key if provided
-        default_opts = snapshot_options or SnapshotOptions()
+        # Build default snapshot options with API key if provided. Copied, so the caller's
+        # object is not mutated and later edits to it cannot desync the cached dump.
+        default_opts = (
+            snapshot_options.model_copy() if snapshot_options is not None else SnapshotOptions()
+        )
         effective_api_key = predicate_api_key or sentience_api_key
         if effective_api_key:
             default_opts.predicate_api_key = effective_api_key
@@ -175,6 +328,36 @@ class AgentRuntime:
         # Cached URL (updated on snapshot or explicit get_url call)
         self._cached_url: str | None = None
 
+        # Snapshot reuse: the last snapshot stays valid until the page navigates
+        # (framenavigated) or an action is recorded. See _reusable_snapshot().
+        self._nav_id: int = 0
+        self._mutation_id: int = 0
+        self._nav_watch_page: Any | None = None
+        # Set (and replaced) on navigation or a recorded action; eventually() retries wake on it.
+        # Snapshots do not signal it, so concurrent checks cannot wake each other's polls.
+        self._page_changed = asyncio.Event()
+        self._snapshot_cache: tuple[int, int, dict[str, Any], Snapshot] | None = None
+        # Last digest from _compute_snapshot_digest(), keyed by snapshot identity.
+        self._snapshot_digest_cache: tuple[Snapshot, str | None] | None = None
+
+        # Capability probes, memoized per backend object; see capabilities().
+        self._tab_backend_cache: tuple[Any, bool] | None = None
+        self._static_capabilities_cache: tuple[Any, Any, dict[str, bool]] | None = None
+        # Live download list bound per backend object; see _backend_downloads().
+        self._downloads_cache: tuple[Any, list[dict[str, Any]]] | None = None
+        # Failure diagnostics for last_snapshot: its scoring candidates and results keyed by
+        # (selector, limit); see _nearest_matches().
+        self._nearest_matches_cache: (
+            tuple[Snapshot, list[tuple[str, Any]], dict[tuple[str, int], list]] | None
+        ) = None
+        # (backend, nav_id) the page-side scroll metrics helper was installed for.
+        self._scroll_metrics_key: tuple[Any, int] | None = None
+        # Vision fallback responses keyed by (id(provider), screenshot sha256, prompts).
+        # Values keep the provider alive so its id() cannot be reused while cached.
+        self._vision_verdict_cache: OrderedDict[tuple[int, bytes, str, str], tuple[Any, Any]] = (
+            OrderedDict()
+        )
+
         # Assertions accumulated during current step
         self._assertions_this_step: list[dict[str, Any]] = []
         self._step_goal: str | None = None
@@ -191,6 +374,7 @@ class AgentRuntime:
         # CAPTCHA handling (optional, disabled by default)
         self._captcha_options: CaptchaOptions | None = None
         self._captcha_retry_count: int = 0
+        self._captcha_page_control: PageControlHook | None = None
 
     @classmethod
     def from_playwright_page(
@@ -305,16 +489,35 @@ class AgentRuntime:
         elif self._cached_url:
             url = self._cached_url
 
-        downloads = None
-        try:
-            downloads = getattr(self.backend, "downloads", None)
-        except Exception:
-            downloads = None
-
         return AssertContext(
-            snapshot=self.last_snapshot, url=url, step_id=self.step_id, downloads=downloads
+            snapshot=self.last_snapshot,
+            url=url,
+            step_id=self.step_id,
+            downloads=self._backend_downloads(),
         )
 
+    def _backend_downloads(self) -> Any:
+        """
+        Return backend.downloads, binding it once per backend when possible.
+
+        A property-backed list (PlaywrightBackend) is the backend's live record,
+        appended in place, so it is resolved once. Plain attributes may be
+        reassigned and are read on every call.
+        """
+        backend = self.backend
+        cached = self._downloads_cache
+        if cached is not None and cached[0] is backend:
+            return cached[1]
+        try:
+            downloads = getattr(backend, "downloads", None)
+        except Exception:
+            return None
+        if isinstance(downloads, list) and isinstance(
+            getattr(type(backend), "downloads", None), property
+        ):
+            self._downloads_cache = (backend, downloads)
+        return downloads
+
     async def get_url(self) -> str:
         """
         Get current page URL.
@@ -356,6 +559,10 @@ class AgentRuntime:
             >>> # Later, manually emit if needed:
             >>> tracer.emit_snapshot(snapshot, step_id=runtime.step_id)
         """
+        # Subscribe before snapshotting so a navigation during the snapshot invalidates it.
+        watching = self._watch_navigation()
+        cache_key = (self._nav_id, self._mutation_id)
+
         # Check if using legacy browser (backward compat)
         if hasattr(self, "_legacy_browser") and hasattr(self, "_legacy_page"):
             self.last_snapshot = await self._legacy_browser.snapshot(self._legacy_page, **kwargs)
@@ -364,6 +571,8 @@ class AgentRuntime:
                 if self._step_pre_snapshot is None:
                     self._step_pre_snapshot = self.last_snapshot
                     self._step_pre_url = self.last_snapshot.url
+                if watching:
+                    self._snapshot_cache = (*cache_key, dict(kwargs), self.last_snapshot)
             # Auto-emit trace for legacy path too
             if emit_trace and self.last_snapshot is not None:
                 self._emit_snapshot_trace(self.last_snapshot)
@@ -374,9 +583,7 @@ class AgentRuntime:
 
         # Merge default options with call-specific kwargs
         skip_captcha_handling = bool(kwargs.pop("_skip_captcha_handling", False))
-        options_dict = self._snapshot_options.model_dump(exclude_none=True)
-        options_dict.update(kwargs)
-        options = SnapshotOptions(**options_dict)
+        options_dict, options = self._merged_snapshot_options(kwargs)
 
         self.last_snapshot = await backend_snapshot(self.backend, options=options)
         if self.last_snapshot is not None:
@@ -384,7 +591,10 @@ class AgentRuntime:
             if self._step_pre_snapshot is None:
                 self._step_pre_snapshot = self.last_snapshot
                 self._step_pre_url = self.last_snapshot.url
-        if not skip_captcha_handling:
+            if watching:
+                self._snapshot_cache = (*cache_key, options_dict, self.last_snapshot)
+        # Captcha handling is opt-in; skip building the coroutine when it is off.
+        if self._captcha_options and not skip_captcha_handling:
             await self._handle_captcha_if_needed(self.last_snapshot, source="gateway")
 
         # Auto-emit snapshot trace event for Studio visualization
@@ -393,6 +603,113 @@ class AgentRuntime:
 
         return self.last_snapshot
 
+    @property
+    def _snapshot_options(self) -> SnapshotOptions:
+        return self._default_snapshot_options
+
+    @_snapshot_options.setter
+    def _snapshot_options(self, options: SnapshotOptions) -> None:
+        self._default_snapshot_options = options
+        self._snapshot_options_dump = options.model_dump(exclude_none=True)
+
+    def _merged_snapshot_options(
+        self, overrides: dict[str, Any]
+    ) -> tuple[dict[str, Any], SnapshotOptions]:
+        """
+        Merge per-call overrides into the default snapshot options.
+
+        With no overrides the defaults are returned as-is, skipping a dump and re-validation.
+        """
+        if not overrides:
+            return self._snapshot_options_dump, self._default_snapshot_options
+        options_dict = {**self._snapshot_options_dump, **overrides}
+        return options_dict, SnapshotOptions(**options_dict)
+
+    def _watch_navigation(self) -> bool:
+        """
+        Subscribe (once) to page navigations so reusable snapshots can be invalidated.
+
+        Returns False when the backend exposes no page events; snapshot reuse is then disabled.
+        """
+        page = getattr(self, "_legacy_page", None) or getattr(self.backend, "page", None)
+        if page is None:
+            return False
+        if page is self._nav_watch_page:
+            return True
+        on = getattr(page, "on", None)
+        if not callable(on):
+            return False
+        try:
+            result = on("framenavigated", self._on_frame_navigated)
+            if inspect.isawaitable(result):
+                asyncio.get_running_loop().create_task(result)
+        except Exception:
+            return False
+        self._nav_watch_page = page
+        return True
+
+    def _on_frame_navigated(self, frame: Any) -> None:
+        # Playwright reports every frame; ad/tracking iframe navigations leave the page as is.
+        if getattr(frame, "parent_frame", None) is not None:
+            return
+        self._nav_id += 1
+        self._signal_page_change()
+
+    def _page_generation(self) -> tuple[int, int]:
+        return self._nav_id, self._mutation_id
+
+    def _signal_page_change(self) -> None:
+        # Wake every current waiter, then start a fresh event for the next change.
+        self._page_changed.set()
+        self._page_changed = asyncio.Event()
+
+    async def _wait_for_page_change(self, timeout_s: float, *, since: tuple[int, int]) -> None:
+        """
+        Sleep up to `timeout_s`, returning early if the page navigated or an action was
+        recorded after generation `since` (see _page_generation()).
+        """
+        changed = self._page_changed
+        if timeout_s <= 0 or self._page_generation() != since:
+            await asyncio.sleep(0)
+            return
+        try:
+            await asyncio.wait_for(changed.wait(), timeout=timeout_s)
+        except asyncio.TimeoutError:
+            pass
+
+    def invalidate_snapshot_cache(self) -> None:
+        """
+        Mark the page as changed so the next verification takes a fresh snapshot.
+
+        Actions recorded via record_action() do this automatically; call it after
+        mutating the page through other means (e.g. driving the backend directly).
+        """
+        self._mutation_id += 1
+        self._signal_page_change()
+
+    def _reusable_snapshot(self, **kwargs: Any) -> Snapshot | None:
+        """
+        Return `last_snapshot` if it can stand in for `snapshot(**kwargs)`, else None.
+
+        Reuse requires the same effective snapshot options and no navigation or recorded
+        action since it was taken.
+        """
+        cache = self._snapshot_cache
+        if cache is None or self.last_snapshot is None:
+            return None
+        nav_id, mutation_id, opts, snap = cache
+        if snap is not self.last_snapshot:
+            return None
+        if nav_id != self._nav_id or mutation_id != self._mutation_id:
+            return None
+        if hasattr(self, "_legacy_browser") and hasattr(self, "_legacy_page"):
+            effective = dict(kwargs)
+        else:
+            effective = {**self._snapshot_options_dump, **kwargs}
+        if effective != opts:
+            return None
+        return snap
+
     def _emit_snapshot_trace(self, snapshot: Snapshot) -> None:
         """
         Emit a snapshot trace event with screenshot for Studio visualization.
@@ -442,9 +759,7 @@ class AgentRuntime:
         from .backends.snapshot import sampled_snapshot as backend_sampled_snapshot
 
         # Merge default options with call-specific kwargs
-        options_dict = self._snapshot_options.model_dump(exclude_none=True)
-        options_dict.update(kwargs)
-        options = SnapshotOptions(**options_dict)
+        _, options = self._merged_snapshot_options(kwargs)
 
         snap = await backend_sampled_snapshot(
             self.backend,
@@ -495,23 +810,32 @@ class AgentRuntime:
         - client: clientHeight (px) if available
         """
         # Keep this as a single bounded expression; do not dump DOM.
-        expr = """
-(() => {
-  try {
-    const el = document.scrollingElement || document.documentElement || document.body;
-    const top =
-      (el && typeof el.scrollTop === 'number')
-        ? el.scrollTop
-        : (typeof window.scrollY === 'number' ? window.scrollY : 0);
-    const height = (el && typeof el.scrollHeight === 'number') ? el.scrollHeight : null;
-    const client = (el && typeof el.clientHeight === 'number') ? el.clientHeight : null;
-    return { top, height, client };
-  } catch (e) {
-    return { top: null, height: null, client: null, error: String(e && e.message ? e.message : e) };
-  }
-})()
+        key = (self.backend, self._nav_id)
+        if self._scroll_metrics_key == key:
+            v = await self.backend.eval(_SCROLL_METRICS_CALL_JS)
+            if v is not None:
+                return self._as_scroll_metrics(v)
+        v = await self.backend.eval(_SCROLL_METRICS_INSTALL_JS)
+        self._scroll_metrics_key = key
+        return self._as_scroll_metrics(v)
+
+    async def _js_scroll_and_measure(self, dy: float) -> dict[str, Any]:
+        """
+        window.scrollBy(0, dy), wait two animation frames, and return scroll metrics.
+
+        One eval round-trip instead of scrollBy + sleep + _get_scroll_metrics().
+        """
+        expr = f"""
+(async () => {{
+  window.scrollBy(0, {float(dy)});
+  await new Promise((r) => requestAnimationFrame(() => requestAnimationFrame(r)));
+  return ({_SCROLL_METRICS_JS})();
+}})()
 """.strip()
-        v = await self.backend.eval(expr)
+        return self._as_scroll_metrics(await self.backend.eval(expr))
+
+    @staticmethod
+    def _as_scroll_metrics(v: Any) -> dict[str, Any]:
         if isinstance(v, dict):
             return v
         return {"top": v, "height": None, "client": None}
@@ -539,19 +863,20 @@ class AgentRuntime:
         Behavior:
         - captures a bounded before/after scrollTop metric
         - performs a wheel scroll via backend (most compatible)
-        - if verify=True, polls until |after-before| >= min_delta_px or timeout
+        - if verify=True, polls until |after-before| >= min_delta_px or timeout; polling
+          starts at 20ms and backs off by 1.5x up to poll_s, so fast pages settle quickly
         - optionally attempts a JS scrollBy fallback once if wheel has no effect
 
         Returns:
             True if scroll was effective (or verify=False), else False.
         """
-        await self.record_action(f"scroll_by(dy={dy})", url=await self.get_url())
-
         if not verify:
+            await self.record_action(f"scroll_by(dy={dy})", url=await self.get_url())
             await self.backend.wheel(delta_y=float(dy), x=x, y=y)
             return True
 
-        before = await self._get_scroll_metrics()
+        url, before = await asyncio.gather(self.get_url(), self._get_scroll_metrics())
+        await self.record_action(f"scroll_by(dy={dy})", url=url)
         before_top = before.get("top")
         try:
             before_top_f = float(before_top) if before_top is not None else 0.0
@@ -559,13 +884,19 @@ class AgentRuntime:
             before_top_f = 0.0
 
         used_js_fallback = False
-        start = time.monotonic()
+        dy_f = float(dy)
+        min_delta_px_f = float(min_delta_px)
+        timeout_s_f = float(timeout_s)
+        deadline_ns = time.monotonic_ns() + int(timeout_s_f * 1e9)
+        wait_s = min(0.02, float(poll_s))
 
         # First attempt: wheel scroll (preferred).
-        await self.backend.wheel(delta_y=float(dy), x=x, y=y)
+        await self.backend.wheel(delta_y=dy_f, x=x, y=y)
+        measured: dict[str, Any] | None = None
 
         while True:
-            after = await self._get_scroll_metrics()
+            after = measured if measured is not None else await self._get_scroll_metrics()
+            measured = None
             after_top = after.get("top")
             try:
                 after_top_f = float(after_top) if after_top is not None else before_top_f
@@ -573,62 +904,46 @@ class AgentRuntime:
                 after_top_f = before_top_f
 
             delta = after_top_f - before_top_f
-            passed = abs(delta) >= float(min_delta_px)
-
-            if passed:
-                outcome = AssertOutcome(
-                    passed=True,
-                    reason="",
-                    details={
-                        "dy": float(dy),
-                        "min_delta_px": float(min_delta_px),
-                        "before": before,
-                        "after": after,
-                        "delta_px": float(delta),
-                        "js_fallback_used": used_js_fallback,
-                    },
-                )
-                self._record_outcome(
-                    outcome=outcome,
-                    label=label,
-                    required=required,
-                    kind="scroll",
-                    record_in_step=True,
-                )
-                return True
-
-            elapsed = time.monotonic() - start
-            if elapsed >= float(timeout_s):
-                outcome = AssertOutcome(
-                    passed=False,
-                    reason=f"scroll delta {delta:.1f}px < min_delta_px={float(min_delta_px):.1f}px",
-                    details={
-                        "dy": float(dy),
-                        "min_delta_px": float(min_delta_px),
-                        "before": before,
-                        "after": after,
-                        "delta_px": float(delta),
-                        "js_fallback_used": used_js_fallback,
-                        "timeout_s": float(timeout_s),
-                    },
-                )
-                self._record_outcome(
-                    outcome=outcome,
-                    label=label,
-                    required=required,
-                    kind="scroll",
-                    record_in_step=True,
-                )
-                if required:
-                    self._persist_failure_artifacts(reason=f"scroll_failed:{label}")
-                return False
+            passed = abs(delta) >= min_delta_px_f
+            if passed or time.monotonic_ns() >= deadline_ns:
+                break
 
             # Optional fallback: if wheel had no effect, try a bounded JS scroll request once.
             if js_fallback and not used_js_fallback and abs(delta) < 1.0:
                 used_js_fallback = True
-                await self.backend.eval(f"window.scrollBy(0, {float(dy)})")
+                measured = await self._js_scroll_and_measure(dy)
+                continue
+
+            await asyncio.sleep(wait_s)
+            wait_s = min(float(poll_s), wait_s * 1.5)
 
-            await asyncio.sleep(float(poll_s))
+        details: dict[str, Any] = {
+            "dy": dy_f,
+            "min_delta_px": min_delta_px_f,
+            "before": before,
+            "after": after,
+            "delta_px": float(delta),
+            "js_fallback_used": used_js_fallback,
+        }
+        if passed:
+            outcome = AssertOutcome(passed=True, reason="", details=details)
+        else:
+            details["timeout_s"] = timeout_s_f
+            outcome = AssertOutcome(
+                passed=False,
+                reason=f"scroll delta {delta:.1f}px < min_delta_px={min_delta_px_f:.1f}px",
+                details=details,
+            )
+        self._record_outcome(
+            outcome=outcome,
+            label=label,
+            required=required,
+            kind="scroll",
+            record_in_step=True,
+        )
+        if not passed and required:
+            self._persist_failure_artifacts(reason=f"scroll_failed:{label}")
+        return passed
 
     async def list_tabs(self) -> TabListResult:
         backend = self._get_tab_backend()
@@ -674,25 +989,34 @@ class AgentRuntime:
         backend = getattr(self, "backend", None)
         if backend is None:
             return None
-        if not all(
+        cached = self._tab_backend_cache
+        if cached is not None and cached[0] is backend:
+            return backend if cached[1] else None
+        has_tabs = all(
             hasattr(backend, attr) for attr in ("list_tabs", "open_tab", "switch_tab", "close_tab")
-        ):
-            return None
-        return backend
+        )
+        self._tab_backend_cache = (backend, has_tabs)
+        return backend if has_tabs else None
+
+    def _static_capabilities(self, backend: Any) -> dict[str, bool]:
+        """
+        Capabilities fixed by the backend (and legacy browser) objects themselves.
+
+        Memoized per (backend, legacy browser) identity; downloads and filesystem
+        tools can change during a run and are probed by capabilities() on every call.
+        """
+        legacy_browser = getattr(self, "_legacy_browser", None)
+        cached = self._static_capabilities_cache
+        if cached is not None and cached[0] is backend and cached[1] is legacy_browser:
+            return cached[2]
 
-    def capabilities(self) -> BackendCapabilities:
-        backend = getattr(self, "backend", None)
-        if backend is None:
-            return BackendCapabilities()
         has_eval = hasattr(backend, "eval")
         has_keyboard = hasattr(backend, "type_text") or bool(
             getattr(getattr(backend, "_page", None), "keyboard", None)
         )
-        has_downloads = bool(getattr(backend, "downloads", None))
         has_permissions = False
         try:
             context = None
-            legacy_browser = getattr(self, "_legacy_browser", None)
             if legacy_browser is not None:
                 context = getattr(legacy_browser, "context", None)
             if context is None:
@@ -704,6 +1028,20 @@ class AgentRuntime:
                 )
         except Exception:
             has_permissions = False
+        caps = {
+            "tabs": self._get_tab_backend() is not None,
+            "evaluate_js": bool(has_eval),
+            "keyboard": bool(has_keyboard or has_eval),
+            "permissions": has_permissions,
+        }
+        self._static_capabilities_cache = (backend, legacy_browser, caps)
+        return caps
+
+    def capabilities(self) -> BackendCapabilities:
+        backend = getattr(self, "backend", None)
+        if backend is None:
+            return BackendCapabilities()
+        has_downloads = bool(getattr(backend, "downloads", None))
         has_files = False
         if self.tool_registry is not None:
             try:
@@ -711,12 +1049,9 @@ class AgentRuntime:
             except Exception:
                 has_files = False
         return BackendCapabilities(
-            tabs=self._get_tab_backend() is not None,
-            evaluate_js=bool(has_eval),
+            **self._static_capabilities(backend),
             downloads=has_downloads,
             filesystem_tools=has_files,
-            keyboard=bool(has_keyboard or has_eval),
-            permissions=has_permissions,
         )
 
     def can(self, capability: str) -> bool:
@@ -725,15 +1060,11 @@ class AgentRuntime:
 
     @staticmethod
     def _stringify_eval_value(value: Any) -> str:
-        if value is None:
-            return "null"
+        fmt = _EVAL_VALUE_FORMATTERS.get(type(value))
+        if fmt is not None:
+            return fmt(value)
         if isinstance(value, (dict, list)):
-            try:
-                import json
-
-                return json.dumps(value, ensure_ascii=False)
-            except Exception:
-                return str(value)
+            return _eval_value_json(value)
         return str(value)
 
     def set_captcha_options(self, options: CaptchaOptions) -> None:
@@ -743,10 +1074,16 @@ class AgentRuntime:
         self._captcha_options = options
         self._captcha_retry_count = 0
 
-    def _is_captcha_detected(self, snapshot: Snapshot) -> bool:
+    @staticmethod
+    def _snapshot_captcha(snapshot: Snapshot) -> Any:
+        return getattr(snapshot.diagnostics, "captcha", None) if snapshot.diagnostics else None
+
+    def _is_captcha_detected(self, snapshot: Snapshot, captcha: Any = None) -> bool:
+        """`captcha` may be passed when the caller already has snapshot.diagnostics.captcha."""
         if not self._captcha_options:
             return False
-        captcha = getattr(snapshot.diagnostics, "captcha", None) if snapshot.diagnostics else None
+        if captcha is None:
+            captcha = self._snapshot_captcha(snapshot)
         if not captcha or not getattr(captcha, "detected", False):
             return False
         # IMPORTANT: Many sites load CAPTCHA libraries proactively. We only want to
@@ -754,73 +1091,56 @@ class AgentRuntime:
         # If we block on low-signal detections (e.g. just a recaptcha script tag),
         # interactive runs will “do nothing” and time out.
         evidence = getattr(captcha, "evidence", None)
-        if evidence is not None:
-
-            def _list(name: str) -> list[str]:
-                try:
-                    v = getattr(evidence, name, None)
-                except Exception:
-                    v = None
-                if v is None and isinstance(evidence, dict):
-                    v = evidence.get(name)
-                if not v:
-                    return []
-                return [str(x) for x in v if x is not None]
-
-            iframe_hits = _list("iframe_src_hits")
-            url_hits = _list("url_hits")
-            text_hits = _list("text_hits")
-            selector_hits = _list("selector_hits")
-
-            # If we only saw selector/script hints, treat as non-blocking.
-            if not iframe_hits and not url_hits and not text_hits:
-                return False
-
-            # Heuristic: many sites include a passive reCAPTCHA badge (v3) that should NOT block.
-            # We only want to block when there's evidence of an interactive challenge.
-            hits_all = [*iframe_hits, *url_hits, *text_hits, *selector_hits]
-            hits_l = [str(x).lower() for x in hits_all if x]
-
-            strong_text = any(
-                k in " ".join(hits_l)
-                for k in (
-                    "i'm not a robot",
-                    "verify you are human",
-                    "human verification",
-                    "complete the security check",
-                    "please verify",
-                )
-            )
-            strong_iframe = any(
-                any(k in h for k in ("api2/bframe", "hcaptcha", "turnstile"))
-                for h in hits_l
-            )
-            strong_selector = any(
-                any(
-                    k in h
-                    for k in (
-                        "g-recaptcha-response",
-                        "h-captcha-response",
-                        "cf-turnstile-response",
-                        "recaptcha-checkbox",
-                        "hcaptcha-checkbox",
-                    )
-                )
-                for h in hits_l
-            )
-            only_generic = (
-                not strong_text
-                and not strong_iframe
-                and not strong_selector
-                and all(("captcha" in h or "recaptcha" in h) for h in hits_l)
-            )
-            if only_generic:
-                return False
+        if evidence is not None and not self._captcha_evidence_is_interactive(evidence):
+            return False
         confidence = getattr(captcha, "confidence", 0.0)
         return confidence >= self._captcha_options.min_confidence
 
-    def _build_captcha_context(self, snapshot: Snapshot, source: str) -> CaptchaContext:
-        captcha = getattr(snapshot.diagnostics, "captcha", None)
+    @staticmethod
+    def _captcha_evidence_is_interactive(evidence: Any) -> bool:
+        """
+        Whether CAPTCHA evidence points at an interactive challenge.
+
+        Hits are scanned lazily, strongest sources first, and the scan stops at
+        the first hit that decides it.
+        """
+
+        def _hits(name: str) -> Iterator[str]:
+            try:
+                v = getattr(evidence, name, None)
+            except Exception:
+                v = None
+            if v is None and isinstance(evidence, dict):
+                v = evidence.get(name)
+            if v:
+                yield from (str(x) for x in v if x is not None)
+
+        # Heuristic: many sites include a passive reCAPTCHA badge (v3) that should NOT block.
+        # Hits that only mention "captcha" (also covers "recaptcha") are kept for the final
+        # text check; anything else is evidence of an interactive challenge.
+        generic: list[str] = []
+        has_signal = False
+        for name in ("iframe_src_hits", "url_hits", "text_hits", "selector_hits"):
+            if name == "selector_hits" and not has_signal:
+                # If we only saw selector/script hints, treat as non-blocking.
+                return False
+            for hit in _hits(name):
+                has_signal = True
+                h = hit.lower()
+                if not h:
+                    continue
+                if "captcha" not in h or _CAPTCHA_STRONG_HIT_RE.search(h):
+                    return True
+                generic.append(h)
+
+        # Text needles contain spaces and may span two space-joined hits.
+        return _CAPTCHA_STRONG_TEXT_RE.search(" ".join(generic)) is not None
+
+    def _build_captcha_context(
+        self, snapshot: Snapshot, source: str, captcha: Any = None
+    ) -> CaptchaContext:
+        if captcha is None:
+            captcha = self._snapshot_captcha(snapshot)
         return CaptchaContext(
             run_id=self.tracer.run_id,
             step_index=self.step_index,
@@ -831,30 +1151,37 @@ class AgentRuntime:
         )
 
     def _create_captcha_page_control(self) -> PageControlHook:
-        async def _eval(code: str) -> Any:
-            result = await self.evaluate_js(EvaluateJsRequest(code=code))
-            if not result.ok:
-                raise RuntimeError(result.error or "evaluate_js failed")
-            return result.value
+        # One hook per runtime; it only wraps the bound evaluate method.
+        if self._captcha_page_control is None:
+            self._captcha_page_control = PageControlHook(evaluate_js=self._page_control_eval)
+        return self._captcha_page_control
 
-        return PageControlHook(evaluate_js=_eval)
+    async def _page_control_eval(self, code: str) -> Any:
+        result = await self.evaluate_js(EvaluateJsRequest(code=code))
+        if not result.ok:
+            raise RuntimeError(result.error or "evaluate_js failed")
+        return result.value
 
     def _emit_captcha_event(self, reason_code: str, details: dict[str, Any] | None = None) -> None:
+        # reason_code stays the first key; the caller's dict is left untouched.
+        event_details: dict[str, Any] = {"reason_code": reason_code}
+        if details:
+            event_details.update(details)
         payload = {
             "kind": "captcha",
             "passed": False,
             "label": reason_code,
-            "details": {"reason_code": reason_code, **(details or {})},
+            "details": event_details,
         }
         self.tracer.emit("verification", data=payload, step_id=self.step_id)
 
     async def _handle_captcha_if_needed(self, snapshot: Snapshot, source: str) -> None:
         if not self._captcha_options:
             return
-        if not self._is_captcha_detected(snapshot):
+        captcha = self._snapshot_captcha(snapshot)
+        if not self._is_captcha_detected(snapshot, captcha):
             return
 
-        captcha = getattr(snapshot.diagnostics, "captcha", None)
         self._emit_captcha_event(
             "captcha_detected",
             {"captcha": getattr(captcha, "model_dump", lambda: captcha)()},
@@ -870,7 +1197,7 @@ class AgentRuntime:
                 )
             try:
                 resolution = await self._captcha_options.handler(
-                    self._build_captcha_context(snapshot, source)
+                    self._build_captcha_context(snapshot, source, captcha)
                 )
             except Exception as exc:  # pragma: no cover - defensive
                 self._emit_captcha_event("captcha_handler_error", {"error": str(exc)})
@@ -919,9 +1246,11 @@ class AgentRuntime:
             self._emit_captcha_event("captcha_resumed")
 
     async def _wait_until_cleared(self, *, timeout_ms: int, poll_ms: int, source: str) -> None:
-        deadline = time.time() + timeout_ms / 1000.0
-        while time.time() <= deadline:
-            await asyncio.sleep(poll_ms / 1000.0)
+        deadline = time.monotonic() + timeout_ms / 1000.0
+        # Sub-5ms polls just yield to the loop; each iteration awaits a snapshot anyway.
+        poll_s = poll_ms / 1000.0 if poll_ms >= 5 else 0
+        while time.monotonic() <= deadline:
+            await asyncio.sleep(poll_s)
             snap = await self.snapshot(_skip_captcha_handling=True)
             if not self._is_captcha_detected(snap):
                 self._emit_captcha_event("captcha_cleared", {"source": source})
@@ -962,6 +1291,8 @@ class AgentRuntime:
         Record an action in the artifact timeline and capture a frame if enabled.
         """
         self._last_action = action
+        self._mutation_id += 1
+        self._signal_page_change()
         if not self._artifact_buffer:
             return
         self._artifact_buffer.record_step(
@@ -976,10 +1307,19 @@ class AgentRuntime:
     def _compute_snapshot_digest(self, snap: Snapshot | None) -> str | None:
         if snap is None:
             return None
+        # A step's pre-snapshot is usually the previous step's post-snapshot.
+        cached = self._snapshot_digest_cache
+        if cached is not None and cached[0] is snap:
+            return cached[1]
         try:
-            return "sha256:" + hashlib.sha256(f"{snap.url}{snap.timestamp}".encode()).hexdigest()
+            # Same digest as sha256(f"{url}{timestamp}"), without building the joined string.
+            h = hashlib.sha256(str(snap.url).encode())
+            h.update(str(snap.timestamp).encode())
+            digest: str | None = "sha256:" + h.hexdigest()
         except Exception:
-            return None
+            digest = None
+        self._snapshot_digest_cache = (snap, digest)
+        return digest
 
     def build_authority_action_request(
         self,
@@ -1148,16 +1488,24 @@ class AgentRuntime:
                 image_bytes = await self.backend.screenshot_png()
         except Exception:
             return
-        self._artifact_buffer.add_frame(image_bytes, fmt=fmt)
+        # Disk write happens off the event loop so high-fps capture doesn't stall it.
+        await self._artifact_buffer.add_frame_async(image_bytes, fmt=fmt)
 
     async def _artifact_timer_loop(self) -> None:
         if not self._artifact_buffer:
             return
         interval = 1.0 / max(0.001, self._artifact_buffer.options.fps)
+        # Fixed cadence: capture time is absorbed into the interval instead of added to it.
+        # A capture that overruns its slot restarts the schedule rather than bursting.
+        next_at = time.monotonic()
         try:
             while True:
                 await self._capture_artifact_frame()
-                await asyncio.sleep(interval)
+                next_at += interval
+                now = time.monotonic()
+                if next_at < now:
+                    next_at = now
+                await asyncio.sleep(next_at - now)
         except asyncio.CancelledError:
             return
 
@@ -1299,6 +1647,42 @@ class AgentRuntime:
             self._persist_failure_artifacts(reason=f"assert_failed:{label}")
         return outcome.passed
 
+    def assert_many(
+        self,
+        items: list[tuple[Predicate, str]],
+        required: bool = False,
+    ) -> bool:
+        """
+        Evaluate several assertions against the same snapshot state in one pass.
+
+        Equivalent to calling assert_() for each (predicate, label) pair, but the
+        assertion context is built once and selector matches are shared across
+        predicates, so each distinct selector scans the snapshot only once.
+
+        Args:
+            items: (predicate, label) pairs, evaluated and recorded in order
+            required: If True, every assertion in the batch gates step success
+
+        Returns:
+            True if all assertions passed, False otherwise
+        """
+        ctx = self._ctx()
+        failed: list[str] = []
+        for predicate, label in items:
+            outcome = predicate(ctx)
+            self._record_outcome(
+                outcome=outcome,
+                label=label,
+                required=required,
+                kind="assert",
+                record_in_step=True,
+            )
+            if not outcome.passed:
+                failed.append(label)
+        if required and failed:
+            self._persist_failure_artifacts(reason=f"assert_failed:{','.join(failed)}")
+        return not failed
+
     def check(self, predicate: Predicate, label: str, required: bool = False) -> AssertionHandle:
         """
         Create an AssertionHandle for fluent `.once()` / `.eventually()` usage.
@@ -1365,7 +1749,12 @@ class AgentRuntime:
         details = dict(outcome.details or {})
 
         # Failure intelligence: nearest matches for selector-driven assertions
-        if not outcome.passed and self.last_snapshot is not None and "selector" in details:
+        if (
+            not outcome.passed
+            and self.last_snapshot is not None
+            and "selector" in details
+            and getattr(self.tracer, "include_nearest_matches", True)
+        ):
             selector = str(details.get("selector") or "")
             details.setdefault("nearest_matches", self._nearest_matches(selector, limit=3))
 
@@ -1395,25 +1784,65 @@ class AgentRuntime:
     def _nearest_matches(self, selector: str, *, limit: int = 3) -> list[dict[str, Any]]:
         """
         Best-effort nearest match suggestions for debugging failed selector assertions.
+
+        Results are memoized per snapshot, so an eventually() loop failing against the
+        same snapshot computes them once; element labels are extracted once per snapshot
+        and shared across selectors.
         """
-        if self.last_snapshot is None:
+        snap = self.last_snapshot
+        if snap is None:
             return []
 
         s = selector.lower().strip()
-        if not s:
+        if not s or limit <= 0:
             return []
 
-        scored: list[tuple[float, Any]] = []
-        for el in self.last_snapshot.elements:
+        cache = self._nearest_matches_cache
+        if cache is None or cache[0] is not snap:
+            cache = self._nearest_matches_cache = (snap, self._nearest_match_candidates(snap), {})
+        _, candidates, memo = cache
+        key = (s, limit)
+        if key not in memo:
+            memo[key] = self._compute_nearest_matches(candidates, s, limit)
+        return [dict(m) for m in memo[key]]
+
+    @staticmethod
+    def _nearest_match_candidates(snap: Snapshot) -> list[tuple[str, Any]]:
+        """(lowercased name-or-text, element) for every element with a non-empty label."""
+        out: list[tuple[str, Any]] = []
+        for el in snap.elements:
             hay = (getattr(el, "name", None) or getattr(el, "text", None) or "").strip()
-            if not hay:
+            if hay:
+                out.append((hay.lower(), el))
+        return out
+
+    @staticmethod
+    def _compute_nearest_matches(
+        candidates: list[tuple[str, Any]], s: str, limit: int
+    ) -> list[dict[str, Any]]:
+        import difflib  # only needed on the assertion-failure path
+
+        scored: list[tuple[float, Any]] = []
+        top: list[float] = []  # min-heap of the best `limit` scores so far
+        matcher = difflib.SequenceMatcher(None, s)
+        for hay, el in candidates:
+            matcher.set_seq2(hay)
+            # ratio() <= quick_ratio() <= real_quick_ratio(): skip elements whose upper
+            # bound cannot reach the current top `limit`.
+            if len(top) >= limit and (
+                matcher.real_quick_ratio() < top[0] or matcher.quick_ratio() < top[0]
+            ):
                 continue
-            score = difflib.SequenceMatcher(None, s, hay.lower()).ratio()
+            score = matcher.ratio()
             scored.append((score, el))
+            if len(top) < limit:
+                heapq.heappush(top, score)
+            elif score > top[0]:
+                heapq.heapreplace(top, score)
 
-        scored.sort(key=lambda t: t[0], reverse=True)
         out: list[dict[str, Any]] = []
-        for score, el in scored[:limit]:
+        # Same order as a stable descending sort truncated to `limit`.
+        for score, el in heapq.nlargest(limit, scored, key=lambda t: t[0]):
             out.append(
                 {
                     "id": getattr(el, "id", None),
@@ -1462,12 +1891,81 @@ class AgentRuntime:
 
     def all_assertions_passed(self) -> bool:
         """Return True if all assertions in current step passed (or none)."""
-        return all(a["passed"] for a in self._assertions_this_step)
+        return all(map(_PASSED, self._assertions_this_step))
 
     def required_assertions_passed(self) -> bool:
         """Return True if all required assertions in current step passed (or none)."""
-        required = [a for a in self._assertions_this_step if a.get("required")]
-        return all(a["passed"] for a in required)
+        return all(a["passed"] for a in self._assertions_this_step if a.get("required"))
+
+
+def _opt_int(v: Any) -> int | None:
+    try:
+        return int(v) if v is not None else None
+    except Exception:
+        return None
+
+
+def _clamp_snapshot_limit(n: int) -> int:
+    # SnapshotOptions.limit Field constraints.
+    return min(500, max(1, n))
+
+
+@dataclass(frozen=True)
+class _SnapshotLimitGrowth:
+    """
+    Parsed `snapshot_limit_growth` schedule for AssertionHandle.eventually().
+
+    limit(attempt) = min(max_limit, start_limit + step*(attempt-1)), clamped to 1..500.
+    """
+
+    apply_on: str
+    start: int
+    step: int
+    max_limit: int
+
+    @classmethod
+    def parse(
+        cls,
+        growth: Any,
+        *,
+        snapshot_kwargs: dict[str, Any] | None,
+        default_limit: Any,
+    ) -> _SnapshotLimitGrowth | None:
+        if not growth:
+            return None
+        apply_on = "only_on_fail"
+        start = step = max_limit = None
+        if isinstance(growth, dict):
+            try:
+                apply_on = str(growth.get("apply_on") or "only_on_fail")
+            except Exception:
+                apply_on = "only_on_fail"
+            start = _opt_int(growth.get("start_limit"))
+            step = _opt_int(growth.get("step"))
+            max_limit = _opt_int(growth.get("max_limit"))
+
+        # Resolve defaults from snapshot_kwargs, then the runtime's SnapshotOptions.
+        if start is None and snapshot_kwargs:
+            start = _opt_int(snapshot_kwargs.get("limit"))
+        if start is None:
+            start = _opt_int(default_limit)
+        if start is None:
+            start = 50  # SnapshotOptions default
+
+        return cls(
+            apply_on=apply_on,
+            start=start,
+            step=step if step is not None else max(1, start),
+            max_limit=max_limit if max_limit is not None else 500,
+        )
+
+    @property
+    def fixed_limit(self) -> int:
+        return _clamp_snapshot_limit(self.start or 50)
+
+    def limit_for_attempt(self, attempt: int) -> int:
+        base = self.start + self.step * max(0, attempt - 1)
+        return _clamp_snapshot_limit(min(self.max_limit, base))
 
 
 @dataclass
@@ -1493,14 +1991,20 @@ class AssertionHandle:
         vision_provider: Any | None = None,
         vision_system_prompt: str | None = None,
         vision_user_prompt: str | None = None,
+        reuse_snapshot: bool = False,
     ) -> bool:
         """
         Retry until the predicate passes or timeout is reached.
 
         Intermediate attempts emit verification events but do NOT accumulate in step_end assertions.
         Final result is accumulated once.
+
+        With `reuse_snapshot=True` the first attempt may use the runtime's last snapshot when
+        no navigation or recorded action happened since it was taken. Only opt in when every
+        page action goes through record_action() (or invalidate_snapshot_cache()).
         """
-        deadline = time.monotonic() + timeout_s
+        deadline_ns = time.monotonic_ns() + int(timeout_s * 1e9)
+        poll_ns = int(poll_s * 1e9)
         attempt = 0
         snapshot_attempt = 0
         last_outcome = None
@@ -1519,89 +2023,48 @@ class AssertionHandle:
         # - If both snapshot_kwargs["limit"] and snapshot_limit_growth are provided,
         #   snapshot_limit_growth controls the per-attempt limit (callers can set
         #   start_limit explicitly if desired).
-        growth = snapshot_limit_growth or None
-        growth_apply_on = "only_on_fail"
-        growth_start: int | None = None
-        growth_step: int | None = None
-        growth_max: int | None = None
-        if isinstance(growth, dict) and growth:
-            try:
-                growth_apply_on = str(growth.get("apply_on") or "only_on_fail")
-            except Exception:
-                growth_apply_on = "only_on_fail"
-            try:
-                v = growth.get("start_limit", None)
-                growth_start = int(v) if v is not None else None
-            except Exception:
-                growth_start = None
-            try:
-                v = growth.get("step", None)
-                growth_step = int(v) if v is not None else None
-            except Exception:
-                growth_step = None
-            try:
-                v = growth.get("max_limit", None)
-                growth_max = int(v) if v is not None else None
-            except Exception:
-                growth_max = None
+        growth = _SnapshotLimitGrowth.parse(
+            snapshot_limit_growth,
+            snapshot_kwargs=snapshot_kwargs,
+            default_limit=getattr(getattr(self.runtime, "_snapshot_options", None), "limit", None),
+        )
 
-        # Resolve defaults from runtime + snapshot_kwargs.
-        if growth and growth_start is None:
+        # Built once: snapshot() receives it unpacked, and only "limit" changes per attempt.
+        per_attempt_kwargs = dict(snapshot_kwargs or {})
+        fixed_snapshot_limit: int | None = None
+        if growth is None:
             try:
-                if snapshot_kwargs and snapshot_kwargs.get("limit") is not None:
-                    growth_start = int(snapshot_kwargs["limit"])
+                if per_attempt_kwargs.get("limit") is not None:
+                    fixed_snapshot_limit = int(per_attempt_kwargs["limit"])
             except Exception:
-                growth_start = None
-        if growth and growth_start is None:
-            try:
-                growth_start = int(getattr(self.runtime, "_snapshot_options", None).limit)  # type: ignore[attr-defined]
-            except Exception:
-                growth_start = None
-        if growth and growth_start is None:
-            growth_start = 50  # SnapshotOptions default
-
-        if growth and growth_step is None:
-            growth_step = max(1, int(growth_start))
-        if growth and growth_max is None:
-            growth_max = 500
-
-        def _clamp_limit(n: int) -> int:
-            if n < 1:
-                return 1
-            if n > 500:
-                return 500
-            return n
-
-        def _limit_for_attempt(attempt_idx_1based: int) -> int:
-            assert growth_start is not None and growth_step is not None and growth_max is not None
-            base = int(growth_start) + int(growth_step) * max(0, int(attempt_idx_1based) - 1)
-            return _clamp_limit(min(int(growth_max), base))
+                fixed_snapshot_limit = None
 
         while True:
             attempt += 1
+            # Attempts start every poll_s; time spent snapshotting counts toward the wait.
+            next_attempt_ns = time.monotonic_ns() + poll_ns
+            page_generation = self.runtime._page_generation()
 
-            per_attempt_kwargs = dict(snapshot_kwargs or {})
-            snapshot_limit: int | None = None
-            if growth:
+            snapshot_limit: int | None = fixed_snapshot_limit
+            if growth is not None:
                 # Only grow if requested; otherwise fixed start_limit.
-                apply = growth_apply_on == "all"
-                if growth_apply_on == "only_on_fail":
+                apply = growth.apply_on == "all"
+                if growth.apply_on == "only_on_fail":
                     # attempt==1 always uses the start_limit; attempt>1 grows (since we'd have
                     # returned already if the previous attempt passed).
                     apply = attempt == 1 or (last_outcome is not None and not bool(last_outcome.passed))
-                if apply:
-                    snapshot_limit = _limit_for_attempt(attempt)
-                else:
-                    snapshot_limit = _clamp_limit(int(growth_start or 50))
+                snapshot_limit = growth.limit_for_attempt(attempt) if apply else growth.fixed_limit
                 per_attempt_kwargs["limit"] = snapshot_limit
-            else:
-                try:
-                    if per_attempt_kwargs.get("limit") is not None:
-                        snapshot_limit = int(per_attempt_kwargs["limit"])
-                except Exception:
-                    snapshot_limit = None
 
-            await self.runtime.snapshot(**per_attempt_kwargs)
+            # With reuse_snapshot, the first attempt may reuse the runtime's last snapshot when
+            # the page is known unchanged (no navigation / recorded action since), e.g.
+            # back-to-back verifications after one action. Retries always take a fresh snapshot.
+            if (
+                not reuse_snapshot
+                or attempt > 1
+                or self.runtime._reusable_snapshot(**per_attempt_kwargs) is None
+            ):
+                await self.runtime.snapshot(**per_attempt_kwargs)
             snapshot_attempt += 1
 
             # Optional: gate predicate evaluation on snapshot confidence.
@@ -1658,10 +2121,7 @@ class AssertionHandle:
                         and getattr(vision_provider, "supports_vision", lambda: False)()
                     ):
                         try:
-                            import base64
-
                             png_bytes = await self.runtime.backend.screenshot_png()
-                            image_b64 = base64.b64encode(png_bytes).decode("utf-8")
 
                             sys_prompt = vision_system_prompt or (
                                 "You are a strict visual verifier. Answer only YES or NO."
@@ -1670,13 +2130,33 @@ class AssertionHandle:
                                 f"Given the screenshot, is the following condition satisfied?\n\n{self.label}\n\nAnswer YES or NO."
                             )
 
-                            resp = vision_provider.generate_with_image(
+                            # An unchanged screenshot asked the same question reuses the answer.
+                            verdicts = self.runtime._vision_verdict_cache
+                            verdict_key = (
+                                id(vision_provider),
+                                hashlib.sha256(png_bytes).digest(),
                                 sys_prompt,
                                 user_prompt,
-                                image_base64=image_b64,
-                                temperature=0.0,
                             )
-                            text = (resp.content or "").strip().lower()
+                            cached = verdicts.get(verdict_key)
+                            if cached is not None:
+                                verdicts.move_to_end(verdict_key)
+                                vision_response = cached[1]
+                            else:
+                                image_b64 = binascii.b2a_base64(png_bytes, newline=False).decode(
+                                    "ascii"
+                                )
+                                resp = vision_provider.generate_with_image(
+                                    sys_prompt,
+                                    user_prompt,
+                                    image_base64=image_b64,
+                                    temperature=0.0,
+                                )
+                                vision_response = resp.content
+                                verdicts[verdict_key] = (vision_provider, vision_response)
+                                if len(verdicts) > _VISION_VERDICT_CACHE_SIZE:
+                                    verdicts.popitem(last=False)
+                            text = (vision_response or "").strip().lower()
                             passed = text.startswith("yes")
 
                             final_outcome = AssertOutcome(
@@ -1686,7 +2166,7 @@ class AssertionHandle:
                                     "reason_code": (
                                         "vision_fallback_pass" if passed else "vision_fallback_fail"
                                     ),
-                                    "vision_response": resp.content,
+                                    "vision_response": vision_response,
                                     "min_confidence": min_confidence,
                                     "snapshot_attempts": snapshot_attempt,
                                 },
@@ -1745,7 +2225,7 @@ class AssertionHandle:
                         )
                     return False
 
-                if time.monotonic() >= deadline:
+                if time.monotonic_ns() >= deadline_ns:
                     self.runtime._record_outcome(
                         outcome=last_outcome,
                         label=self.label,
@@ -1767,7 +2247,10 @@ class AssertionHandle:
                         )
                     return False
 
-                await asyncio.sleep(poll_s)
+                wake_ns = min(next_attempt_ns, deadline_ns)
+                await self.runtime._wait_for_page_change(
+                    (wake_ns - time.monotonic_ns()) / 1e9, since=page_generation
+                )
                 continue
 
             last_outcome = self.predicate(self.runtime._ctx())
@@ -1799,7 +2282,7 @@ class AssertionHandle:
                 )
                 return True
 
-            if time.monotonic() >= deadline:
+            if time.monotonic_ns() >= deadline_ns:
                 # Record final failure once
                 self.runtime._record_outcome(
                     outcome=last_outcome,
@@ -1815,4 +2298,7 @@ class AssertionHandle:
                     )
                 return False
 
-            await asyncio.sleep(poll_s)
+            wake_ns = min(next_attempt_ns, deadline_ns)
+            await self.runtime._wait_for_page_change(
+                (wake_ns - time.monotonic_ns()) / 1e9, since=page_generation
+            )
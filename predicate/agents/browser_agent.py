@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import importlib
 from collections import deque
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field, replace
 from typing import Any, Literal
 
 from ..agent_runtime import AgentRuntime
@@ -96,11 +96,67 @@ class PredicateBrowserAgentConfig:
     # Optional last-mile truncation of dom_context to control tokens
     compact_prompt_postprocessor: Callable[[str], str] | None = None
 
+    # Batched action proposal: `run()` proposes actions for up to `batch_size` consecutive
+    # steps with a single LLM call (1 = one call per step). Execution and verification
+    # stay per-step; only the proposal is amortized. A batched action for a later step is
+    # dropped (and the step re-proposed) if its target element changed since the batch.
+    batch_size: int = 1
 
-def _history_summary(items: list[str]) -> str:
-    if not items:
-        return ""
-    return "\n".join(f"- {s}" for s in items if s)
+    # Batched prompt customization
+    # Signature: builder(task_goal, steps, dom_context, snapshot, history_summary) -> (system, user)
+    batch_prompt_builder: Callable[
+        [str, list[RuntimeStep], str, Snapshot, str], tuple[str, str]
+    ] | None = None
+
+
+def _history_summary(lines: Sequence[str]) -> str:
+    # Lines are rendered once, when _record_step_history() appends them.
+    return "\n".join(lines)
+
+
+# Static so every batched call sends a byte-identical system prefix (provider prompt caching).
+_BATCH_SYSTEM_PROMPT = (
+    "You are a web automation executor.\n"
+    "You will be given several numbered step goals for the same page.\n"
+    'Return one line per index as "[i] ACTION", where ACTION is ONLY ONE of:\n'
+    "- CLICK(id)\n"
+    '- TYPE(id, "text")\n'
+    "- PRESS('key')\n"
+    "- FINISH()\n"
+    "No prose."
+)
+
+
+def default_batch_prompt_builder(
+    task_goal: str,
+    steps: list[RuntimeStep],
+    dom_context: str,
+    snap: Snapshot,
+    history_summary: str,
+) -> tuple[str, str]:
+    """
+    Default prompt for batched action proposal (`PredicateBrowserAgentConfig.batch_size > 1`).
+
+    Step goals are numbered `[1]..[n]` and the model is asked for one `[i] ACTION` line each,
+    matching what `LLMProvider.generate_batch()` splits on.
+    """
+    _ = snap
+    step_lines = "\n".join(f"[{i}] STEP GOAL: {s.goal}" for i, s in enumerate(steps, start=1))
+    parts = ["TASK GOAL:\n", task_goal, "\n\n"]
+    if history_summary:
+        parts += ("RECENT STEPS:\n", history_summary, "\n\n")
+    parts += (step_lines, "\n\nDOM CONTEXT:\n", dom_context, "\n")
+    return _BATCH_SYSTEM_PROMPT, "".join(parts)
+
+
+def _element_signature(snap: Snapshot, element_id: int) -> tuple[str, str | None] | None:
+    for el in snap.elements:
+        if el.id == element_id:
+            return el.role, el.text
+    return None
+
+
+_CAPTCHA_POLICIES = frozenset({"abort", "callback"})
 
 
 def apply_captcha_config_to_runtime(
@@ -117,11 +173,14 @@ def apply_captcha_config_to_runtime(
     - callback: invoke handler and wait/retry per resolution
     """
 
-    policy = (captcha.policy or "abort").strip().lower()
-    if policy not in {"abort", "callback"}:
-        raise ValueError("captcha.policy must be 'abort' or 'callback'")
+    normalized: str = captcha.policy
+    if normalized not in _CAPTCHA_POLICIES:
+        # Normalize only when the value is not already canonical.
+        normalized = (normalized or "abort").strip().lower()
+        if normalized not in _CAPTCHA_POLICIES:
+            raise ValueError("captcha.policy must be 'abort' or 'callback'")
 
-    if policy == "abort":
+    if normalized == "abort":
         runtime.set_captcha_options(
             CaptchaOptions(policy="abort", min_confidence=float(captcha.min_confidence))
         )
@@ -234,6 +293,18 @@ class _TokenAccountingProvider(LLMProvider):
             pass
         return resp
 
+    def generate_batch(
+        self, system_prompt: str, user_prompt: str, n: int, **kwargs
+    ) -> list[LLMResponse]:
+        resps = self._inner.generate_batch(system_prompt, user_prompt, n, **kwargs)
+        try:
+            # One LLM call: its usage is reported on the first entry.
+            if resps:
+                self._collector.record(role=self._role, resp=resps[0])
+        except Exception:
+            pass
+        return resps
+
     def supports_json_mode(self) -> bool:
         return self._inner.supports_json_mode()
 
@@ -266,6 +337,9 @@ class _RuntimeAgentWithPromptOverrides(RuntimeAgent):
         compact_prompt_builder: PredicateBrowserAgentConfig["compact_prompt_builder"],
         compact_prompt_postprocessor: PredicateBrowserAgentConfig["compact_prompt_postprocessor"],
         history_summary_provider: Callable[[], str],
+        batch_prompt_builder: (
+            Callable[[str, list[RuntimeStep], str, Snapshot, str], tuple[str, str]] | None
+        ) = None,
     ) -> None:
         super().__init__(
             runtime=runtime,
@@ -277,13 +351,109 @@ class _RuntimeAgentWithPromptOverrides(RuntimeAgent):
         self._compact_prompt_builder = compact_prompt_builder
         self._compact_prompt_postprocessor = compact_prompt_postprocessor
         self._history_summary_provider = history_summary_provider
+        self._batch_prompt_builder = batch_prompt_builder or default_batch_prompt_builder
+        # Batched proposal (see PredicateBrowserAgent.run): the chunk whose first step makes
+        # the batched call, then the actions it proposed for the remaining steps, together
+        # with the snapshot and page generation they were proposed against.
+        self._batch_steps: list[RuntimeStep] | None = None
+        self._prefetched: list[tuple[RuntimeStep, str | None]] = []
+        self._prefetch_snap: Snapshot | None = None
+        self._prefetch_generation: tuple[int, int] | None = None
+
+    def begin_batch(self, steps: list[RuntimeStep]) -> None:
+        """Propose actions for `steps` with one LLM call when the first of them runs."""
+        self._batch_steps = list(steps)
+        self._prefetched = []
+        self._prefetch_snap = None
+
+    def end_batch(self) -> None:
+        self._batch_steps = None
+        self._prefetched = []
+        self._prefetch_snap = None
+
+    def _build_dom_context(self, snap: Snapshot, goal: str) -> str:
+        dom_context = self._structured_llm.build_context(snap, goal)
+        if self._compact_prompt_postprocessor is not None:
+            dom_context = self._compact_prompt_postprocessor(dom_context)
+        return dom_context
+
+    def _propose_batch(
+        self, *, task_goal: str, steps: list[RuntimeStep], snap: Snapshot
+    ) -> str | None:
+        """
+        Propose one action per step of `steps` with a single LLM call, using the first
+        step's snapshot. Returns the first step's action and keeps the rest for later steps.
+
+        Entries the model did not answer are None; those steps fall back to the regular
+        per-step proposal.
+        """
+        dom_context = self._build_dom_context(snap, steps[0].goal)
+        system_prompt, user_prompt = self._batch_prompt_builder(
+            task_goal,
+            list(steps),
+            dom_context,
+            snap,
+            self._history_summary_provider() or "",
+        )
+        responses = self.executor.generate_batch(
+            system_prompt, user_prompt, len(steps), temperature=0.0
+        )
+        actions: list[str | None] = []
+        for resp in responses[: len(steps)]:
+            content = (resp.content or "").strip()
+            actions.append(self._structured_llm.extract_action(content) if content else None)
+        actions.extend([None] * (len(steps) - len(actions)))
+
+        self._prefetched = list(zip(steps[1:], actions[1:]))
+        self._prefetch_snap = snap
+        self._prefetch_generation = self.runtime._page_generation()
+        return actions[0]
+
+    def _take_prefetched(self, *, step: RuntimeStep, snap: Snapshot) -> str | None:
+        """
+        Pop the batched action for `step` if it still applies to the fresh `snap`.
+
+        Earlier steps' actions change the page, so an element-targeted action is kept only
+        if its element id is still present in `snap` with the same role and text it had in
+        the batch snapshot. Coordinate actions are kept only if the page is unchanged.
+        """
+        for i, (pending, action) in enumerate(self._prefetched):
+            if pending is step:
+                del self._prefetched[i]
+                break
+        else:
+            return None
+        if action is None or self._prefetch_snap is None:
+            return None
+        try:
+            kind, payload = self._parse_action(action)
+        except ValueError:
+            return None
+        if kind in ("press", "finish"):
+            return action
+        if kind in ("click", "type"):
+            before = _element_signature(self._prefetch_snap, payload["id"])
+            if before is not None and before == _element_signature(snap, payload["id"]):
+                return action
+            return None
+        if self._prefetch_generation == self.runtime._page_generation():
+            return action
+        return None
 
     def _propose_structured_action(
         self, *, task_goal: str, step: RuntimeStep, snap: Snapshot
     ) -> str:
-        dom_context = self._structured_llm.build_context(snap, step.goal)
-        if self._compact_prompt_postprocessor is not None:
-            dom_context = self._compact_prompt_postprocessor(dom_context)
+        batch = self._batch_steps
+        if batch is not None and len(batch) > 1 and step is batch[0]:
+            action = self._propose_batch(task_goal=task_goal, steps=batch, snap=snap)
+            if action is not None:
+                return action
+        else:
+            action = self._take_prefetched(step=step, snap=snap)
+            if action is not None:
+                return action
+
+        dom_context = self._build_dom_context(snap, step.goal)
 
         history_summary = self._history_summary_provider() or ""
 
@@ -364,12 +534,24 @@ class PredicateBrowserAgent:
             self.vision_executor = vision_executor
             self.vision_verifier = vision_verifier
         self.config = config
+        # Provider capabilities are fixed per instance; probe once instead of every step.
+        self._vision_executor_supports_vision = bool(
+            self.vision_executor is not None
+            and getattr(self.vision_executor, "supports_vision", lambda: False)()
+        )
 
-        # LLM-facing step history summaries (bounded)
-        self._history: deque[str] = deque(maxlen=max(0, int(config.history_last_n)))
+        # LLM-facing step history lines, e.g. "- Open cart -> ok" (bounded).
+        # None when history is disabled (history_last_n <= 0).
+        history_last_n = int(config.history_last_n)
+        self._history: deque[str] | None = (
+            deque(maxlen=history_last_n) if history_last_n > 0 else None
+        )
+        # Rendered history block; rebuilt only after a new step is recorded.
+        self._history_summary_cache: str | None = None
 
-        # Vision budgeting
+        # Vision budgeting (0 = no run-level cap)
         self._vision_calls_used = 0
+        self._max_vision_calls = int(config.vision.max_vision_calls) if config.vision.enabled else 0
 
         # Apply CAPTCHA settings immediately (if enabled by config)
         if self.config.captcha is not None:
@@ -383,6 +565,7 @@ class PredicateBrowserAgent:
             compact_prompt_builder=self.config.compact_prompt_builder,
             compact_prompt_postprocessor=self.config.compact_prompt_postprocessor,
             history_summary_provider=self._get_history_summary,
+            batch_prompt_builder=self.config.batch_prompt_builder,
         )
 
     def get_token_usage(self) -> dict[str, Any]:
@@ -403,14 +586,17 @@ class PredicateBrowserAgent:
         self._token_usage.reset()
 
     def _get_history_summary(self) -> str:
-        if int(self.config.history_last_n) <= 0:
+        if self._history is None:
             return ""
-        return _history_summary(list(self._history))
+        if self._history_summary_cache is None:
+            self._history_summary_cache = _history_summary(self._history)
+        return self._history_summary_cache
 
     def _record_step_history(self, *, step_goal: str, ok: bool) -> None:
-        if int(self.config.history_last_n) <= 0:
+        if self._history is None:
             return
-        self._history.append(f"{step_goal} -> {'ok' if ok else 'fail'}")
+        self._history.append(f"- {step_goal} -> {'ok' if ok else 'fail'}")
+        self._history_summary_cache = None
 
     async def step(
         self,
@@ -422,21 +608,10 @@ class PredicateBrowserAgent:
     ) -> StepOutcome:
         # Enforce run-level max vision calls (coarse budget).
         used_vision = False
-        if (
-            self.config.vision.enabled
-            and int(self.config.vision.max_vision_calls) > 0
-            and self._vision_calls_used >= int(self.config.vision.max_vision_calls)
-        ):
-            step = RuntimeStep(
-                goal=step.goal,
-                intent=step.intent,
+        if self._max_vision_calls > 0 and self._vision_calls_used >= self._max_vision_calls:
+            step = replace(
+                step,
                 verifications=list(step.verifications),
-                snapshot_limit_base=step.snapshot_limit_base,
-                snapshot_limit_step=step.snapshot_limit_step,
-                snapshot_limit_max=step.snapshot_limit_max,
-                max_snapshot_attempts=step.max_snapshot_attempts,
-                min_confidence=step.min_confidence,
-                min_actionables=step.min_actionables,
                 vision_executor_enabled=False,
                 max_vision_executor_attempts=0,
             )
@@ -448,22 +623,17 @@ class PredicateBrowserAgent:
             on_step_end=on_step_end,
         )
 
-        # Best-effort: detect vision usage by comparing executor call count. If vision executor exists
-        # and it was called, we count it. RuntimeAgent doesn't expose a structured outcome today.
-        if self.vision_executor is not None and getattr(self.vision_executor, "supports_vision", lambda: False)():
-            # If vision path was used, the vision executor provider would have been called.
-            # We can't reliably introspect, so we treat it as "possibly used" based on verification fail patterns later.
-            # For now, increment budget only when we know vision was enabled and structured attempt failed.
-            pass
-
         # Conservative: increment vision budget if step had vision enabled and structured verification failed once.
         # This is a heuristic until RuntimeAgent exposes a structured outcome.
-        if bool(getattr(step, "vision_executor_enabled", False)) and not bool(ok):
-            # If vision is enabled and we still failed, we likely spent vision if it was available.
-            # (If it wasn't available, this doesn't matter for budgeting because we only *cap* usage.)
-            used_vision = bool(self.vision_executor and self.vision_executor.supports_vision())
-            if used_vision:
-                self._vision_calls_used += 1
+        # Agents without a vision-capable executor skip the check entirely.
+        if (
+            self._vision_executor_supports_vision
+            and bool(getattr(step, "vision_executor_enabled", False))
+            and not bool(ok)
+        ):
+            # If vision is enabled and we still failed, we likely spent vision.
+            used_vision = True
+            self._vision_calls_used += 1
 
         self._record_step_history(step_goal=step.goal, ok=bool(ok))
         return StepOutcome(step_goal=step.goal, ok=bool(ok), used_vision=used_vision)
@@ -477,14 +647,32 @@ class PredicateBrowserAgent:
         on_step_end: Callable[[StepHookContext], Any] | None = None,
         stop_on_failure: bool = True,
     ) -> bool:
-        for step in steps:
-            out = await self.step(
-                task_goal=task_goal,
-                step=step,
-                on_step_start=on_step_start,
-                on_step_end=on_step_end,
-            )
-            if stop_on_failure and not out.ok:
-                return False
+        batch_size = max(1, int(self.config.batch_size))
+        if batch_size <= 1:
+            for step in steps:
+                out = await self.step(
+                    task_goal=task_goal,
+                    step=step,
+                    on_step_start=on_step_start,
+                    on_step_end=on_step_end,
+                )
+                if stop_on_failure and not out.ok:
+                    return False
+            return True
+
+        for start in range(0, len(steps), batch_size):
+            chunk = steps[start : start + batch_size]
+            self._runner.begin_batch(chunk)
+            try:
+                for step in chunk:
+                    out = await self.step(
+                        task_goal=task_goal,
+                        step=step,
+                        on_step_start=on_step_start,
+                        on_step_end=on_step_end,
+                    )
+                    if stop_on_failure and not out.ok:
+                        return False
+            finally:
+                self._runner.end_batch()
         return True
-
@@ -53,7 +53,7 @@ from predicate.query import find, query
 
 # ========== Phase 2B: Supporting Utilities ==========
 # Re-export async read functions from read.py
-from predicate.read import read_async, read_best_effort_async
+from predicate.read import read_async, read_best_effort_async, read_formats_async
 
 # ========== Phase 2D: Developer Tools ==========
 # Re-export async recorder and inspector from their modules
@@ -91,6 +91,7 @@ __all__ = [
     # Phase 2B: Supporting Utilities
     "read_async",  # Re-exported from read.py
     "read_best_effort_async",  # Re-exported from read.py
+    "read_formats_async",  # Re-exported from read.py
     "show_overlay_async",  # Re-exported from overlay.py
     "clear_overlay_async",  # Re-exported from overlay.py
     "expect_async",  # Re-exported from expect.py
@@ -112,24 +112,25 @@ class PlaywrightBackend:
 
     async def list_tabs(self) -> list[TabInfo]:
         self._prune_tabs()
-        context = self._page.context
-        tabs: list[TabInfo] = []
-        for page in context.pages:
-            tab_id = self._ensure_tab_id(page)
-            title = None
-            try:
-                title = await page.title()
-            except Exception:  # pylint: disable=broad-exception-caught
-                title = None
-            tabs.append(
-                TabInfo(
-                    tab_id=tab_id,
-                    url=getattr(page, "url", None),
-                    title=title,
-                    is_active=page == self._page,
-                )
+        pages = list(self._page.context.pages)
+        # One title() round-trip per tab; issue them concurrently rather than in turn.
+        titles = await asyncio.gather(*(self._page_title(page) for page in pages))
+        return [
+            TabInfo(
+                tab_id=self._ensure_tab_id(page),
+                url=getattr(page, "url", None),
+                title=title,
+                is_active=page == self._page,
             )
-        return tabs
+            for page, title in zip(pages, titles)
+        ]
+
+    @staticmethod
+    async def _page_title(page: "AsyncPage") -> str | None:
+        try:
+            return await page.title()
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
 
     async def open_tab(self, url: str) -> TabInfo:
         self._prune_tabs()
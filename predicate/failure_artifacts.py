@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import gzip
 import json
 import logging
@@ -335,12 +336,28 @@ class FailureArtifactBuffer:
         )
 
     def add_frame(self, image_bytes: bytes, *, fmt: str = "png") -> None:
+        ts, file_name, path = self._next_frame_path(fmt)
+        path.write_bytes(image_bytes)
+        self._record_frame(ts, file_name, path)
+
+    async def add_frame_async(self, image_bytes: bytes, *, fmt: str = "png") -> None:
+        """
+        Like add_frame(), but writes the image in a worker thread.
+
+        The frame list is only updated back on the event loop, once the file exists.
+        """
+        ts, file_name, path = self._next_frame_path(fmt)
+        await asyncio.to_thread(path.write_bytes, image_bytes)
+        self._record_frame(ts, file_name, path)
+
+    def _next_frame_path(self, fmt: str) -> tuple[float, str, Path]:
         ts = self._time_fn()
         file_name = f"frame_{int(ts * 1000)}.{fmt}"
-        path = self._frames_dir / file_name
         if not self._frames_dir.exists():
             self._frames_dir.mkdir(parents=True, exist_ok=True)
-        path.write_bytes(image_bytes)
+        return ts, file_name, self._frames_dir / file_name
+
+    def _record_frame(self, ts: float, file_name: str, path: Path) -> None:
         self._frames.append(_FrameRecord(ts=ts, file_name=file_name, path=path))
         self._prune()
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Mapping, Sequence
 
 # pylint: disable=import-error
@@ -29,24 +30,20 @@ class AuthorityActionInput:
 
 
 def to_verification_evidence(assertions: Sequence[Mapping[str, Any]]) -> VerificationEvidence:
-    signals: list[VerificationSignal] = []
-    for assertion in assertions:
-        label = str(assertion.get("label", "")).strip()
-        if label == "":
-            continue
-        passed = bool(assertion.get("passed", False))
-        required = bool(assertion.get("required", False))
-        reason_raw = assertion.get("reason")
-        reason = str(reason_raw) if isinstance(reason_raw, str) and reason_raw != "" else None
-        signals.append(
-            VerificationSignal(
-                label=label,
-                status=VerificationStatus.PASSED if passed else VerificationStatus.FAILED,
-                required=required,
-                reason=reason,
-            )
+    passed_status, failed_status = VerificationStatus.PASSED, VerificationStatus.FAILED
+    signals = tuple(
+        VerificationSignal(
+            label=label,
+            status=passed_status if assertion.get("passed", False) else failed_status,
+            required=bool(assertion.get("required", False)),
+            reason=(
+                reason if isinstance(reason := assertion.get("reason"), str) and reason else None
+            ),
         )
-    return VerificationEvidence(signals=tuple(signals))
+        for assertion in assertions
+        if (label := str(assertion.get("label", "")).strip())
+    )
+    return VerificationEvidence(signals=signals)
 
 
 def state_evidence_from_runtime(runtime: Any, source: str = "sdk-python") -> StateEvidence:
@@ -81,8 +78,11 @@ def _snapshot_state_hash(snapshot: Any, step_id: str | None) -> str:
     url = str(getattr(snapshot, "url", "") or "")
     timestamp = str(getattr(snapshot, "timestamp", "") or "")
     if url != "" or timestamp != "":
-        digest = hashlib.sha256(f"{url}{timestamp}".encode("utf-8")).hexdigest()
-        return "sha256:" + digest
-    fallback_material = step_id or "missing_snapshot"
-    fallback_digest = hashlib.sha256(fallback_material.encode("utf-8")).hexdigest()
-    return "sha256:" + fallback_digest
+        return _sha256_ref(f"{url}{timestamp}")
+    return _sha256_ref(step_id or "missing_snapshot")
+
+
+# The same snapshot backs every action request in a step; hash its material once.
+@lru_cache(maxsize=1024)
+def _sha256_ref(material: str) -> str:
+    return f"sha256:{hashlib.sha256(material.encode()).hexdigest()}"
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import importlib
 import time
 import uuid
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from collections.abc import Awaitable, Callable
 from typing import Any, Literal
 
@@ -15,6 +18,26 @@ from predicate.tracing import TraceSink, Tracer
 from predicate.verification import Predicate
 
 
+_EXTENSION_READY_JS = (
+    "typeof window.sentience !== 'undefined' && typeof window.sentience.snapshot === 'function'"
+)
+# Upper bound for a single readiness probe; a hung eval counts as "not ready yet".
+_EXTENSION_PROBE_TIMEOUT_S = 2.0
+
+
+@lru_cache(maxsize=1)
+def _browser_use_types() -> tuple[Any, Any]:
+    """
+    Resolve (ActionResult, BrowserSession) from browser-use once; failures are not cached.
+    """
+    browser_use = importlib.import_module("browser_use")
+    ActionResult = getattr(browser_use, "ActionResult", None)
+    BrowserSession = getattr(browser_use, "BrowserSession", None)
+    if ActionResult is None or BrowserSession is None:
+        raise ImportError("browser_use.ActionResult/BrowserSession not available")
+    return ActionResult, BrowserSession
+
+
 class _NoopTraceSink(TraceSink):
     def emit(self, event: dict[str, Any]) -> None:  # pragma: no cover
         return
@@ -23,6 +46,9 @@ class _NoopTraceSink(TraceSink):
         return
 
 
+_NOOP_TRACE_SINK = _NoopTraceSink()
+
+
 @dataclass(frozen=True)
 class StepCheckSpec:
     predicate: Predicate
@@ -86,6 +112,9 @@ class PredicateBrowserUsePlugin:
         # Best-effort step counter if Browser Use does not expose one
         self._step_counter = 0
 
+        # No-op tracer used when config.tracer is None; created on first bind, kept across rebinds.
+        self._noop_tracer: Tracer | None = None
+
     async def bind(self, *, browser_session: Any) -> None:
         """
         Bind plugin to a Browser Use BrowserSession.
@@ -93,11 +122,15 @@ class PredicateBrowserUsePlugin:
         Creates CDP backend via BrowserUseAdapter and wires AgentRuntime + PredicateDebugger.
         Safe to call multiple times; rebinds if session object changed.
         """
-        async with self._lock:
-            if browser_session is None:
-                raise ValueError("browser_session is required")
+        if browser_session is None:
+            raise ValueError("browser_session is required")
 
-            if self._bound_session is browser_session and self.runtime is not None and self.dbg is not None:
+        # Fast path for every step after the first: already bound, no lock round trip.
+        if self._is_bound_to(browser_session):
+            return
+
+        async with self._lock:
+            if self._is_bound_to(browser_session):
                 return
 
             # Lazy import so predicate can be imported without browser-use installed.
@@ -111,8 +144,7 @@ class PredicateBrowserUsePlugin:
 
                     tracer = self.config.tracer
                     if tracer is None:
-                        run_id = self.config.run_id or str(uuid.uuid4())
-                        tracer = Tracer(run_id=run_id, sink=_NoopTraceSink())
+                        tracer = self._fallback_tracer()
 
                     # Ensure snapshot options carry credentials and use_api policy.
                     snap_opts = self._effective_snapshot_options()
@@ -134,9 +166,24 @@ class PredicateBrowserUsePlugin:
 
             raise RuntimeError(f"Failed to bind PredicateBrowserUsePlugin: {last_err}") from last_err
 
+    def _fallback_tracer(self) -> Tracer:
+        if self._noop_tracer is None:
+            run_id = self.config.run_id or str(uuid.uuid4())
+            self._noop_tracer = Tracer(run_id=run_id, sink=_NOOP_TRACE_SINK)
+        return self._noop_tracer
+
+    def _is_bound_to(self, browser_session: Any) -> bool:
+        return (
+            self._bound_session is browser_session
+            and self.runtime is not None
+            and self.dbg is not None
+        )
+
     def _effective_snapshot_options(self) -> SnapshotOptions:
-        base = self.config.snapshot_options
-        effective = SnapshotOptions(**base.model_dump())
+        # Shallow model_copy: callers only assign top-level fields on the result, so the
+        # dump + re-validate round trip is unnecessary. Not memoized, because
+        # config.snapshot_options is a mutable model that callers may edit in place.
+        effective = self.config.snapshot_options.model_copy()
         if self.config.predicate_api_key:
             effective.predicate_api_key = self.config.predicate_api_key
             effective.sentience_api_key = self.config.predicate_api_key
@@ -167,18 +214,21 @@ class PredicateBrowserUsePlugin:
         backend = self.runtime.backend
         deadline = time.monotonic() + max(0.0, float(timeout_ms) / 1000.0)
 
-        async def _eval_with_timeout(expr: str, *, timeout_s: float = 2.0) -> Any:
-            task = asyncio.create_task(backend.eval(expr))
-            done, _pending = await asyncio.wait({task}, timeout=timeout_s)
-            if task not in done:
-                task.cancel()
-                return "__EVAL_TIMEOUT__"
+        async def _eval_with_timeout(expr: str) -> Any:
+            # asyncio.timeout() cancels the eval in place and waits for the cancellation to
+            # finish, so a timed-out probe is settled before the next one starts.
             try:
-                return task.result()
+                async with asyncio.timeout(_EXTENSION_PROBE_TIMEOUT_S):
+                    return await backend.eval(expr)
+            except TimeoutError:
+                return "__EVAL_TIMEOUT__"
             except Exception:
                 return "__EVAL_ERROR__"
 
         last = None
+        # Back off 25ms -> 50 -> 100 -> 200 -> 250ms: the common already-ready case returns
+        # on the first probe, and a just-navigated page is picked up within tens of ms.
+        delay_s = 0.025
         while time.monotonic() <= deadline:
             # Best-effort refresh execution context to avoid stale observations.
             try:
@@ -188,12 +238,11 @@ class PredicateBrowserUsePlugin:
             except Exception:
                 pass
 
-            last = await _eval_with_timeout(
-                "typeof window.sentience !== 'undefined' && typeof window.sentience.snapshot === 'function'"
-            )
+            last = await _eval_with_timeout(_EXTENSION_READY_JS)
             if last not in ("__EVAL_TIMEOUT__", "__EVAL_ERROR__", False, None):
                 return
-            await asyncio.sleep(0.25)
+            await asyncio.sleep(delay_s)
+            delay_s = min(0.25, delay_s * 2)
 
         raise TimeoutError(
             f"Predicate extension not ready after {timeout_ms}ms (last={last})"
@@ -352,13 +401,7 @@ class PredicateBrowserUsePlugin:
         """
         # Import browser-use types lazily; keep this optional.
         try:
-            import importlib
-
-            browser_use = importlib.import_module("browser_use")
-            ActionResult = getattr(browser_use, "ActionResult", None)
-            BrowserSession = getattr(browser_use, "BrowserSession", None)
-            if ActionResult is None or BrowserSession is None:
-                raise ImportError("browser_use.ActionResult/BrowserSession not available")
+            ActionResult, _BrowserSession = _browser_use_types()
         except Exception as e:  # pragma: no cover
             raise ImportError(
                 "browser-use is required to register tools. Install with `predicate-runtime[browser-use]`."
@@ -377,6 +420,8 @@ class PredicateBrowserUsePlugin:
         ) -> Any:
             await self.bind(browser_session=browser_session)
             assert self.runtime is not None
+            # Built from the current config rather than the runtime's bind-time defaults, so
+            # edits to config.snapshot_options after bind() still apply.
             opts = self._effective_snapshot_options()
             if label:
                 opts.goal = label
@@ -433,16 +478,17 @@ class PredicateBrowserUsePlugin:
 
     @staticmethod
     def summarize_snapshot(snap: Snapshot, *, max_elements: int = 20) -> BrowserState:
-        els: list[ElementSummary] = []
-        for e in list(getattr(snap, "elements", []) or [])[: max(0, int(max_elements))]:
-            els.append(
-                ElementSummary(
-                    id=int(getattr(e, "id", -1)),
-                    role=str(getattr(e, "role", "")),
-                    text=getattr(e, "text", None),
-                    importance=getattr(e, "importance", None),
-                    bbox=getattr(e, "bbox", None),
-                )
+        # islice avoids copying the full element list just to keep the first N.
+        elements = getattr(snap, "elements", None) or ()
+        els = [
+            ElementSummary(
+                id=int(getattr(e, "id", -1)),
+                role=str(getattr(e, "role", "")),
+                text=getattr(e, "text", None),
+                importance=getattr(e, "importance", None),
+                bbox=getattr(e, "bbox", None),
             )
+            for e in islice(elements, max(0, int(max_elements)))
+        ]
         return BrowserState(url=str(getattr(snap, "url", "")), elements=els)
 
@@ -4,6 +4,7 @@ Enables "Bring Your Own Brain" (BYOB) pattern - plug in any LLM provider
 """
 
 import asyncio
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
@@ -11,6 +12,9 @@ from typing import Any
 from .llm_provider_utils import get_api_key_from_env, handle_provider_error, require_package
 from .llm_response_builder import LLMResponseBuilder
 
+# Matches one "[i] ..." line of a batched (multi-query) reply.
+_BATCH_LINE_RE = re.compile(r"^\s*\[(\d+)\]\s*(.*?)\s*$", re.MULTILINE)
+
 
 @dataclass
 class LLMResponse:
@@ -66,6 +70,46 @@ class LLMProvider(ABC):
         """
         return await asyncio.to_thread(self.generate, system_prompt, user_prompt, **kwargs)
 
+    def generate_batch(
+        self, system_prompt: str, user_prompt: str, n: int, **kwargs
+    ) -> list[LLMResponse]:
+        """
+        Answer `n` indexed queries packed into a single prompt with one LLM call.
+
+        The prompt is expected to ask for one line per query in the form "[i] ANSWER"
+        (1-based). The default implementation calls generate() once and splits the reply
+        on those markers; providers with a native batch API may override it.
+
+        Args:
+            system_prompt: System instruction/context (shared by all queries)
+            user_prompt: User prompt containing the `[1]..[n]` indexed queries
+            n: Number of indexed queries in the prompt
+            **kwargs: Provider-specific parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            List of `n` LLMResponse objects in index order. Indices missing from the
+            reply get an empty `content`. Token usage is reported on the first entry only.
+        """
+        resp = self.generate(system_prompt, user_prompt, **kwargs)
+        by_index: dict[int, str] = {}
+        for m in _BATCH_LINE_RE.finditer(resp.content or ""):
+            by_index.setdefault(int(m.group(1)), m.group(2))
+
+        out: list[LLMResponse] = []
+        for i in range(1, max(0, int(n)) + 1):
+            first = i == 1
+            out.append(
+                LLMResponse(
+                    content=by_index.get(i, ""),
+                    prompt_tokens=resp.prompt_tokens if first else None,
+                    completion_tokens=resp.completion_tokens if first else None,
+                    total_tokens=resp.total_tokens if first else None,
+                    model_name=resp.model_name,
+                    finish_reason=resp.finish_reason,
+                )
+            )
+        return out
+
     @abstractmethod
     def supports_json_mode(self) -> bool:
         """
@@ -380,15 +424,25 @@ class AnthropicProvider(LLMProvider):
         >>> print(response.content)
     """
 
-    def __init__(self, api_key: str | None = None, model: str = "claude-3-5-sonnet-20241022"):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str = "claude-3-5-sonnet-20241022",
+        cache_system_prompt: bool = False,
+    ):
         """
         Initialize Anthropic provider
 
         Args:
             api_key: Anthropic API key (or set ANTHROPIC_API_KEY env var)
             model: Model name (claude-3-opus, claude-3-sonnet, claude-3-haiku, etc.)
+            cache_system_prompt: Mark the system prompt with an ephemeral cache_control
+                breakpoint so repeated calls with the same (byte-identical) system prompt
+                reuse Anthropic's prompt cache. Only worth enabling when the system prompt
+                is static across calls and above the model's minimum cacheable length.
         """
         super().__init__(model)  # Initialize base class with model name
+        self.cache_system_prompt = cache_system_prompt
 
         Anthropic = require_package(
             "anthropic",
@@ -429,7 +483,7 @@ class AnthropicProvider(LLMProvider):
         }
 
         if system_prompt:
-            api_params["system"] = system_prompt
+            api_params["system"] = self._system_param(system_prompt)
 
         # Merge additional parameters
         api_params.update(kwargs)
@@ -450,6 +504,11 @@ class AnthropicProvider(LLMProvider):
             stop_reason=response.stop_reason,
         )
 
+    def _system_param(self, system_prompt: str) -> str | list[dict[str, Any]]:
+        if not self.cache_system_prompt:
+            return system_prompt
+        return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
     def supports_json_mode(self) -> bool:
         """Anthropic doesn't have native JSON mode (requires prompt engineering)"""
         return False
@@ -521,7 +580,7 @@ class AnthropicProvider(LLMProvider):
         }
 
         if system_prompt:
-            api_params["system"] = system_prompt
+            api_params["system"] = self._system_param(system_prompt)
 
         # Merge additional parameters
         api_params.update(kwargs)
@@ -4,13 +4,24 @@ Pydantic models for Sentience SDK - matches spec/snapshot.schema.json
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 
 
-class BBox(BaseModel):
+class _Model(BaseModel):
+    """
+    Base for the SDK's models. Validators are built on first use rather than at
+    import, so `import predicate` does not pay for models a script never touches.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class BBox(_Model):
     """Bounding box coordinates"""
 
     x: float
@@ -19,14 +30,14 @@ class BBox(BaseModel):
     height: float
 
 
-class Viewport(BaseModel):
+class Viewport(_Model):
     """Viewport dimensions"""
 
     width: float
     height: float
 
 
-class VisualCues(BaseModel):
+class VisualCues(_Model):
     """Visual analysis cues"""
 
     is_primary: bool
@@ -35,7 +46,7 @@ class VisualCues(BaseModel):
     is_clickable: bool
 
 
-class Element(BaseModel):
+class Element(_Model):
     """Element from snapshot"""
 
     id: int
@@ -98,8 +109,17 @@ class Element(BaseModel):
     # Note: This field is marked with skip_serializing_if in Rust, so it won't appear in API responses
     layout: LayoutHints | None = None
 
+    @field_validator("role", "input_type")
+    @classmethod
+    def _intern_vocabulary(cls, v: str | None) -> str | None:
+        """
+        Intern small-vocabulary strings so every element in a snapshot shares one
+        object per role, and `el.role == "button"` hits the identity fast path.
+        """
+        return sys.intern(v) if v is not None else v
+
 
-class GridPosition(BaseModel):
+class GridPosition(_Model):
     """Grid position within a detected grid/list"""
 
     row_index: int  # 0-based row index
@@ -107,7 +127,7 @@ class GridPosition(BaseModel):
     cluster_id: int  # ID of the row cluster (for distinguishing separate grids)
 
 
-class LayoutHints(BaseModel):
+class LayoutHints(_Model):
     """Layout-derived metadata for an element (internal-only in v0)"""
 
     # Grid ID (maps to GridInfo.grid_id) - distinguishes multiple grids on same page
@@ -130,7 +150,7 @@ class LayoutHints(BaseModel):
     region_confidence: float = 0.0  # Confidence score for region assignment (0.0-1.0)
 
 
-class GridInfo(BaseModel):
+class GridInfo(_Model):
     """Grid bounding box and metadata for a detected grid"""
 
     grid_id: int  # The grid ID (matches grid_id in LayoutHints)
@@ -151,7 +171,7 @@ class GridInfo(BaseModel):
     viewport_coverage: float = 0.0  # Ratio of grid area to viewport area (0.0-1.0)
 
 
-class MlRerankTags(BaseModel):
+class MlRerankTags(_Model):
     """ML rerank tag configuration used for candidate text"""
 
     repeated: bool
@@ -165,7 +185,7 @@ class MlRerankTags(BaseModel):
     nav_ish: bool
 
 
-class MlRerankInfo(BaseModel):
+class MlRerankInfo(_Model):
     """ML rerank metadata for a snapshot response"""
 
     enabled: bool
@@ -179,7 +199,53 @@ class MlRerankInfo(BaseModel):
     error: str | None = None
 
 
-class Snapshot(BaseModel):
+@dataclass(frozen=True)
+class SnapshotColumns:
+    """
+    Column-oriented (struct-of-arrays) view of `Snapshot.elements`.
+
+    Index i of every column describes `elements[i]`. Scans that read one field across
+    all elements (selector/state predicates) walk a single column instead of
+    touching every Element model.
+    """
+
+    roles: tuple[str, ...]
+    texts: tuple[str, ...]  # visible text ("" if none)
+    names: tuple[str, ...]  # accessible name, falling back to visible text ("" if neither)
+    values: tuple[str | None, ...]
+    disabled: tuple[bool | None, ...]
+    checked: tuple[bool | None, ...]
+    expanded: tuple[bool | None, ...]
+    # Selector -> matching indices, filled lazily by verification predicates so
+    # several assertions on the same snapshot share one scan per selector.
+    matches: dict[str, tuple[int, ...]] = field(
+        default_factory=dict, init=False, compare=False, repr=False
+    )
+
+    @classmethod
+    def from_elements(cls, elements: list[Element]) -> SnapshotColumns:
+        return cls(
+            roles=tuple(el.role for el in elements),
+            texts=tuple(el.text or "" for el in elements),
+            names=tuple(el.name or el.text or "" for el in elements),
+            values=tuple(el.value for el in elements),
+            disabled=tuple(el.disabled for el in elements),
+            checked=tuple(el.checked for el in elements),
+            expanded=tuple(el.expanded for el in elements),
+        )
+
+    @functools.cached_property
+    def lower_texts(self) -> tuple[str, ...]:
+        """Case-folded `texts`, computed once for case-insensitive `text~` matching."""
+        return tuple(t.lower() for t in self.texts)
+
+    @functools.cached_property
+    def lower_names(self) -> tuple[str, ...]:
+        """Case-folded `names`, computed once for case-insensitive `name~` matching."""
+        return tuple(n.lower() for n in self.names)
+
+
+class Snapshot(_Model):
     """Snapshot response from extension"""
 
     status: Literal["success", "error"]
@@ -201,6 +267,23 @@ class Snapshot(BaseModel):
     # ML rerank metadata (optional)
     ml_rerank: MlRerankInfo | None = None
 
+    # Lazily built columnar view: (elements list it was built from, its length, columns)
+    _columns: tuple[list[Element], int, SnapshotColumns] | None = PrivateAttr(default=None)
+
+    def columns(self) -> SnapshotColumns:
+        """
+        Columnar view of `elements`, built on first use and cached.
+
+        The cache is rebuilt if `elements` is replaced or resized; in-place edits to
+        individual elements after the first call are not reflected.
+        """
+        cached = self._columns
+        if cached is not None and cached[0] is self.elements and cached[1] == len(self.elements):
+            return cached[2]
+        cols = SnapshotColumns.from_elements(self.elements)
+        self._columns = (self.elements, len(self.elements), cols)
+        return cols
+
     def save(self, filepath: str) -> None:
         """Save snapshot as JSON file"""
         import json
@@ -321,7 +404,7 @@ class Snapshot(BaseModel):
         return grid_infos
 
 
-class SnapshotDiagnosticsMetrics(BaseModel):
+class SnapshotDiagnosticsMetrics(_Model):
     ready_state: str | None = None
     quiet_ms: float | None = None
     node_count: int | None = None
@@ -329,14 +412,14 @@ class SnapshotDiagnosticsMetrics(BaseModel):
     raw_elements_count: int | None = None
 
 
-class CaptchaEvidence(BaseModel):
+class CaptchaEvidence(_Model):
     text_hits: list[str] = Field(default_factory=list)
     selector_hits: list[str] = Field(default_factory=list)
     iframe_src_hits: list[str] = Field(default_factory=list)
     url_hits: list[str] = Field(default_factory=list)
 
 
-class CaptchaDiagnostics(BaseModel):
+class CaptchaDiagnostics(_Model):
     """Detection-only CAPTCHA signal (no solving/bypass)."""
 
     detected: bool = False
@@ -345,7 +428,7 @@ class CaptchaDiagnostics(BaseModel):
     evidence: CaptchaEvidence = Field(default_factory=CaptchaEvidence)
 
 
-class SnapshotDiagnostics(BaseModel):
+class SnapshotDiagnostics(_Model):
     """Runtime stability/debug information (reserved for diagnostics, not ML metadata)."""
 
     confidence: float | None = None
@@ -647,7 +730,7 @@ class SnapshotDiagnostics(BaseModel):
         return None
 
 
-class ActionResult(BaseModel):
+class ActionResult(_Model):
     """Result of an action (click, type, press)"""
 
     success: bool
@@ -660,7 +743,7 @@ class ActionResult(BaseModel):
     cursor: dict[str, Any] | None = None
 
 
-class TabInfo(BaseModel):
+class TabInfo(_Model):
     """Metadata about an open browser tab/page."""
 
     tab_id: str
@@ -669,7 +752,7 @@ class TabInfo(BaseModel):
     is_active: bool = False
 
 
-class TabListResult(BaseModel):
+class TabListResult(_Model):
     """Result of listing tabs."""
 
     ok: bool
@@ -677,7 +760,7 @@ class TabListResult(BaseModel):
     error: str | None = None
 
 
-class TabOperationResult(BaseModel):
+class TabOperationResult(_Model):
     """Result of tab operations (open/switch/close)."""
 
     ok: bool
@@ -685,7 +768,7 @@ class TabOperationResult(BaseModel):
     error: str | None = None
 
 
-class StepHookContext(BaseModel):
+class StepHookContext(_Model):
     """Context passed to lifecycle hooks."""
 
     step_id: str
@@ -698,7 +781,7 @@ class StepHookContext(BaseModel):
     error: str | None = None
 
 
-class EvaluateJsRequest(BaseModel):
+class EvaluateJsRequest(_Model):
     """Request for evaluate_js helper."""
 
     code: str = Field(
@@ -719,7 +802,7 @@ class EvaluateJsRequest(BaseModel):
     )
 
 
-class EvaluateJsResult(BaseModel):
+class EvaluateJsResult(_Model):
     """Result of evaluate_js helper."""
 
     ok: bool = Field(..., description="Whether evaluation succeeded.")
@@ -729,7 +812,7 @@ class EvaluateJsResult(BaseModel):
     error: str | None = Field(None, description="Error string when ok=False.")
 
 
-class WaitResult(BaseModel):
+class WaitResult(_Model):
     """Result of wait_for operation"""
 
     found: bool
@@ -741,14 +824,14 @@ class WaitResult(BaseModel):
 # ========== Agent Layer Models ==========
 
 
-class ScreenshotConfig(BaseModel):
+class ScreenshotConfig(_Model):
     """Screenshot format configuration"""
 
     format: Literal["png", "jpeg"] = "png"
     quality: int | None = Field(None, ge=1, le=100)  # Only for JPEG (1-100)
 
 
-class SnapshotFilter(BaseModel):
+class SnapshotFilter(_Model):
     """Filter options for snapshot elements"""
 
     min_area: int | None = Field(None, ge=0)
@@ -756,7 +839,7 @@ class SnapshotFilter(BaseModel):
     min_z_index: int | None = None
 
 
-class SnapshotOptions(BaseModel):
+class SnapshotOptions(_Model):
     """
     Configuration for snapshot calls.
     Matches TypeScript SnapshotOptions interface from sdk-ts/src/snapshot.ts
@@ -806,7 +889,7 @@ class SnapshotOptions(BaseModel):
         return self
 
 
-class AgentActionResult(BaseModel):
+class AgentActionResult(_Model):
     """Result of a single agent action (from agent.act())"""
 
     success: bool
@@ -841,7 +924,7 @@ class AgentActionResult(BaseModel):
         return getattr(self, key)
 
 
-class ActionTokenUsage(BaseModel):
+class ActionTokenUsage(_Model):
     """Token usage for a single action"""
 
     goal: str
@@ -851,7 +934,7 @@ class ActionTokenUsage(BaseModel):
     model: str
 
 
-class LLMUsage(BaseModel):
+class LLMUsage(_Model):
     """Token usage for a single LLM call"""
 
     prompt_tokens: int = 0
@@ -859,7 +942,7 @@ class LLMUsage(BaseModel):
     total_tokens: int = 0
 
 
-class LLMStepData(BaseModel):
+class LLMStepData(_Model):
     """
     LLM interaction data for a single step in agent traces.
 
@@ -907,7 +990,7 @@ class LLMStepData(BaseModel):
         return result
 
 
-class TokenStats(BaseModel):
+class TokenStats(_Model):
     """Token usage statistics for an agent session"""
 
     total_prompt_tokens: int
@@ -916,7 +999,7 @@ class TokenStats(BaseModel):
     by_action: list[ActionTokenUsage]
 
 
-class ActionHistory(BaseModel):
+class ActionHistory(_Model):
     """Single history entry from agent execution"""
 
     goal: str
@@ -927,7 +1010,7 @@ class ActionHistory(BaseModel):
     duration_ms: int
 
 
-class ProxyConfig(BaseModel):
+class ProxyConfig(_Model):
     """
     Proxy configuration for browser networking.
 
@@ -964,7 +1047,7 @@ class ProxyConfig(BaseModel):
 # ========== Storage State Models (Auth Injection) ==========
 
 
-class Cookie(BaseModel):
+class Cookie(_Model):
     """
     Cookie definition for storage state injection.
 
@@ -983,7 +1066,7 @@ class Cookie(BaseModel):
     )
 
 
-class LocalStorageItem(BaseModel):
+class LocalStorageItem(_Model):
     """
     LocalStorage item for a specific origin.
 
@@ -994,7 +1077,7 @@ class LocalStorageItem(BaseModel):
     value: str = Field(..., description="LocalStorage value")
 
 
-class OriginStorage(BaseModel):
+class OriginStorage(_Model):
     """
     Storage state for a specific origin (localStorage).
 
@@ -1007,7 +1090,7 @@ class OriginStorage(BaseModel):
     )
 
 
-class StorageState(BaseModel):
+class StorageState(_Model):
     """
     Complete browser storage state (cookies + localStorage).
 
@@ -1085,7 +1168,7 @@ class StorageState(BaseModel):
 # ========== Text Search Models (findTextRect) ==========
 
 
-class TextRect(BaseModel):
+class TextRect(_Model):
     """
     Rectangle coordinates for text occurrence.
     Includes both absolute (page) and viewport-relative coordinates.
@@ -1101,7 +1184,7 @@ class TextRect(BaseModel):
     bottom: float = Field(..., description="Absolute bottom position (y + height)")
 
 
-class ViewportRect(BaseModel):
+class ViewportRect(_Model):
     """Viewport-relative rectangle coordinates (without scroll offset)"""
 
     x: float = Field(..., description="Viewport-relative X coordinate")
@@ -1110,14 +1193,14 @@ class ViewportRect(BaseModel):
     height: float = Field(..., description="Rectangle height in pixels")
 
 
-class TextContext(BaseModel):
+class TextContext(_Model):
     """Context text surrounding a match"""
 
     before: str = Field(..., description="Text before the match (up to 20 chars)")
     after: str = Field(..., description="Text after the match (up to 20 chars)")
 
 
-class TextMatch(BaseModel):
+class TextMatch(_Model):
     """A single text match with its rectangle and context"""
 
     text: str = Field(..., description="The matched text")
@@ -1129,7 +1212,7 @@ class TextMatch(BaseModel):
     in_viewport: bool = Field(..., description="Whether the match is currently visible in viewport")
 
 
-class TextRectSearchResult(BaseModel):
+class TextRectSearchResult(_Model):
     """
     Result of findTextRect operation.
     Returns all occurrences of text on the page with their exact pixel coordinates.
@@ -1147,7 +1230,7 @@ class TextRectSearchResult(BaseModel):
     error: str | None = Field(None, description="Error message if status is 'error'")
 
 
-class ReadResult(BaseModel):
+class ReadResult(_Model):
     """Result of read() or read_async() operation"""
 
     status: Literal["success", "error"]
@@ -1156,9 +1239,10 @@ class ReadResult(BaseModel):
     content: str
     length: int
     error: str | None = None
+    truncated: bool = False  # content was cut to the caller's max_chars
 
 
-class ExtractResult(BaseModel):
+class ExtractResult(_Model):
     """Result of extract() or extract_async() operation"""
 
     ok: bool
@@ -1167,7 +1251,7 @@ class ExtractResult(BaseModel):
     error: str | None = None
 
 
-class TraceStats(BaseModel):
+class TraceStats(_Model):
     """Execution statistics for trace completion"""
 
     total_steps: int
@@ -1178,7 +1262,7 @@ class TraceStats(BaseModel):
     ended_at: str | None = None
 
 
-class StepExecutionResult(BaseModel):
+class StepExecutionResult(_Model):
     """Result of executing a single step in ConversationalAgent"""
 
     success: bool
@@ -1187,7 +1271,7 @@ class StepExecutionResult(BaseModel):
     error: str | None = None
 
 
-class ExtractionResult(BaseModel):
+class ExtractionResult(_Model):
     """Result of extracting information from a page"""
 
     found: bool
@@ -36,7 +36,11 @@ _READ_EVAL_JS = r"""
       };
     }
 
-    const res = api.read(options || { format: fmt });
+    const readOptions = Object.assign({ format: fmt }, options || {});
+    const maxChars = readOptions.max_chars;
+    delete readOptions.max_chars;
+
+    const res = api.read(readOptions);
     if (!res || typeof res !== "object") {
       return {
         status: "error",
@@ -56,6 +60,12 @@ _READ_EVAL_JS = r"""
     if (typeof res.content !== "string") res.content = String(res.content ?? "");
     if (typeof res.length !== "number") res.length = res.content.length;
     if (!("error" in res)) res.error = null;
+    // Truncate in the page so oversized content never crosses the CDP bridge.
+    if (typeof maxChars === "number" && maxChars >= 0 && res.content.length > maxChars) {
+      res.content = res.content.slice(0, maxChars);
+      res.length = res.content.length;
+      res.truncated = true;
+    }
     return res;
   } catch (e) {
     const msg =
@@ -88,10 +98,24 @@ def _debug_read(msg: str) -> None:
         print(f"[sentience][read] {msg}")
 
 
+def _read_options(output_format: str, max_chars: int | None) -> dict[str, Any]:
+    options: dict[str, Any] = {"format": output_format}
+    if max_chars is not None:
+        options["max_chars"] = max_chars
+    return options
+
+
+def _cap(content: str, max_chars: int | None) -> tuple[str, bool]:
+    if max_chars is not None and len(content) > max_chars:
+        return content[:max_chars], True
+    return content, False
+
+
 def _fallback_read_from_page_sync(
     page,
     *,
     output_format: Literal["raw", "text", "markdown"],
+    max_chars: int | None = None,
 ) -> ReadResult | None:
     """
     Fallback reader that does NOT rely on the extension.
@@ -103,8 +127,14 @@ def _fallback_read_from_page_sync(
             html = page.content()
             if not isinstance(html, str) or _looks_empty_content(html):
                 return None
+            html, truncated = _cap(html, max_chars)
             return ReadResult(
-                status="success", url=url, format="raw", content=html, length=len(html)
+                status="success",
+                url=url,
+                format="raw",
+                content=html,
+                length=len(html),
+                truncated=truncated,
             )
 
         if output_format == "text":
@@ -113,8 +143,14 @@ def _fallback_read_from_page_sync(
             )
             if not isinstance(text, str) or _looks_empty_content(text):
                 return None
+            text, truncated = _cap(text, max_chars)
             return ReadResult(
-                status="success", url=url, format="text", content=text, length=len(text)
+                status="success",
+                url=url,
+                format="text",
+                content=text,
+                length=len(text),
+                truncated=truncated,
             )
 
         if output_format == "markdown":
@@ -125,11 +161,17 @@ def _fallback_read_from_page_sync(
             html = page.content()
             if not isinstance(html, str) or _looks_empty_content(html):
                 return None
+            html, truncated = _cap(html, max_chars)
             md = markdownify(html, heading_style="ATX", wrap=True)
             if not isinstance(md, str) or _looks_empty_content(md):
                 return None
             return ReadResult(
-                status="success", url=url, format="markdown", content=md, length=len(md)
+                status="success",
+                url=url,
+                format="markdown",
+                content=md,
+                length=len(md),
+                truncated=truncated,
             )
     except Exception:
         return None
@@ -140,6 +182,7 @@ async def _fallback_read_from_page_async(
     page,
     *,
     output_format: Literal["raw", "text", "markdown"],
+    max_chars: int | None = None,
 ) -> ReadResult | None:
     """
     Async variant of `_fallback_read_from_page_sync`.
@@ -150,8 +193,14 @@ async def _fallback_read_from_page_async(
             html = await page.content()
             if not isinstance(html, str) or _looks_empty_content(html):
                 return None
+            html, truncated = _cap(html, max_chars)
             return ReadResult(
-                status="success", url=url, format="raw", content=html, length=len(html)
+                status="success",
+                url=url,
+                format="raw",
+                content=html,
+                length=len(html),
+                truncated=truncated,
             )
 
         if output_format == "text":
@@ -160,8 +209,14 @@ async def _fallback_read_from_page_async(
             )
             if not isinstance(text, str) or _looks_empty_content(text):
                 return None
+            text, truncated = _cap(text, max_chars)
             return ReadResult(
-                status="success", url=url, format="text", content=text, length=len(text)
+                status="success",
+                url=url,
+                format="text",
+                content=text,
+                length=len(text),
+                truncated=truncated,
             )
 
         if output_format == "markdown":
@@ -172,11 +227,17 @@ async def _fallback_read_from_page_async(
             html = await page.content()
             if not isinstance(html, str) or _looks_empty_content(html):
                 return None
+            html, truncated = _cap(html, max_chars)
             md = markdownify(html, heading_style="ATX", wrap=True)
             if not isinstance(md, str) or _looks_empty_content(md):
                 return None
             return ReadResult(
-                status="success", url=url, format="markdown", content=md, length=len(md)
+                status="success",
+                url=url,
+                format="markdown",
+                content=md,
+                length=len(md),
+                truncated=truncated,
             )
     except Exception:
         return None
@@ -187,6 +248,7 @@ def read(
     browser: SentienceBrowser,
     output_format: Literal["raw", "text", "markdown"] = "raw",
     enhance_markdown: bool = True,
+    max_chars: int | None = None,
 ) -> ReadResult:
     """
     Read page content as raw HTML, text, or markdown
@@ -197,6 +259,9 @@ def read(
                         "text" (plain text), or "markdown" (lightweight or enhanced markdown).
         enhance_markdown: If True and output_format is "markdown", uses markdownify for better conversion.
                           If False, uses the extension's lightweight markdown converter.
+        max_chars: Optional cap on content transferred from the page. Longer content is
+                   truncated in the browser before serialization (for enhanced markdown the
+                   cap applies to the source HTML) and the result has truncated=True.
 
     Returns:
         dict with:
@@ -206,6 +271,7 @@ def read(
             - content: Page content as string
             - length: Content length in characters
             - error: Error message if status is "error"
+            - truncated: True if content was cut to max_chars
 
     Examples:
         # Get raw HTML (default) - can be used with markdownify for better conversion
@@ -234,11 +300,15 @@ def read(
         # Get raw HTML from the extension first
         raw_html_result = browser.page.evaluate(
             _READ_EVAL_JS,
-            {"format": "raw"},
+            _read_options("raw", max_chars),
         )
 
         if raw_html_result.get("status") == "success":
             html_content = raw_html_result["content"]
+            _debug_read(
+                f"extension raw length={raw_html_result.get('length')} "
+                f"truncated={bool(raw_html_result.get('truncated'))}"
+            )
             try:
                 # Use markdownify for enhanced markdown conversion
                 from markdownify import markdownify  # type: ignore
@@ -252,7 +322,9 @@ def read(
                 markdown_content = markdownify(html_content, heading_style="ATX", wrap=True)
                 if _looks_empty_content(markdown_content):
                     # Extension returned empty/near-empty HTML; try Playwright fallback.
-                    fb = _fallback_read_from_page_sync(browser.page, output_format="markdown")
+                    fb = _fallback_read_from_page_sync(
+                        browser.page, output_format="markdown", max_chars=max_chars
+                    )
                     if fb is not None:
                         _debug_read("fallback=playwright reason=empty_markdown_from_extension")
                         return fb
@@ -262,6 +334,7 @@ def read(
                     format="markdown",
                     content=markdown_content,
                     length=len(markdown_content),
+                    truncated=bool(raw_html_result.get("truncated")),
                 )
             except ImportError:
                 print(
@@ -275,7 +348,9 @@ def read(
                 )
         else:
             # Extension raw read failed; try Playwright fallback for markdown if possible.
-            fb = _fallback_read_from_page_sync(browser.page, output_format="markdown")
+            fb = _fallback_read_from_page_sync(
+                browser.page, output_format="markdown", max_chars=max_chars
+            )
             if fb is not None:
                 _debug_read("fallback=playwright reason=extension_raw_failed format=markdown")
                 return fb
@@ -283,13 +358,15 @@ def read(
     # If not enhanced markdown, or fallback, call extension with requested format
     result = browser.page.evaluate(
         _READ_EVAL_JS,
-        {"format": output_format},
+        _read_options(output_format, max_chars),
     )
 
     # Convert dict result to ReadResult model
     rr = ReadResult(**result)
     if rr.status == "success" and _looks_empty_content(rr.content):
-        fb = _fallback_read_from_page_sync(browser.page, output_format=output_format)
+        fb = _fallback_read_from_page_sync(
+            browser.page, output_format=output_format, max_chars=max_chars
+        )
         if fb is not None:
             _debug_read(
                 f"fallback=playwright reason=empty_content_from_extension format={output_format}"
@@ -304,6 +381,7 @@ def read(
             content=rr.content,
             length=rr.length,
             error="empty_content",
+            truncated=rr.truncated,
         )
     return rr
 
@@ -312,6 +390,7 @@ def read_best_effort(
     browser: SentienceBrowser,
     output_format: Literal["raw", "text", "markdown"] = "raw",
     enhance_markdown: bool = True,
+    max_chars: int | None = None,
 ) -> ReadResult:
     """
     Best-effort read.
@@ -325,13 +404,19 @@ def read_best_effort(
     is intentionally thin so we can extend the fallback chain without changing
     semantics for callers that want explicit "best effort" behavior.
     """
-    return read(browser, output_format=output_format, enhance_markdown=enhance_markdown)
+    return read(
+        browser,
+        output_format=output_format,
+        enhance_markdown=enhance_markdown,
+        max_chars=max_chars,
+    )
 
 
 async def read_async(
     browser: AsyncSentienceBrowser,
     output_format: Literal["raw", "text", "markdown"] = "raw",
     enhance_markdown: bool = True,
+    max_chars: int | None = None,
 ) -> ReadResult:
     """
     Read page content as raw HTML, text, or markdown (async)
@@ -342,6 +427,9 @@ async def read_async(
                         "text" (plain text), or "markdown" (lightweight or enhanced markdown).
         enhance_markdown: If True and output_format is "markdown", uses markdownify for better conversion.
                           If False, uses the extension's lightweight markdown converter.
+        max_chars: Optional cap on content transferred from the page. Longer content is
+                   truncated in the browser before serialization (for enhanced markdown the
+                   cap applies to the source HTML) and the result has truncated=True.
 
     Returns:
         dict with:
@@ -351,6 +439,7 @@ async def read_async(
             - content: Page content as string
             - length: Content length in characters
             - error: Error message if status is "error"
+            - truncated: True if content was cut to max_chars
 
     Examples:
         # Get raw HTML (default) - can be used with markdownify for better conversion
@@ -378,11 +467,15 @@ async def read_async(
         # Get raw HTML from the extension first
         raw_html_result = await browser.page.evaluate(
             _READ_EVAL_JS,
-            {"format": "raw"},
+            _read_options("raw", max_chars),
         )
 
         if raw_html_result.get("status") == "success":
             html_content = raw_html_result["content"]
+            _debug_read(
+                f"extension raw length={raw_html_result.get('length')} "
+                f"truncated={bool(raw_html_result.get('truncated'))}"
+            )
             try:
                 # Use markdownify for enhanced markdown conversion
                 from markdownify import markdownify  # type: ignore
@@ -395,7 +488,7 @@ async def read_async(
                 markdown_content = markdownify(html_content, heading_style="ATX", wrap=True)
                 if _looks_empty_content(markdown_content):
                     fb = await _fallback_read_from_page_async(
-                        browser.page, output_format="markdown"
+                        browser.page, output_format="markdown", max_chars=max_chars
                     )
                     if fb is not None:
                         _debug_read("fallback=playwright reason=empty_markdown_from_extension")
@@ -406,6 +499,7 @@ async def read_async(
                     format="markdown",
                     content=markdown_content,
                     length=len(markdown_content),
+                    truncated=bool(raw_html_result.get("truncated")),
                 )
             except ImportError:
                 print(
@@ -418,7 +512,9 @@ async def read_async(
                     f"Warning: An unexpected error occurred with markdownify ({e}), falling back to extension's markdown."
                 )
         else:
-            fb = await _fallback_read_from_page_async(browser.page, output_format="markdown")
+            fb = await _fallback_read_from_page_async(
+                browser.page, output_format="markdown", max_chars=max_chars
+            )
             if fb is not None:
                 _debug_read("fallback=playwright reason=extension_raw_failed format=markdown")
                 return fb
@@ -426,12 +522,14 @@ async def read_async(
     # If not enhanced markdown, or fallback, call extension with requested format
     result = await browser.page.evaluate(
         _READ_EVAL_JS,
-        {"format": output_format},
+        _read_options(output_format, max_chars),
     )
 
     rr = ReadResult(**result)
     if rr.status == "success" and _looks_empty_content(rr.content):
-        fb = await _fallback_read_from_page_async(browser.page, output_format=output_format)
+        fb = await _fallback_read_from_page_async(
+            browser.page, output_format=output_format, max_chars=max_chars
+        )
         if fb is not None:
             _debug_read(
                 f"fallback=playwright reason=empty_content_from_extension format={output_format}"
@@ -444,6 +542,7 @@ async def read_async(
             content=rr.content,
             length=rr.length,
             error="empty_content",
+            truncated=rr.truncated,
         )
     return rr
 
@@ -452,11 +551,100 @@ async def read_best_effort_async(
     browser: AsyncSentienceBrowser,
     output_format: Literal["raw", "text", "markdown"] = "raw",
     enhance_markdown: bool = True,
+    max_chars: int | None = None,
 ) -> ReadResult:
     """
     Async best-effort read. See `read_best_effort()` for semantics.
     """
-    return await read_async(browser, output_format=output_format, enhance_markdown=enhance_markdown)
+    return await read_async(
+        browser,
+        output_format=output_format,
+        enhance_markdown=enhance_markdown,
+        max_chars=max_chars,
+    )
+
+
+def _markdown_from_raw(raw: ReadResult) -> ReadResult | None:
+    """
+    Derive enhanced markdown from an already-fetched raw read, or None if not possible.
+    """
+    if raw.status != "success" or _looks_empty_content(raw.content):
+        return None
+    try:
+        from markdownify import markdownify  # type: ignore
+
+        md = markdownify(raw.content, heading_style="ATX", wrap=True)
+    except Exception:
+        return None
+    if not isinstance(md, str) or _looks_empty_content(md):
+        return None
+    return ReadResult(
+        status="success",
+        url=raw.url,
+        format="markdown",
+        content=md,
+        length=len(md),
+        truncated=raw.truncated,
+    )
+
+
+def read_formats(
+    browser: SentienceBrowser,
+    output_formats: tuple[Literal["raw", "text", "markdown"], ...] = ("raw", "markdown"),
+    enhance_markdown: bool = True,
+    max_chars: int | None = None,
+) -> dict[str, ReadResult]:
+    """
+    Read the current page in several formats with as few page reads as possible.
+
+    When both "raw" and enhanced "markdown" are requested, markdown is converted from
+    the same raw HTML instead of fetching the page a second time. Other formats fall
+    back to `read()`.
+
+    Returns:
+        Mapping of format name to ReadResult, in the order requested.
+    """
+    shared: dict[str, ReadResult] = {}
+    if enhance_markdown and "raw" in output_formats and "markdown" in output_formats:
+        shared["raw"] = read(browser, output_format="raw", max_chars=max_chars)
+        md = _markdown_from_raw(shared["raw"])
+        if md is not None:
+            shared["markdown"] = md
+
+    results: dict[str, ReadResult] = {}
+    for fmt in output_formats:
+        if fmt in results:
+            continue
+        results[fmt] = shared.get(fmt) or read(
+            browser, output_format=fmt, enhance_markdown=enhance_markdown, max_chars=max_chars
+        )
+    return results
+
+
+async def read_formats_async(
+    browser: AsyncSentienceBrowser,
+    output_formats: tuple[Literal["raw", "text", "markdown"], ...] = ("raw", "markdown"),
+    enhance_markdown: bool = True,
+    max_chars: int | None = None,
+) -> dict[str, ReadResult]:
+    """
+    Async variant of `read_formats()`.
+    """
+    shared: dict[str, ReadResult] = {}
+    if enhance_markdown and "raw" in output_formats and "markdown" in output_formats:
+        shared["raw"] = await read_async(browser, output_format="raw", max_chars=max_chars)
+        md = _markdown_from_raw(shared["raw"])
+        if md is not None:
+            shared["markdown"] = md
+
+    results: dict[str, ReadResult] = {}
+    for fmt in output_formats:
+        if fmt in results:
+            continue
+        results[fmt] = shared.get(fmt) or await read_async(
+            browser, output_format=fmt, enhance_markdown=enhance_markdown, max_chars=max_chars
+        )
+    return results
 
 
 def _extract_json_payload(text: str) -> dict[str, Any]:
@@ -9,6 +9,7 @@ This module intentionally keeps the control plane verification-first:
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import inspect
 import re
@@ -23,6 +24,27 @@ from .llm_provider import LLMProvider
 from .models import BBox, Snapshot, StepHookContext
 from .verification import Predicate
 
+_NUM = r"(-?\d+(?:\.\d+)?)"
+
+# Executor action grammar, keyed by op name (see RuntimeAgent._parse_action).
+_ACTION_PATTERNS: dict[str, re.Pattern[str]] = {
+    "FINISH": re.compile(r"FINISH\s*\(\s*\)\s*$", re.IGNORECASE),
+    "CLICK_XY": re.compile(rf"CLICK_XY\s*\(\s*{_NUM}\s*,\s*{_NUM}\s*\)\s*$", re.IGNORECASE),
+    "CLICK_RECT": re.compile(
+        rf"CLICK_RECT\s*\(\s*{_NUM}\s*,\s*{_NUM}\s*,\s*{_NUM}\s*,\s*{_NUM}\s*\)\s*$",
+        re.IGNORECASE,
+    ),
+    "CLICK": re.compile(r"CLICK\s*\(\s*(\d+)\s*\)\s*$", re.IGNORECASE),
+    "TYPE": re.compile(r'TYPE\s*\(\s*(\d+)\s*,\s*["\']([^"\']*)["\']\s*\)\s*$', re.IGNORECASE),
+    "PRESS": re.compile(r'PRESS\s*\(\s*["\']([^"\']+)["\']\s*\)\s*$', re.IGNORECASE),
+}
+
+_CODE_FENCE_RE = re.compile(r"```[\w]*\n?")
+_ACTION_IN_TEXT_RE = re.compile(
+    r'(CLICK_XY\s*\(\s*-?\d+(?:\.\d+)?\s*,\s*-?\d+(?:\.\d+)?\s*\)|CLICK_RECT\s*\(\s*-?\d+(?:\.\d+)?\s*,\s*-?\d+(?:\.\d+)?\s*,\s*-?\d+(?:\.\d+)?\s*,\s*-?\d+(?:\.\d+)?\s*\)|CLICK\s*\(\s*\d+\s*\)|TYPE\s*\(\s*\d+\s*,\s*["\'].*?["\']\s*\)|PRESS\s*\(\s*["\'].*?["\']\s*\)|FINISH\s*\(\s*\))',
+    re.IGNORECASE,
+)
+
 
 @dataclass(frozen=True)
 class StepVerification:
@@ -54,6 +76,10 @@ class RuntimeStep:
     vision_executor_enabled: bool = True
     max_vision_executor_attempts: int = 1
 
+    # Run `eventually` verifications concurrently. Only for checks that do not depend on
+    # each other; the default evaluates them one after another in declaration order.
+    parallel_verifications: bool = False
+
 
 @dataclass(frozen=True)
 class ActOnceResult:
@@ -394,24 +420,55 @@ class RuntimeAgent:
             # No explicit verifications provided: treat as pass.
             return True
 
-        all_ok = True
-        for v in step.verifications:
-            if v.eventually:
-                ok = await self.runtime.check(
-                    v.predicate, label=v.label, required=v.required
-                ).eventually(
-                    timeout_s=v.timeout_s,
-                    poll_s=v.poll_s,
-                    max_snapshot_attempts=v.max_snapshot_attempts,
-                    min_confidence=v.min_confidence,
-                    vision_provider=self.vision_verifier,
-                )
-            else:
-                ok = self.runtime.assert_(v.predicate, label=v.label, required=v.required)
-            all_ok = all_ok and ok
+        if not step.parallel_verifications:
+            all_ok = True
+            for v in step.verifications:
+                ok = await self._verify_one(v)
+                all_ok = all_ok and ok
+            # Respect required verifications semantics.
+            return self.runtime.required_assertions_passed() and all_ok
+
+        # Opt-in for independent checks: `eventually` polls run concurrently so the step waits
+        # for the slowest one rather than the sum of their timeouts. One-shot checks then run
+        # in order against the final page state, as they would after a sequential wait.
+        recorded_from = len(self.runtime._assertions_this_step)
+        record_index: dict[int, int] = {}
+
+        async def _verify_and_tag(i: int, v: StepVerification) -> bool:
+            ok = await self._verify_one(v)
+            # No await since the check recorded its final outcome, so it is the last record.
+            if len(self.runtime._assertions_this_step) > recorded_from:
+                record_index[id(self.runtime._assertions_this_step[-1])] = i
+            return ok
+
+        indexed = list(enumerate(step.verifications))
+        results = await asyncio.gather(*(_verify_and_tag(i, v) for i, v in indexed if v.eventually))
+        for i, v in indexed:
+            if not v.eventually:
+                results.append(await _verify_and_tag(i, v))
+
+        # Keep step_end assertions in declaration order regardless of completion order.
+        recorded = self.runtime._assertions_this_step[recorded_from:]
+        recorded.sort(key=lambda a: record_index.get(id(a), len(indexed)))
+        self.runtime._assertions_this_step[recorded_from:] = recorded
 
         # Respect required verifications semantics.
-        return self.runtime.required_assertions_passed() and all_ok
+        return self.runtime.required_assertions_passed() and all(results)
+
+    async def _verify_one(self, v: StepVerification) -> bool:
+        if v.eventually:
+            return await self.runtime.check(
+                v.predicate, label=v.label, required=v.required
+            ).eventually(
+                timeout_s=v.timeout_s,
+                poll_s=v.poll_s,
+                max_snapshot_attempts=v.max_snapshot_attempts,
+                min_confidence=v.min_confidence,
+                vision_provider=self.vision_verifier,
+                # Actions run through _execute_action(), which records each one.
+                reuse_snapshot=True,
+            )
+        return self.runtime.assert_(v.predicate, label=v.label, required=v.required)
 
     async def _execute_action(self, *, action: str, snap: Snapshot | None, step_goal: str | None) -> None:
         url = None
@@ -673,46 +730,34 @@ No explanations, no markdown.
     ]:
         action = action.strip()
 
-        if re.match(r"FINISH\s*\(\s*\)\s*$", action, re.IGNORECASE):
-            return "finish", {}
-
-        if m := re.match(
-            r"CLICK_XY\s*\(\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*\)\s*$",
-            action,
-            re.IGNORECASE,
-        ):
-            return "click_xy", {"x": float(m.group(1)), "y": float(m.group(2))}
-
-        if m := re.match(
-            r"CLICK_RECT\s*\(\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*\)\s*$",
-            action,
-            re.IGNORECASE,
-        ):
-            return "click_rect", {
-                "x": float(m.group(1)),
-                "y": float(m.group(2)),
-                "w": float(m.group(3)),
-                "h": float(m.group(4)),
-            }
-
-        if m := re.match(r"CLICK\s*\(\s*(\d+)\s*\)\s*$", action, re.IGNORECASE):
-            return "click", {"id": int(m.group(1))}
-
-        if m := re.match(
-            r'TYPE\s*\(\s*(\d+)\s*,\s*["\']([^"\']*)["\']\s*\)\s*$',
-            action,
-            re.IGNORECASE,
-        ):
-            return "type", {"id": int(m.group(1)), "text": m.group(2)}
-
-        if m := re.match(r'PRESS\s*\(\s*["\']([^"\']+)["\']\s*\)\s*$', action, re.IGNORECASE):
-            return "press", {"key": m.group(1)}
+        # Dispatch on the op name so only that action's pattern is tried.
+        op = action.split("(", 1)[0].strip().upper()
+        pattern = _ACTION_PATTERNS.get(op)
+        m = pattern.match(action) if pattern is not None else None
+
+        if m is not None:
+            if op == "FINISH":
+                return "finish", {}
+            if op == "CLICK_XY":
+                return "click_xy", {"x": float(m.group(1)), "y": float(m.group(2))}
+            if op == "CLICK_RECT":
+                return "click_rect", {
+                    "x": float(m.group(1)),
+                    "y": float(m.group(2)),
+                    "w": float(m.group(3)),
+                    "h": float(m.group(4)),
+                }
+            if op == "CLICK":
+                return "click", {"id": int(m.group(1))}
+            if op == "TYPE":
+                return "type", {"id": int(m.group(1)), "text": m.group(2)}
+            if op == "PRESS":
+                return "press", {"key": m.group(1)}
 
         raise ValueError(f"Unknown action format: {action}")
 
     def _extract_action_from_text(self, text: str) -> str:
         # Keep consistent with LLMInteractionHandler.extract_action, but without DOM context dependency.
-        text = re.sub(r"```[\w]*\n?", "", text).strip()
-        pat = r'(CLICK_XY\s*\(\s*-?\d+(?:\.\d+)?\s*,\s*-?\d+(?:\.\d+)?\s*\)|CLICK_RECT\s*\(\s*-?\d+(?:\.\d+)?\s*,\s*-?\d+(?:\.\d+)?\s*,\s*-?\d+(?:\.\d+)?\s*,\s*-?\d+(?:\.\d+)?\s*\)|CLICK\s*\(\s*\d+\s*\)|TYPE\s*\(\s*\d+\s*,\s*["\'].*?["\']\s*\)|PRESS\s*\(\s*["\'].*?["\']\s*\)|FINISH\s*\(\s*\))'
-        m = re.search(pat, text, re.IGNORECASE)
+        text = _CODE_FENCE_RE.sub("", text).strip()
+        m = _ACTION_IN_TEXT_RE.search(text)
         return m.group(1) if m else text
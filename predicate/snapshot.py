@@ -19,6 +19,14 @@ from .sentience_methods import SentienceMethod
 # Maximum payload size for API requests (10MB server limit)
 MAX_PAYLOAD_BYTES = 10 * 1024 * 1024
 
+# Shared gateway HTTP clients. Agents post a snapshot on every step (and on every
+# eventually() poll), so keeping connections alive avoids a fresh TCP/TLS handshake
+# per call. httpx connections are bound to the event loop that opened them, so the
+# async client is kept per loop, next to a parked async generator that closes it when
+# the loop shuts down its async generators (asyncio.run() does this before closing).
+_gateway_session: requests.Session | None = None
+_async_gateway_clients: dict[asyncio.AbstractEventLoop, tuple[Any, Any]] = {}
+
 
 class SnapshotGatewayError(RuntimeError):
     """
@@ -187,6 +195,72 @@ class SnapshotGatewayError(RuntimeError):
         )
 
 
+def _get_gateway_session() -> requests.Session:
+    """Return the process-wide keep-alive session used for sync gateway calls."""
+    global _gateway_session
+    if _gateway_session is None:
+        _gateway_session = requests.Session()
+    return _gateway_session
+
+
+async def _close_on_loop_shutdown(loop: asyncio.AbstractEventLoop, client: Any) -> Any:
+    """Park until aclose()d (by aclose_gateway_clients() or loop shutdown), then close `client`."""
+    try:
+        yield
+    finally:
+        entry = _async_gateway_clients.get(loop)
+        if entry is not None and entry[0] is client:
+            del _async_gateway_clients[loop]
+        await client.aclose()
+
+
+async def _get_async_gateway_client() -> Any:
+    """Return the keep-alive httpx.AsyncClient for the running event loop."""
+    # Lazy import httpx - only needed for async API calls
+    import httpx
+
+    # Loops closed without shutting down async generators never ran the finalizer.
+    for stale in [loop for loop in _async_gateway_clients if loop.is_closed()]:
+        del _async_gateway_clients[stale]
+
+    loop = asyncio.get_running_loop()
+    entry = _async_gateway_clients.get(loop)
+    if entry is not None and not getattr(entry[0], "is_closed", False):
+        return entry[0]
+    if entry is not None:
+        await entry[1].aclose()
+
+    client = httpx.AsyncClient()
+    finalizer = _close_on_loop_shutdown(loop, client)
+    await finalizer.__anext__()
+    _async_gateway_clients[loop] = (client, finalizer)
+    return client
+
+
+def close_gateway_clients() -> None:
+    """
+    Close the shared sync gateway session.
+
+    Safe to call at any time; the next gateway call opens a new session.
+    """
+    global _gateway_session
+    session, _gateway_session = _gateway_session, None
+    if session is not None:
+        session.close()
+
+
+async def aclose_gateway_clients() -> None:
+    """
+    Close the shared async gateway client for the running event loop.
+
+    The client is also closed automatically when the loop shuts down (e.g. at the end
+    of asyncio.run()); the next gateway call opens a new client.
+    """
+    entry = _async_gateway_clients.get(asyncio.get_running_loop())
+    if entry is not None:
+        await entry[1].aclose()
+
+
 def _is_execution_context_destroyed_error(e: Exception) -> bool:
     """
     Playwright can throw while a navigation is in-flight, invalidating the JS execution context.
@@ -341,7 +415,7 @@ def _post_snapshot_to_gateway_sync(
 
     try:
         timeout = 30 if timeout_s is None else float(timeout_s)
-        response = requests.post(
+        response = _get_gateway_session().post(
             f"{api_url}/v1/snapshot",
             data=payload_json,
             headers=headers,
@@ -380,22 +454,23 @@ async def _post_snapshot_to_gateway_async(
     }
 
     timeout = 30.0 if timeout_s is None else float(timeout_s)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            response = await client.post(
-                f"{api_url}/v1/snapshot",
-                content=payload_json,
-                headers=headers,
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            raise SnapshotGatewayError.from_httpx(e) from e
-        except httpx.RequestError as e:
-            raise SnapshotGatewayError.from_httpx(e) from e
-        except Exception as e:
-            # JSON decode or other unexpected issues — keep details if possible.
-            raise SnapshotGatewayError.from_httpx(e) from e
+    client = await _get_async_gateway_client()
+    try:
+        response = await client.post(
+            f"{api_url}/v1/snapshot",
+            content=payload_json,
+            headers=headers,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        raise SnapshotGatewayError.from_httpx(e) from e
+    except httpx.RequestError as e:
+        raise SnapshotGatewayError.from_httpx(e) from e
+    except Exception as e:
+        # JSON decode or other unexpected issues — keep details if possible.
+        raise SnapshotGatewayError.from_httpx(e) from e
 
 
 def _merge_api_result_with_local(
@@ -943,18 +1018,16 @@ async def _snapshot_via_api_async(
     }
 
     try:
-        # Lazy import httpx - only needed for async API calls
-        import httpx
-
         timeout = 30.0 if options.gateway_timeout_s is None else float(options.gateway_timeout_s)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                f"{api_url}/v1/snapshot",
-                content=payload_json,
-                headers=headers,
-            )
-            response.raise_for_status()
-            api_result = response.json()
+        client = await _get_async_gateway_client()
+        response = await client.post(
+            f"{api_url}/v1/snapshot",
+            content=payload_json,
+            headers=headers,
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        api_result = response.json()
 
         # Extract screenshot format from data URL if not provided
         if screenshot_data_url and not screenshot_format:
@@ -12,6 +12,14 @@ from typing import Any, Optional
 
 from .models import TraceStats
 
+# orjson is optional: much faster encoding when installed, stdlib json otherwise
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class TraceFileManager:
     """
@@ -20,17 +28,28 @@ class TraceFileManager:
     Provides static methods for file operations shared across trace sinks.
     """
 
+    @staticmethod
+    def encode_event(event: dict[str, Any]) -> bytes:
+        """Encode one event as a UTF-8 JSONL line (trailing newline included)."""
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(
+                    event, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+                )
+            except (TypeError, orjson.JSONEncodeError):
+                pass  # e.g. ints beyond 64 bits; stdlib json handles those
+        return (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+
     @staticmethod
     def write_event(file_handle: Any, event: dict[str, Any]) -> None:
         """
         Write a trace event to a file handle as JSONL.
 
         Args:
-            file_handle: Open file handle (must be writable)
+            file_handle: Open text-mode file handle (must be writable)
             event: Event dictionary to write
         """
-        json_str = json.dumps(event, ensure_ascii=False)
-        file_handle.write(json_str + "\n")
+        file_handle.write(TraceFileManager.encode_event(event).decode("utf-8"))
         file_handle.flush()  # Ensure written to disk
 
     @staticmethod
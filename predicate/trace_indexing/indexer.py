@@ -86,11 +86,9 @@ def _compute_action_digest(action_data: dict[str, Any]) -> str:
 
 def _compute_file_sha256(file_path: str) -> str:
     """Compute SHA256 hash of entire file."""
-    sha256 = hashlib.sha256()
+    # file_digest reads into a reusable buffer and hashes without the GIL.
     with open(file_path, "rb") as f:
-        while chunk := f.read(8192):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def build_trace_index(trace_path: str) -> TraceIndex:
@@ -15,6 +15,8 @@ from typing import Any, Optional
 from .models import TraceStats
 from .trace_file_manager import TraceFileManager
 
+_encode_jsonl = TraceFileManager.encode_event
+
 
 @dataclass
 class TraceEvent:
@@ -80,21 +82,30 @@ class JsonlTraceSink(TraceSink):
     """
     JSONL file sink for trace events.
 
-    Writes one JSON object per line to a file.
+    Writes one JSON object per line to a file. Writes are buffered, so a run does
+    not pay one syscall per event. The buffer is flushed when it fills, on
+    flush()/close(), and by the first emit after `flush_interval_s` seconds since
+    the last flush. There is no background timer: an idle sink keeps its tail
+    buffered until the next emit or flush().
     """
 
-    def __init__(self, path: str | Path):
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, path: str | Path, *, flush_interval_s: float = 1.0):
         """
         Initialize JSONL sink.
 
         Args:
             path: File path to write traces to
+            flush_interval_s: Minimum seconds between flushes triggered by emit()
         """
         self.path = Path(path)
         TraceFileManager.ensure_directory(self.path)
+        self.flush_interval_s = flush_interval_s
 
-        # Open file in append mode with line buffering
-        self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+        # Open file in binary append mode with a large write buffer
+        self._file = open(self.path, "ab", buffering=self.BUFFER_SIZE)
+        self._last_flush = time.monotonic()
 
     def emit(self, event: dict[str, Any]) -> None:
         """
@@ -103,7 +114,17 @@ class JsonlTraceSink(TraceSink):
         Args:
             event: Event dictionary
         """
-        TraceFileManager.write_event(self._file, event)
+        self._file.write(_encode_jsonl(event))
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval_s:
+            self._file.flush()
+            self._last_flush = now
+
+    def flush(self) -> None:
+        """Write buffered events to disk."""
+        if hasattr(self, "_file") and not self._file.closed:
+            self._file.flush()
+            self._last_flush = time.monotonic()
 
     def close(self) -> None:
         """Close the file and generate index."""
@@ -122,6 +143,7 @@ class JsonlTraceSink(TraceSink):
         """
         try:
             # Read trace file to extract stats
+            self.flush()
             events = TraceFileManager.read_events(self.path)
             return TraceFileManager.extract_stats(events)
         except Exception:
@@ -171,6 +193,8 @@ class Tracer:
         screenshot_processor: Optional function to process screenshots before emission.
                             Takes base64 string, returns processed base64 string.
                             Useful for PII redaction or custom image processing.
+        include_nearest_matches: Attach nearest-element suggestions to failed selector
+                            assertions (AgentRuntime). Disable when nothing reads them.
 
     Example:
         >>> from predicate import Tracer, JsonlTraceSink
@@ -194,6 +218,7 @@ class Tracer:
     run_id: str
     sink: TraceSink
     screenshot_processor: Callable[[str], str] | None = None
+    include_nearest_matches: bool = True
     seq: int = field(default=0, init=False)
     # Stats tracking
     total_steps: int = field(default=0, init=False)
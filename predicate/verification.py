@@ -25,13 +25,15 @@ Example usage:
 
 from __future__ import annotations
 
+import functools
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from .models import Snapshot
+    from .models import Snapshot, SnapshotColumns
 
 
 @dataclass
@@ -75,6 +77,85 @@ class AssertContext:
 Predicate = Callable[[AssertContext], AssertOutcome]
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_selector(selector: str) -> Mapping[str, Any]:
+    """
+    Parse a selector string with the query DSL parser, memoized by selector.
+
+    Selector-based predicate factories resolve their selector once at construction,
+    so repeated assertions and `eventually()` polls reuse the parsed query instead of
+    re-parsing it per evaluation. The cached query is shared, so it is returned read-only.
+    Parse errors propagate and are not cached. Use `_parse_selector.cache_clear()` in tests.
+    """
+    from .query import parse_selector
+
+    return MappingProxyType(parse_selector(selector))
+
+
+def _columns(snap: Snapshot) -> SnapshotColumns:
+    from . import models
+
+    if isinstance(snap, models.Snapshot):
+        return snap.columns()
+    # Duck-typed snapshots (tests, adapters): build an uncached view.
+    return models.SnapshotColumns.from_elements(list(snap.elements))
+
+
+# Selector keys `_scan_columns` evaluates with the same semantics as query.match_element.
+_COLUMN_KEYS = frozenset({"role", "text_contains", "name_contains"})
+
+
+def _scan_columns(parsed: Mapping[str, Any], cols: SnapshotColumns) -> tuple[int, ...]:
+    role = parsed.get("role")
+    if role is None:
+        candidates: Any = range(len(cols.roles))
+    else:
+        candidates = [i for i, r in enumerate(cols.roles) if r == role]
+
+    text = parsed.get("text_contains")
+    if text is not None:
+        needle, texts = text.lower(), cols.lower_texts
+        candidates = [i for i in candidates if texts[i] and needle in texts[i]]
+
+    name = parsed.get("name_contains")
+    if name is not None:
+        needle, names = name.lower(), cols.lower_names
+        candidates = [i for i in candidates if names[i] and needle in names[i]]
+
+    return tuple(candidates)
+
+
+def _match_indices(
+    snap: Snapshot, selector: str, parsed: Mapping[str, Any], cols: SnapshotColumns
+) -> tuple[int, ...]:
+    """
+    Indices (into `snap.elements`) of elements matching a parsed selector.
+
+    Predicates only test membership/counts/state, so this skips query()'s importance
+    sort. Selectors built only from `role=`, `text~` and `name~` (the common case)
+    scan the snapshot columns instead of running the generic matcher; `role=link`
+    keeps the generic path because it also matches elements with an href. Results
+    are memoized on `cols` by selector, so further assertions against the same
+    snapshot skip the scan.
+    """
+    hit = cols.matches.get(selector)
+    if hit is not None:
+        return hit
+
+    if parsed.keys() <= _COLUMN_KEYS and parsed.get("role") != "link":
+        indices = _scan_columns(parsed, cols)
+    else:
+        from .query import match_element
+
+        indices = tuple(
+            i
+            for i, el in enumerate(snap.elements)
+            if match_element(el, parsed)  # type: ignore[arg-type]
+        )
+    cols.matches[selector] = indices
+    return indices
+
+
 def download_completed(filename_substring: str | None = None) -> Predicate:
     """
     Predicate that passes if a browser download has completed.
@@ -182,6 +263,7 @@ def exists(selector: str) -> Predicate:
         >>> pred = exists("text~'Results'")
         >>> # Will check if snapshot contains elements with "Results" in text
     """
+    parsed = _parse_selector(selector)
 
     def _pred(ctx: AssertContext) -> AssertOutcome:
         snap = ctx.snapshot
@@ -192,17 +274,14 @@ def exists(selector: str) -> Predicate:
                 details={"selector": selector, "reason_code": "no_snapshot"},
             )
 
-        # Import here to avoid circular imports
-        from .query import query
-
-        matches = query(snap, selector)
-        ok = len(matches) > 0
+        matched = len(_match_indices(snap, selector, parsed, _columns(snap)))
+        ok = matched > 0
         return AssertOutcome(
             passed=ok,
             reason="" if ok else f"no elements matched selector: {selector}",
             details={
                 "selector": selector,
-                "matched": len(matches),
+                "matched": matched,
                 "reason_code": "ok" if ok else "no_match",
             },
         )
@@ -226,6 +305,7 @@ def not_exists(selector: str) -> Predicate:
         >>> pred = not_exists("text~'Loading'")
         >>> # Will pass if no elements contain "Loading" text
     """
+    parsed = _parse_selector(selector)
 
     def _pred(ctx: AssertContext) -> AssertOutcome:
         snap = ctx.snapshot
@@ -236,16 +316,14 @@ def not_exists(selector: str) -> Predicate:
                 details={"selector": selector, "reason_code": "no_snapshot"},
             )
 
-        from .query import query
-
-        matches = query(snap, selector)
-        ok = len(matches) == 0
+        matched = len(_match_indices(snap, selector, parsed, _columns(snap)))
+        ok = matched == 0
         return AssertOutcome(
             passed=ok,
-            reason="" if ok else f"found {len(matches)} elements matching: {selector}",
+            reason="" if ok else f"found {matched} elements matching: {selector}",
             details={
                 "selector": selector,
-                "matched": len(matches),
+                "matched": matched,
                 "reason_code": "ok" if ok else "unexpected_match",
             },
         )
@@ -269,6 +347,7 @@ def element_count(selector: str, *, min_count: int = 0, max_count: int | None =
         >>> pred = element_count("role=button", min_count=1, max_count=5)
         >>> # Will pass if 1-5 buttons found
     """
+    parsed = _parse_selector(selector)
 
     def _pred(ctx: AssertContext) -> AssertOutcome:
         snap = ctx.snapshot
@@ -279,10 +358,7 @@ def element_count(selector: str, *, min_count: int = 0, max_count: int | None =
                 details={"selector": selector, "min_count": min_count, "max_count": max_count},
             )
 
-        from .query import query
-
-        matches = query(snap, selector)
-        count = len(matches)
+        count = len(_match_indices(snap, selector, parsed, _columns(snap)))
 
         ok = count >= min_count
         if max_count is not None:
@@ -427,6 +503,7 @@ def custom(check_fn: Callable[[AssertContext], bool], label: str = "custom") ->
 
 def is_enabled(selector: str) -> Predicate:
     """Passes if any matched element is not disabled (disabled=None treated as enabled)."""
+    parsed = _parse_selector(selector)
 
     def _pred(ctx: AssertContext) -> AssertOutcome:
         snap = ctx.snapshot
@@ -435,9 +512,8 @@ def is_enabled(selector: str) -> Predicate:
                 passed=False, reason="no snapshot available", details={"selector": selector}
             )
 
-        from .query import query
-
-        matches = query(snap, selector)
+        cols = _columns(snap)
+        matches = _match_indices(snap, selector, parsed, cols)
         if not matches:
             return AssertOutcome(
                 passed=False,
@@ -445,7 +521,7 @@ def is_enabled(selector: str) -> Predicate:
                 details={"selector": selector, "matched": 0, "reason_code": "no_match"},
             )
 
-        ok = any(m.disabled is not True for m in matches)
+        ok = any(cols.disabled[i] is not True for i in matches)
         return AssertOutcome(
             passed=ok,
             reason="" if ok else f"all matched elements are disabled: {selector}",
@@ -461,6 +537,7 @@ def is_enabled(selector: str) -> Predicate:
 
 def is_disabled(selector: str) -> Predicate:
     """Passes if any matched element is disabled."""
+    parsed = _parse_selector(selector)
 
     def _pred(ctx: AssertContext) -> AssertOutcome:
         snap = ctx.snapshot
@@ -469,10 +546,9 @@ def is_disabled(selector: str) -> Predicate:
                 passed=False, reason="no snapshot available", details={"selector": selector}
             )
 
-        from .query import query
-
-        matches = query(snap, selector)
-        ok = any(m.disabled is True for m in matches)
+        cols = _columns(snap)
+        matches = _match_indices(snap, selector, parsed, cols)
+        ok = any(cols.disabled[i] is True for i in matches)
         return AssertOutcome(
             passed=ok,
             reason="" if ok else f"no matched elements are disabled: {selector}",
@@ -488,6 +564,7 @@ def is_disabled(selector: str) -> Predicate:
 
 def is_checked(selector: str) -> Predicate:
     """Passes if any matched element is checked."""
+    parsed = _parse_selector(selector)
 
     def _pred(ctx: AssertContext) -> AssertOutcome:
         snap = ctx.snapshot
@@ -496,10 +573,9 @@ def is_checked(selector: str) -> Predicate:
                 passed=False, reason="no snapshot available", details={"selector": selector}
             )
 
-        from .query import query
-
-        matches = query(snap, selector)
-        ok = any(m.checked is True for m in matches)
+        cols = _columns(snap)
+        matches = _match_indices(snap, selector, parsed, cols)
+        ok = any(cols.checked[i] is True for i in matches)
         return AssertOutcome(
             passed=ok,
             reason="" if ok else f"no matched elements are checked: {selector}",
@@ -515,6 +591,7 @@ def is_checked(selector: str) -> Predicate:
 
 def is_unchecked(selector: str) -> Predicate:
     """Passes if any matched element is not checked (checked=None treated as unchecked)."""
+    parsed = _parse_selector(selector)
 
     def _pred(ctx: AssertContext) -> AssertOutcome:
         snap = ctx.snapshot
@@ -523,10 +600,9 @@ def is_unchecked(selector: str) -> Predicate:
                 passed=False, reason="no snapshot available", details={"selector": selector}
             )
 
-        from .query import query
-
-        matches = query(snap, selector)
-        ok = any(m.checked is not True for m in matches)
+        cols = _columns(snap)
+        matches = _match_indices(snap, selector, parsed, cols)
+        ok = any(cols.checked[i] is not True for i in matches)
         return AssertOutcome(
             passed=ok,
             reason="" if ok else f"all matched elements are checked: {selector}",
@@ -542,6 +618,7 @@ def is_unchecked(selector: str) -> Predicate:
 
 def value_equals(selector: str, expected: str) -> Predicate:
     """Passes if any matched element has value exactly equal to expected."""
+    parsed = _parse_selector(selector)
 
     def _pred(ctx: AssertContext) -> AssertOutcome:
         snap = ctx.snapshot
@@ -550,10 +627,9 @@ def value_equals(selector: str, expected: str) -> Predicate:
                 passed=False, reason="no snapshot available", details={"selector": selector}
             )
 
-        from .query import query
-
-        matches = query(snap, selector)
-        ok = any((m.value or "") == expected for m in matches)
+        cols = _columns(snap)
+        matches = _match_indices(snap, selector, parsed, cols)
+        ok = any((cols.values[i] or "") == expected for i in matches)
         return AssertOutcome(
             passed=ok,
             reason="" if ok else f"no matched elements had value == '{expected}'",
@@ -570,6 +646,8 @@ def value_equals(selector: str, expected: str) -> Predicate:
 
 def value_contains(selector: str, substring: str) -> Predicate:
     """Passes if any matched element value contains substring (case-insensitive)."""
+    parsed = _parse_selector(selector)
+    needle = substring.lower()
 
     def _pred(ctx: AssertContext) -> AssertOutcome:
         snap = ctx.snapshot
@@ -578,10 +656,9 @@ def value_contains(selector: str, substring: str) -> Predicate:
                 passed=False, reason="no snapshot available", details={"selector": selector}
             )
 
-        from .query import query
-
-        matches = query(snap, selector)
-        ok = any(substring.lower() in (m.value or "").lower() for m in matches)
+        cols = _columns(snap)
+        matches = _match_indices(snap, selector, parsed, cols)
+        ok = any(needle in (cols.values[i] or "").lower() for i in matches)
         return AssertOutcome(
             passed=ok,
             reason="" if ok else f"no matched elements had value containing '{substring}'",
@@ -598,6 +675,7 @@ def value_contains(selector: str, substring: str) -> Predicate:
 
 def is_expanded(selector: str) -> Predicate:
     """Passes if any matched element is expanded."""
+    parsed = _parse_selector(selector)
 
     def _pred(ctx: AssertContext) -> AssertOutcome:
         snap = ctx.snapshot
@@ -606,10 +684,9 @@ def is_expanded(selector: str) -> Predicate:
                 passed=False, reason="no snapshot available", details={"selector": selector}
             )
 
-        from .query import query
-
-        matches = query(snap, selector)
-        ok = any(m.expanded is True for m in matches)
+        cols = _columns(snap)
+        matches = _match_indices(snap, selector, parsed, cols)
+        ok = any(cols.expanded[i] is True for i in matches)
         return AssertOutcome(
             passed=ok,
             reason="" if ok else f"no matched elements are expanded: {selector}",
@@ -625,6 +702,7 @@ def is_expanded(selector: str) -> Predicate:
 
 def is_collapsed(selector: str) -> Predicate:
     """Passes if any matched element is not expanded (expanded=None treated as collapsed)."""
+    parsed = _parse_selector(selector)
 
     def _pred(ctx: AssertContext) -> AssertOutcome:
         snap = ctx.snapshot
@@ -633,10 +711,9 @@ def is_collapsed(selector: str) -> Predicate:
                 passed=False, reason="no snapshot available", details={"selector": selector}
             )
 
-        from .query import query
-
-        matches = query(snap, selector)
-        ok = any(m.expanded is not True for m in matches)
+        cols = _columns(snap)
+        matches = _match_indices(snap, selector, parsed, cols)
+        ok = any(cols.expanded[i] is not True for i in matches)
         return AssertOutcome(
             passed=ok,
             reason="" if ok else f"all matched elements are expanded: {selector}",
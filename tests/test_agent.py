@@ -101,6 +101,30 @@ def test_anthropic_provider_init():
     assert provider.supports_json_mode() is False
 
 
+def test_anthropic_provider_cache_system_prompt():
+    """Test cache_system_prompt sends the system prompt as a cache_control block"""
+    client = Mock()
+    client.messages.create.return_value = Mock(
+        content=[Mock(text="CLICK(1)")],
+        usage=Mock(input_tokens=10, output_tokens=2),
+        model="claude-3-sonnet",
+        stop_reason="end_turn",
+    )
+    with patch("predicate.llm_provider.require_package", return_value=Mock(return_value=client)):
+        plain = AnthropicProvider(api_key="test-key", model="claude-3-sonnet")
+        cached = AnthropicProvider(
+            api_key="test-key", model="claude-3-sonnet", cache_system_prompt=True
+        )
+
+    plain.generate("SYSTEM", "user")
+    assert client.messages.create.call_args.kwargs["system"] == "SYSTEM"
+
+    cached.generate("SYSTEM", "user")
+    assert client.messages.create.call_args.kwargs["system"] == [
+        {"type": "text", "text": "SYSTEM", "cache_control": {"type": "ephemeral"}}
+    ]
+
+
 # ========== SentienceAgent Tests ==========
 
 
@@ -5,11 +5,15 @@ These tests verify the AgentRuntime works correctly with the new
 BrowserBackend-based architecture.
 """
 
+import asyncio
+import hashlib
+import time
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from predicate.agent_runtime import AgentRuntime
+from predicate.agent_runtime import AgentRuntime, _SnapshotLimitGrowth
 from predicate.models import EvaluateJsRequest, SnapshotOptions, TabInfo
 from predicate.verification import AssertContext, AssertOutcome
 
@@ -165,6 +169,117 @@ class TestAgentRuntimeInit:
         assert runtime._snapshot_options.sentience_api_key == "sk_pro_key"
         assert runtime._snapshot_options.use_api is True
 
+    def test_later_edits_to_caller_options_do_not_split_snapshot_paths(self) -> None:
+        """Defaults are copied, so all snapshot paths see the same options."""
+        options = SnapshotOptions(limit=50, goal="original")
+        runtime = AgentRuntime(
+            backend=MockBackend(),
+            tracer=MockTracer(),
+            snapshot_options=options,
+            sentience_api_key="sk",
+        )
+        assert options.sentience_api_key is None
+
+        options.goal = "edited"
+        options.limit = 7
+
+        _, plain = runtime._merged_snapshot_options({})
+        merged_dict, merged = runtime._merged_snapshot_options({"show_overlay": True})
+        assert (plain.goal, plain.limit) == ("original", 50)
+        assert (merged.goal, merged.limit) == ("original", 50)
+        assert merged_dict["goal"] == "original"
+
+
+def test_capabilities_cache_static_probes_but_track_downloads() -> None:
+    backend = MockBackend()
+    tracer = MockTracer()
+    runtime = AgentRuntime(backend=backend, tracer=tracer)
+
+    caps = runtime.capabilities()
+    assert caps.tabs is True
+    assert caps.evaluate_js is True
+    assert caps.downloads is False
+
+    backend.downloads = [{"status": "completed"}]
+    assert runtime.can("downloads") is True
+
+    runtime.backend = MagicMock(spec=["eval"])
+    caps = runtime.capabilities()
+    assert caps.tabs is False
+    assert caps.evaluate_js is True
+
+
+def test_snapshot_limit_growth_schedule_defaults_and_clamps() -> None:
+    assert _SnapshotLimitGrowth.parse(None, snapshot_kwargs=None, default_limit=50) is None
+
+    growth = _SnapshotLimitGrowth.parse(
+        {"step": "100", "max_limit": 900}, snapshot_kwargs={"limit": 60}, default_limit=50
+    )
+    assert growth == _SnapshotLimitGrowth(
+        apply_on="only_on_fail", start=60, step=100, max_limit=900
+    )
+    assert [growth.limit_for_attempt(n) for n in (1, 2, 5, 9)] == [60, 160, 460, 500]
+    assert growth.fixed_limit == 60
+
+    growth = _SnapshotLimitGrowth.parse(
+        {"apply_on": "all", "start_limit": "bad"}, snapshot_kwargs=None, default_limit=None
+    )
+    assert (growth.apply_on, growth.start, growth.step, growth.max_limit) == ("all", 50, 50, 500)
+
+
+def test_snapshot_digest_is_memoized_per_snapshot() -> None:
+    runtime = AgentRuntime(backend=MockBackend(), tracer=MockTracer())
+    first = SimpleNamespace(url="https://example.com", timestamp="t1")
+    second = SimpleNamespace(url="https://example.com", timestamp="t2")
+
+    with patch("predicate.agent_runtime.hashlib.sha256", wraps=hashlib.sha256) as sha256:
+        digest = runtime._compute_snapshot_digest(first)
+        assert runtime._compute_snapshot_digest(first) == digest
+        assert sha256.call_count == 1
+
+        assert runtime._compute_snapshot_digest(second) != digest
+        assert sha256.call_count == 2
+
+    expected = hashlib.sha256(b"https://example.comt1").hexdigest()
+    assert digest == f"sha256:{expected}"
+
+
+def test_ctx_binds_property_downloads_but_reads_plain_attributes_live() -> None:
+    class _DownloadsBackend(MockBackend):
+        def __init__(self) -> None:
+            super().__init__()
+            self._downloads: list[dict] = []
+            self.probes = 0
+
+        @property
+        def downloads(self) -> list[dict]:
+            self.probes += 1
+            return self._downloads
+
+    backend = _DownloadsBackend()
+    runtime = AgentRuntime(backend=backend, tracer=MockTracer())
+    assert runtime._ctx().downloads == []
+    backend._downloads.append({"status": "completed"})
+    assert runtime._ctx().downloads == [{"status": "completed"}]
+    assert backend.probes == 1
+
+    plain = MockBackend()
+    runtime.backend = plain
+    assert runtime._ctx().downloads is None
+    plain.downloads = [{"status": "failed"}]
+    assert runtime._ctx().downloads == [{"status": "failed"}]
+
+
+def test_stringify_eval_value_is_compact_json_with_or_without_orjson() -> None:
+    value = {"title": "Café", "items": [1, 2], "big": 2**70}
+    expected = '{"title":"Café","items":[1,2],"big":1180591620717411303424}'
+
+    assert AgentRuntime._stringify_eval_value(value) == expected
+    with patch("predicate.agent_runtime.ORJSON_AVAILABLE", False):
+        assert AgentRuntime._stringify_eval_value(value) == expected
+    assert AgentRuntime._stringify_eval_value(None) == "null"
+    assert AgentRuntime._stringify_eval_value(2) == "2"
+
 
 @pytest.mark.asyncio
 async def test_scroll_by_verifies_delta_via_scrolltop() -> None:
@@ -191,6 +306,102 @@ async def test_scroll_by_verifies_delta_via_scrolltop() -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_artifact_timer_loop_keeps_fixed_cadence() -> None:
+    runtime = AgentRuntime(backend=MockBackend(), tracer=MockTracer())
+    runtime._artifact_buffer = MagicMock()
+    runtime._artifact_buffer.options.fps = 10  # 100ms interval
+    clock = {"t": 0.0}
+    captures = iter([0.03, 0.25, 0.01])  # seconds each capture takes; the second overruns
+
+    async def _capture() -> None:
+        clock["t"] += next(captures)
+
+    sleeps: list[float] = []
+
+    async def _sleep(s: float) -> None:
+        sleeps.append(s)
+        clock["t"] += s
+        if len(sleeps) == 3:
+            raise asyncio.CancelledError
+
+    with (
+        patch.object(runtime, "_capture_artifact_frame", side_effect=_capture),
+        patch("predicate.agent_runtime.time.monotonic", side_effect=lambda: clock["t"]),
+        patch("predicate.agent_runtime.asyncio.sleep", side_effect=_sleep),
+    ):
+        await runtime._artifact_timer_loop()
+
+    assert sleeps == pytest.approx([0.07, 0.0, 0.09])
+
+
+@pytest.mark.asyncio
+async def test_scroll_by_backs_off_poll_interval_up_to_poll_s() -> None:
+    backend = MagicMock()
+    backend.get_url = AsyncMock(return_value="https://example.com")
+    backend.wheel = AsyncMock(return_value=None)
+    backend.eval = AsyncMock(
+        side_effect=[{"top": 100}] * 6 + [{"top": 300}]  # before, 5 unchanged polls, moved
+    )
+    runtime = AgentRuntime(backend=backend, tracer=MockTracer())
+    runtime.begin_step("scroll backoff")
+
+    sleeps: list[float] = []
+
+    async def _sleep(s: float) -> None:
+        sleeps.append(s)
+
+    with patch("predicate.agent_runtime.asyncio.sleep", side_effect=_sleep):
+        ok = await runtime.scroll_by(200, timeout_s=10.0, poll_s=0.05, js_fallback=False)
+
+    assert ok is True
+    assert sleeps == pytest.approx([0.02, 0.03, 0.045, 0.05, 0.05])
+
+
+@pytest.mark.asyncio
+async def test_get_scroll_metrics_installs_page_helper_once() -> None:
+    backend = MagicMock()
+    backend.eval = AsyncMock(
+        side_effect=[{"top": 1}, {"top": 2}, None, {"top": 3}]  # install, call, lost, reinstall
+    )
+    runtime = AgentRuntime(backend=backend, tracer=MockTracer())
+
+    assert (await runtime._get_scroll_metrics())["top"] == 1
+    assert (await runtime._get_scroll_metrics())["top"] == 2
+    assert (await runtime._get_scroll_metrics())["top"] == 3
+
+    exprs = [c.args[0] for c in backend.eval.await_args_list]
+    assert "scrollingElement" in exprs[0]
+    assert "scrollingElement" not in exprs[1]
+    assert "scrollingElement" not in exprs[2]
+    assert "scrollingElement" in exprs[3]
+
+
+@pytest.mark.asyncio
+async def test_scroll_by_js_fallback_scrolls_and_measures_in_one_eval() -> None:
+    backend = MagicMock()
+    backend.get_url = AsyncMock(return_value="https://example.com")
+    backend.wheel = AsyncMock(return_value=None)
+    backend.eval = AsyncMock(
+        side_effect=[
+            {"top": 100},  # before
+            {"top": 100},  # wheel had no effect
+            {"top": 300},  # scrollBy + measure
+        ]
+    )
+    tracer = MockTracer()
+    runtime = AgentRuntime(backend=backend, tracer=tracer)
+    runtime.begin_step("scroll fallback")
+
+    ok = await runtime.scroll_by(200, timeout_s=1.0, poll_s=0.01)
+
+    assert ok is True
+    assert backend.eval.await_count == 3
+    assert "window.scrollBy(0, 200.0)" in backend.eval.await_args_list[2].args[0]
+    event = next(e for e in tracer.events if e["type"] == "verification")
+    assert event["data"]["details"]["js_fallback_used"] is True
+
+
 @pytest.mark.asyncio
 async def test_scroll_by_times_out_and_records_failed_verification() -> None:
     backend = MagicMock()
@@ -461,6 +672,30 @@ class TestAgentRuntimeAssertions:
         assert result is False
         assert runtime.is_task_done is False
 
+    def test_assert_many_records_each_with_shared_context(self) -> None:
+        """Test assert_many evaluates all predicates against one context."""
+        backend = MockBackend()
+        tracer = MockTracer()
+        runtime = AgentRuntime(backend=backend, tracer=tracer)
+        runtime.begin_step(goal="Test")
+
+        seen: list[AssertContext] = []
+
+        def make(passed: bool):
+            def _pred(ctx: AssertContext) -> AssertOutcome:
+                seen.append(ctx)
+                return AssertOutcome(passed=passed, reason="", details={})
+
+            return _pred
+
+        result = runtime.assert_many([(make(True), "first"), (make(False), "second")])
+
+        assert result is False
+        assert seen[0] is seen[1]
+        assert [a["label"] for a in runtime._assertions_this_step] == ["first", "second"]
+        assert [a["passed"] for a in runtime._assertions_this_step] == [True, False]
+        assert len(tracer.events) == 2
+
     @pytest.mark.asyncio
     async def test_check_eventually_records_final_only(self) -> None:
         backend = MockBackend()
@@ -503,6 +738,36 @@ class TestAgentRuntimeAssertions:
         assert len(tracer.events) >= 3
         assert all(e["type"] == "verification" for e in tracer.events)
 
+    @pytest.mark.asyncio
+    async def test_check_eventually_poll_wait_subtracts_attempt_time(self) -> None:
+        runtime = AgentRuntime(backend=MockBackend(), tracer=MockTracer())
+        runtime.begin_step(goal="Test")
+        clock = {"ns": 0}
+        urls = ["https://example.com", "https://example.com", "https://example.com/done"]
+
+        async def fake_snapshot(**_kwargs):
+            clock["ns"] += 100_000_000  # each snapshot takes 100ms
+            runtime.last_snapshot = MagicMock(url=urls.pop(0), elements=[])
+            return runtime.last_snapshot
+
+        waits: list[float] = []
+
+        async def fake_wait(timeout_s: float, *, since: tuple[int, int]) -> None:
+            waits.append(timeout_s)
+            clock["ns"] += int(timeout_s * 1e9)
+
+        runtime.snapshot = AsyncMock(side_effect=fake_snapshot)  # type: ignore[method-assign]
+        runtime._wait_for_page_change = fake_wait  # type: ignore[method-assign]
+
+        def pred(ctx: AssertContext) -> AssertOutcome:
+            return AssertOutcome(passed=(ctx.url or "").endswith("/done"))
+
+        with patch("predicate.agent_runtime.time.monotonic_ns", side_effect=lambda: clock["ns"]):
+            ok = await runtime.check(pred, label="cadence").eventually(timeout_s=5.0, poll_s=0.25)
+
+        assert ok is True
+        assert waits == pytest.approx([0.15, 0.15])
+
     @pytest.mark.asyncio
     async def test_check_eventually_snapshot_exhausted_min_confidence(self) -> None:
         backend = MockBackend()
@@ -585,6 +850,50 @@ class TestAgentRuntimeAssertions:
         assert rec.get("vision_fallback") is True
         assert rec["details"]["reason_code"] == "vision_fallback_pass"
 
+    @pytest.mark.asyncio
+    async def test_check_eventually_vision_fallback_reuses_verdict_for_same_screenshot(
+        self,
+    ) -> None:
+        backend = MockBackend()
+        backend.screenshot_png = AsyncMock(side_effect=[b"png-a", b"png-a", b"png-b"])
+        runtime = AgentRuntime(backend=backend, tracer=MockTracer())
+        runtime.begin_step(goal="Test")
+
+        low_diag = MagicMock()
+        low_diag.confidence = 0.1
+        low_diag.model_dump = lambda: {"confidence": 0.1}
+
+        async def fake_snapshot(**_kwargs):
+            runtime.last_snapshot = MagicMock(
+                url="https://example.com", elements=[], diagnostics=low_diag
+            )
+            return runtime.last_snapshot
+
+        runtime.snapshot = AsyncMock(side_effect=fake_snapshot)  # type: ignore[method-assign]
+        provider = MagicMock()
+        provider.supports_vision.return_value = True
+        provider.generate_with_image.return_value = MagicMock(content="NO")
+
+        def pred(_ctx: AssertContext) -> AssertOutcome:
+            return AssertOutcome(passed=False, reason="should not run", details={})
+
+        for _ in range(3):
+            ok = await runtime.check(pred, label="vision_cached").eventually(
+                timeout_s=5.0,
+                poll_s=0.0,
+                min_confidence=0.7,
+                max_snapshot_attempts=1,
+                vision_provider=provider,
+            )
+            assert ok is False
+
+        assert provider.generate_with_image.call_count == 2
+        assert [r["details"]["vision_response"] for r in runtime._assertions_this_step] == [
+            "NO",
+            "NO",
+            "NO",
+        ]
+
 
 class TestAgentRuntimeAssertionHelpers:
     """Tests for assertion helper methods."""
@@ -645,6 +954,52 @@ class TestAgentRuntimeAssertionHelpers:
 
         assert runtime.required_assertions_passed() is False
 
+    def test_nearest_matches_memoized_per_snapshot(self) -> None:
+        """Test failed-selector diagnostics are computed once per snapshot."""
+        backend = MockBackend()
+        tracer = MockTracer()
+        runtime = AgentRuntime(backend=backend, tracer=tracer)
+        elements = [
+            SimpleNamespace(id=1, role="button", text="Sign in", name=None),
+            SimpleNamespace(id=2, role="link", text="Sign up", name=None),
+            SimpleNamespace(id=3, role="button", text="Checkout", name=None),
+        ]
+        runtime.last_snapshot = MagicMock(elements=elements)
+
+        with patch.object(
+            AgentRuntime,
+            "_compute_nearest_matches",
+            wraps=AgentRuntime._compute_nearest_matches,
+        ) as compute:
+            first = runtime._nearest_matches("sign in", limit=2)
+            second = runtime._nearest_matches("sign in", limit=2)
+            assert compute.call_count == 1
+
+            runtime.last_snapshot = MagicMock(elements=elements)
+            runtime._nearest_matches("sign in", limit=2)
+            assert compute.call_count == 2
+
+        assert first == second
+        assert [m["id"] for m in first] == [1, 2]
+
+    def test_nearest_matches_skipped_when_tracer_opts_out(self) -> None:
+        """Test failed selector assertions skip suggestions the tracer doesn't want."""
+        tracer = MockTracer()
+        tracer.include_nearest_matches = False
+        runtime = AgentRuntime(backend=MockBackend(), tracer=tracer)
+        runtime.last_snapshot = MagicMock(
+            elements=[SimpleNamespace(id=1, role="button", text="Sign in", name=None)]
+        )
+        failing = lambda _ctx: AssertOutcome(  # noqa: E731
+            passed=False, reason="missing", details={"selector": "sign in"}
+        )
+
+        with patch.object(AgentRuntime, "_nearest_matches") as nearest:
+            runtime.assert_(failing, label="sign_in")
+
+        nearest.assert_not_called()
+        assert "nearest_matches" not in runtime._assertions_this_step[0]["details"]
+
 
 class TestAgentRuntimeFlushAssertions:
     """Tests for flush_assertions method."""
@@ -854,6 +1209,155 @@ class TestAgentRuntimeSnapshot:
         assert runtime.last_snapshot is mock_snapshot
 
 
+class TestAgentRuntimeSnapshotReuse:
+    """Tests for reusing an unchanged snapshot across verifications."""
+
+    def _runtime_with_legacy_browser(self):
+        backend = MockBackend()
+        tracer = MockTracer()
+        runtime = AgentRuntime(backend=backend, tracer=tracer)
+
+        listeners: dict[str, list] = {}
+        mock_page = MagicMock()
+        mock_page.on = lambda event, cb: listeners.setdefault(event, []).append(cb)
+        mock_browser = MagicMock()
+        mock_browser.snapshot = AsyncMock(
+            side_effect=lambda *_a, **_k: MagicMock(url="https://example.com", elements=[])
+        )
+        runtime._legacy_browser = mock_browser
+        runtime._legacy_page = mock_page
+        return runtime, mock_browser, listeners
+
+    @staticmethod
+    def _pred(_ctx: AssertContext) -> AssertOutcome:
+        return AssertOutcome(passed=True)
+
+    @pytest.mark.asyncio
+    async def test_back_to_back_verifications_share_snapshot(self) -> None:
+        runtime, browser, _listeners = self._runtime_with_legacy_browser()
+        runtime.begin_step(goal="Test")
+
+        assert await runtime.check(self._pred, label="a").eventually(
+            timeout_s=1.0, reuse_snapshot=True
+        )
+        assert await runtime.check(self._pred, label="b").eventually(
+            timeout_s=1.0, reuse_snapshot=True
+        )
+        assert browser.snapshot.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_eventually_takes_fresh_snapshot_unless_reuse_opted_in(self) -> None:
+        runtime, browser, _listeners = self._runtime_with_legacy_browser()
+        runtime.begin_step(goal="Test")
+
+        # The page may have been driven without record_action(); only opt-in reuses.
+        assert await runtime.check(self._pred, label="a").eventually(timeout_s=1.0)
+        assert await runtime.check(self._pred, label="b").eventually(timeout_s=1.0)
+        assert browser.snapshot.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_navigation_and_actions_invalidate_reuse(self) -> None:
+        runtime, browser, listeners = self._runtime_with_legacy_browser()
+        runtime.begin_step(goal="Test")
+
+        await runtime.check(self._pred, label="a").eventually(timeout_s=1.0, reuse_snapshot=True)
+        for cb in listeners["framenavigated"]:
+            cb(MagicMock(parent_frame=None))
+        await runtime.check(self._pred, label="b").eventually(timeout_s=1.0, reuse_snapshot=True)
+        assert browser.snapshot.await_count == 2
+
+        await runtime.record_action("CLICK(1)")
+        await runtime.check(self._pred, label="c").eventually(timeout_s=1.0, reuse_snapshot=True)
+        assert browser.snapshot.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_different_snapshot_options_are_not_reused(self) -> None:
+        runtime, browser, _listeners = self._runtime_with_legacy_browser()
+        runtime.begin_step(goal="Test")
+
+        await runtime.snapshot(limit=60)
+        await runtime.check(self._pred, label="a").eventually(timeout_s=1.0, reuse_snapshot=True)
+        assert browser.snapshot.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_eventually_retry_wakes_on_navigation(self) -> None:
+        runtime, browser, listeners = self._runtime_with_legacy_browser()
+        runtime.begin_step(goal="Test")
+        navigated = {"done": False}
+
+        def _pred(_ctx: AssertContext) -> AssertOutcome:
+            return AssertOutcome(passed=navigated["done"])
+
+        async def _navigate() -> None:
+            await asyncio.sleep(0.05)
+            navigated["done"] = True
+            for cb in listeners["framenavigated"]:
+                cb(MagicMock(parent_frame=None))
+
+        nav_task = asyncio.create_task(_navigate())
+        started = time.monotonic()
+        assert await runtime.check(_pred, label="nav").eventually(timeout_s=5.0, poll_s=2.0)
+        await nav_task
+        assert time.monotonic() - started < 1.0
+        assert browser.snapshot.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_child_frame_navigation_neither_wakes_nor_invalidates(self) -> None:
+        runtime, browser, listeners = self._runtime_with_legacy_browser()
+        runtime.begin_step(goal="Test")
+
+        await runtime.check(self._pred, label="a").eventually(timeout_s=1.0, reuse_snapshot=True)
+        iframe = MagicMock(parent_frame=MagicMock())
+        for cb in listeners["framenavigated"]:
+            cb(iframe)
+        await runtime.check(self._pred, label="b").eventually(timeout_s=1.0, reuse_snapshot=True)
+        assert browser.snapshot.await_count == 1
+
+        def _never(_ctx: AssertContext) -> AssertOutcome:
+            return AssertOutcome(passed=False)
+
+        async def _navigate_iframe() -> None:
+            await asyncio.sleep(0.05)
+            for cb in listeners["framenavigated"]:
+                cb(iframe)
+
+        snapshot_times: list[float] = []
+
+        async def _timed_snapshot(*_a, **_k):
+            snapshot_times.append(time.monotonic())
+            return MagicMock(url="https://example.com", elements=[])
+
+        browser.snapshot = AsyncMock(side_effect=_timed_snapshot)
+        nav_task = asyncio.create_task(_navigate_iframe())
+        started = time.monotonic()
+        assert not await runtime.check(_never, label="c").eventually(timeout_s=0.3, poll_s=1.0)
+        await nav_task
+        # The iframe navigation at ~0.05s did not cut the poll wait short.
+        assert all(t - started < 0.03 or t - started >= 0.25 for t in snapshot_times)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_eventually_snapshots_do_not_wake_each_other(self) -> None:
+        runtime, browser, _listeners = self._runtime_with_legacy_browser()
+        runtime.begin_step(goal="Test")
+
+        async def _slow_snapshot(*_a, **_k):
+            await asyncio.sleep(0.02)
+            return MagicMock(url="https://example.com", elements=[])
+
+        browser.snapshot = AsyncMock(side_effect=_slow_snapshot)
+
+        def _never(_ctx: AssertContext) -> AssertOutcome:
+            return AssertOutcome(passed=False)
+
+        results = await asyncio.gather(
+            runtime.check(_never, label="a").eventually(timeout_s=0.6, poll_s=0.25),
+            runtime.check(_never, label="b").eventually(timeout_s=0.6, poll_s=0.25),
+        )
+        assert results == [False, False]
+        # About three polls per check; a wake-on-snapshot loop would take dozens.
+        assert browser.snapshot.await_count <= 8
+
+
 class TestAgentRuntimeEndStep:
     @pytest.mark.asyncio
     async def test_end_step_aliases_emit_step_end(self) -> None:
@@ -911,3 +1415,23 @@ class TestAgentRuntimeEndStep:
             assert options.limit == 100  # From default
             assert options.screenshot is True  # From default
             assert options.goal == "override goal"  # From call
+
+    @pytest.mark.asyncio
+    async def test_snapshot_without_overrides_reuses_default_options(self) -> None:
+        """Test snapshot passes the default options through when there is nothing to merge."""
+        backend = MockBackend()
+        tracer = MockTracer()
+        default_options = SnapshotOptions(limit=100)
+        runtime = AgentRuntime(backend=backend, tracer=tracer, snapshot_options=default_options)
+
+        with patch("predicate.backends.snapshot.snapshot", new_callable=AsyncMock) as mock_snap_fn:
+            mock_snap_fn.return_value = MagicMock()
+
+            await runtime.snapshot()
+            assert mock_snap_fn.call_args[1]["options"] is runtime._snapshot_options
+
+            runtime._snapshot_options = SnapshotOptions(limit=25)
+            await runtime.snapshot(goal="g")
+            options = mock_snap_fn.call_args[1]["options"]
+            assert options.limit == 25
+            assert options.goal == "g"
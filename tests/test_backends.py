@@ -796,6 +796,51 @@ class TestPlaywrightBackend:
 
         assert url == "https://example.com/test"
 
+    @pytest.mark.asyncio
+    async def test_list_tabs_fetches_titles_concurrently(self) -> None:
+        """Test list_tabs issues page.title() for all tabs at once."""
+        in_flight = 0
+        max_in_flight = 0
+
+        def make_page(url: str, title: str | None) -> MagicMock:
+            page = MagicMock()
+            page.url = url
+            page.is_closed = MagicMock(return_value=False)
+
+            async def _title() -> str:
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+                if title is None:
+                    raise RuntimeError("page is navigating")
+                return title
+
+            page.title = _title
+            return page
+
+        pages = [
+            make_page("https://a.test", "A"),
+            make_page("https://b.test", None),
+            make_page("https://c.test", "C"),
+        ]
+        context = MagicMock()
+        context.pages = pages
+        for page in pages:
+            page.context = context
+
+        backend = PlaywrightBackend(pages[1])
+        tabs = await backend.list_tabs()
+
+        assert max_in_flight == 3
+        assert [(t.url, t.title, t.is_active) for t in tabs] == [
+            ("https://a.test", "A", False),
+            ("https://b.test", None, True),
+            ("https://c.test", "C", False),
+        ]
+        assert len({t.tab_id for t in tabs}) == 3
+
 
 class TestCachedSnapshot:
     """Tests for CachedSnapshot caching behavior."""
@@ -97,3 +97,57 @@ def test_read_falls_back_when_extension_returns_success_but_empty(monkeypatch):
         assert result.format == "raw"
         assert result.length > 100
         assert "<html" in result.content.lower() or "<!doctype" in result.content.lower()
+
+
+def test_read_fallback_respects_max_chars():
+    """Playwright fallback caps content to max_chars and flags truncation."""
+    from predicate.read import _fallback_read_from_page_sync
+
+    class FakePage:
+        url = "https://example.com"
+
+        def content(self) -> str:
+            return "<html><body>" + "x" * 500 + "</body></html>"
+
+    result = _fallback_read_from_page_sync(FakePage(), output_format="raw", max_chars=64)
+    assert result is not None
+    assert result.length == 64
+    assert result.truncated is True
+
+    result = _fallback_read_from_page_sync(FakePage(), output_format="raw")
+    assert result is not None
+    assert result.truncated is False
+
+
+def test_read_formats_shares_one_raw_read_for_markdown():
+    """read_formats() converts markdown from the raw read instead of reading again."""
+    from predicate import read_formats
+
+    calls: list[Any] = []
+
+    class FakePage:
+        url = "https://example.com"
+
+        def evaluate(self, _script: Any, arg: Any = None):
+            calls.append(arg)
+            html = "<html><body><h1>Title</h1><p>Body</p></body></html>"
+            return {
+                "status": "success",
+                "url": self.url,
+                "format": arg["format"],
+                "content": html,
+                "length": len(html),
+                "error": None,
+            }
+
+        def wait_for_function(self, *args: Any, **kwargs: Any) -> None:
+            return None
+
+    class FakeBrowser:
+        page = FakePage()
+
+    results = read_formats(FakeBrowser(), output_formats=("markdown", "raw"))  # type: ignore[arg-type]
+    assert list(results) == ["markdown", "raw"]
+    assert "# Title" in results["markdown"].content
+    assert "<h1>" in results["raw"].content
+    assert [c["format"] for c in calls if isinstance(c, dict) and "format" in c] == ["raw"]
@@ -0,0 +1,24 @@
+"""
+Tests for the predicate.run() script entry point.
+"""
+
+import asyncio
+import sys
+
+import predicate._runner as runner_module
+from predicate import run
+
+
+async def _answer() -> int:
+    await asyncio.sleep(0)
+    return 42
+
+
+def test_run_returns_coroutine_result():
+    assert run(_answer()) == 42
+
+
+def test_run_falls_back_to_default_loop_without_uvloop(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    assert runner_module._loop_factory() is None
+    assert run(_answer()) == 42
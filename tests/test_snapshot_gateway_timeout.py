@@ -18,16 +18,8 @@ def test_post_snapshot_async_uses_default_timeout(monkeypatch):
     class DummyClient:
         last_timeout = None
 
-        def __init__(self, timeout):
-            DummyClient.last_timeout = timeout
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return None
-
         async def post(self, *args, **kwargs):
+            DummyClient.last_timeout = kwargs.get("timeout")
             return _DummyResponse()
 
     dummy_httpx = type("DummyHttpx", (), {"AsyncClient": DummyClient})
@@ -46,16 +38,8 @@ def test_post_snapshot_async_uses_custom_timeout(monkeypatch):
     class DummyClient:
         last_timeout = None
 
-        def __init__(self, timeout):
-            DummyClient.last_timeout = timeout
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return None
-
         async def post(self, *args, **kwargs):
+            DummyClient.last_timeout = kwargs.get("timeout")
             return _DummyResponse()
 
     dummy_httpx = type("DummyHttpx", (), {"AsyncClient": DummyClient})
@@ -80,7 +64,7 @@ def test_post_snapshot_sync_uses_default_timeout(monkeypatch):
             DummyRequests.last_timeout = kwargs.get("timeout")
             return _DummyResponse()
 
-    monkeypatch.setattr(snapshot_module, "requests", DummyRequests)
+    monkeypatch.setattr(snapshot_module, "_get_gateway_session", lambda: DummyRequests)
     _post_snapshot_to_gateway_sync(
         {"raw_elements": [], "url": "https://example.com", "viewport": None, "goal": None, "options": {}},
         "sk_test",
@@ -98,7 +82,7 @@ def test_post_snapshot_sync_uses_custom_timeout(monkeypatch):
             DummyRequests.last_timeout = kwargs.get("timeout")
             return _DummyResponse()
 
-    monkeypatch.setattr(snapshot_module, "requests", DummyRequests)
+    monkeypatch.setattr(snapshot_module, "_get_gateway_session", lambda: DummyRequests)
     _post_snapshot_to_gateway_sync(
         {"raw_elements": [], "url": "https://example.com", "viewport": None, "goal": None, "options": {}},
         "sk_test",
@@ -106,3 +90,44 @@ def test_post_snapshot_sync_uses_custom_timeout(monkeypatch):
         timeout_s=9.0,
     )
     assert DummyRequests.last_timeout == 9.0
+
+
+def test_post_snapshot_async_reuses_client_per_loop(monkeypatch):
+    class DummyClient:
+        instances = 0
+        closed = 0
+
+        def __init__(self):
+            DummyClient.instances += 1
+            self.is_closed = False
+
+        async def post(self, *args, **kwargs):
+            return _DummyResponse()
+
+        async def aclose(self):
+            DummyClient.closed += 1
+            self.is_closed = True
+
+    dummy_httpx = type("DummyHttpx", (), {"AsyncClient": DummyClient})
+    monkeypatch.setitem(sys.modules, "httpx", dummy_httpx)
+    payload = {
+        "raw_elements": [],
+        "url": "https://example.com",
+        "viewport": None,
+        "goal": None,
+        "options": {},
+    }
+
+    async def _run():
+        await _post_snapshot_to_gateway_async(payload, "sk_test", "https://api.sentienceapi.com")
+        await _post_snapshot_to_gateway_async(payload, "sk_test", "https://api.sentienceapi.com")
+        assert DummyClient.instances == 1
+        await snapshot_module.aclose_gateway_clients()
+        assert DummyClient.closed == 1
+        await _post_snapshot_to_gateway_async(payload, "sk_test", "https://api.sentienceapi.com")
+        assert DummyClient.instances == 2
+
+    asyncio.run(_run())
+    # The loop's shutdown closes its client and drops the cache entry.
+    assert DummyClient.closed == 2
+    assert snapshot_module._async_gateway_clients == {}
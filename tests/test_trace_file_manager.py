@@ -33,6 +33,24 @@ class TestTraceFileManager:
         finally:
             temp_path.unlink()
 
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_encode_event(self, orjson_available, monkeypatch):
+        """Test encode_event produces one JSONL line with or without orjson"""
+        import predicate.trace_file_manager as tfm
+
+        if orjson_available and not tfm.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(tfm, "ORJSON_AVAILABLE", orjson_available)
+
+        event = {"type": "snapshot", "data": {"text": "ü", "big": 2**70, 3: "int key"}}
+        line = TraceFileManager.encode_event(event)
+
+        assert line.endswith(b"\n") and line.count(b"\n") == 1
+        assert json.loads(line) == {
+            "type": "snapshot",
+            "data": {"text": "ü", "big": 2**70, "3": "int key"},
+        }
+
     def test_ensure_directory(self):
         """Test ensuring directory exists"""
         with tempfile.TemporaryDirectory() as tmpdir:
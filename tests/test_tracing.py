@@ -69,6 +69,21 @@ def test_jsonl_trace_sink_emit():
         assert event2["seq"] == 2
 
 
+def test_jsonl_trace_sink_buffers_until_flush():
+    """Test JsonlTraceSink buffers writes and flush() makes them visible."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        trace_path = Path(tmpdir) / "trace.jsonl"
+        sink = JsonlTraceSink(trace_path, flush_interval_s=60.0)
+
+        sink.emit({"v": 1, "type": "event1", "seq": 1, "data": {"big": 2**70, 3: "ü"}})
+        assert trace_path.read_text() == ""
+
+        sink.flush()
+        event = json.loads(trace_path.read_text(encoding="utf-8"))
+        assert event["data"] == {"big": 2**70, "3": "ü"}
+        sink.close()
+
+
 def test_jsonl_trace_sink_context_manager():
     """Test JsonlTraceSink works as context manager."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -8,6 +8,7 @@ from predicate.models import BBox, Element, Snapshot, Viewport, VisualCues
 from predicate.verification import (
     AssertContext,
     AssertOutcome,
+    _parse_selector,
     all_of,
     any_of,
     custom,
@@ -146,6 +147,72 @@ class TestExists:
         assert outcome.passed is False
         assert "no snapshot available" in outcome.reason
 
+    def test_selector_parsed_once_per_selector(self):
+        _parse_selector.cache_clear()
+        snap = make_snapshot([make_element(1, role="button", text="Continue")])
+        ctx = AssertContext(snapshot=snap, url=snap.url)
+
+        preds = [exists("role=button text~'continue'") for _ in range(3)]
+        for pred in preds:
+            for _ in range(5):
+                assert pred(ctx).passed is True
+
+        info = _parse_selector.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_role_fast_path_matches_query_engine(self):
+        from predicate.query import query
+
+        link_by_href = make_element(3, role="generic", text="Docs")
+        link_by_href.href = "https://example.com/docs"
+        snap = make_snapshot(
+            [
+                make_element(1, role="heading", text="Title"),
+                make_element(2, role="button", text="Go"),
+                link_by_href,
+            ]
+        )
+        ctx = AssertContext(snapshot=snap, url=snap.url)
+        for selector in (
+            "role=heading",
+            "role=link",
+            "role=button text~'go'",
+            "role=dialog",
+            "text~'DOCS'",
+            "role=heading name~'tit'",
+            "name~'o' text~'g'",
+            "text~''",
+        ):
+            outcome = element_count(selector, min_count=0)(ctx)
+            assert outcome.details["matched"] == len(query(snap, selector)), selector
+
+    def test_snapshot_columns_are_cached_until_elements_change(self):
+        snap = make_snapshot([make_element(1, role="heading", text="Title")])
+        cols = snap.columns()
+        assert cols.roles == ("heading",)
+        assert cols.names == ("Title",)
+        assert snap.columns() is cols
+
+        snap.elements.append(make_element(2, role="button", text="Go"))
+        assert snap.columns().roles == ("heading", "button")
+        assert exists("role=button")(AssertContext(snapshot=snap)).passed is True
+
+    def test_selector_matches_are_shared_across_predicates(self):
+        el = make_element(1, role="button", text="Go")
+        el.disabled = True
+        snap = make_snapshot([el])
+        ctx = AssertContext(snapshot=snap)
+        assert exists("role=button text~'go'")(ctx).passed is True
+        assert snap.columns().matches == {"role=button text~'go'": (0,)}
+        assert is_disabled("role=button text~'go'")(ctx).passed is True
+        assert len(snap.columns().matches) == 1
+
+    def test_parsed_selector_is_read_only(self):
+        parsed = _parse_selector("role=button")
+        with pytest.raises(TypeError):
+            parsed["role"] = "link"  # type: ignore[index]
+
 
 class TestNotExists:
     """Tests for not_exists predicate."""
@@ -1,4 +1,5 @@
 import importlib
+import types
 
 import pytest
 
@@ -50,6 +51,11 @@ def test_effective_snapshot_options_use_api_override():
     opts = plugin._effective_snapshot_options()
     assert opts.use_api is False
 
+    # The result is a copy: per-call tweaks must not leak into the plugin config.
+    opts.goal = "tool label"
+    assert plugin.config.snapshot_options.goal is None
+    assert plugin.config.snapshot_options.use_api is True
+
 
 def test_register_tools_requires_browser_use(monkeypatch):
     from predicate.integrations.browser_use.plugin import PredicateBrowserUsePlugin
@@ -133,3 +139,135 @@ async def test_on_step_end_raises_on_required_auto_check_false():
     with pytest.raises(PredicateBrowserUseVerificationError):
         await plugin.on_step_end(agent=object())
 
+
+@pytest.mark.asyncio
+async def test_wait_for_extension_ready_backs_off_between_probes(monkeypatch):
+    from predicate.integrations.browser_use import plugin as plugin_mod
+
+    results = iter([False, None, False, False, False, True])
+
+    class _FakeBackend:
+        async def eval(self, _expr: str):
+            return next(results)
+
+    class _FakeRuntime:
+        backend = _FakeBackend()
+
+    sleeps: list[float] = []
+
+    async def _fake_sleep(s: float) -> None:
+        sleeps.append(s)
+
+    monkeypatch.setattr(plugin_mod.asyncio, "sleep", _fake_sleep)
+
+    plugin = plugin_mod.PredicateBrowserUsePlugin()
+    plugin.runtime = _FakeRuntime()  # type: ignore[assignment]
+
+    # pylint: disable=protected-access
+    await plugin._wait_for_extension_ready(timeout_ms=10_000)
+    assert sleeps == [0.025, 0.05, 0.1, 0.2, 0.25]
+
+
+@pytest.mark.asyncio
+async def test_bind_returns_without_locking_when_already_bound():
+    from predicate.integrations.browser_use.plugin import PredicateBrowserUsePlugin
+
+    class _ExplodingLock:
+        async def __aenter__(self):
+            raise AssertionError("bind() took the lock on the already-bound path")
+
+        async def __aexit__(self, *_exc):
+            return False
+
+    session = object()
+    plugin = PredicateBrowserUsePlugin()
+    plugin._bound_session = session  # pylint: disable=protected-access
+    plugin.runtime = object()  # type: ignore[assignment]
+    plugin.dbg = object()  # type: ignore[assignment]
+    plugin._lock = _ExplodingLock()  # type: ignore[assignment]  # pylint: disable=protected-access
+
+    await plugin.bind(browser_session=session)
+
+    with pytest.raises(ValueError):
+        await plugin.bind(browser_session=None)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_extension_ready_cancels_hung_probe(monkeypatch):
+    import asyncio
+
+    from predicate.integrations.browser_use import plugin as plugin_mod
+
+    monkeypatch.setattr(plugin_mod, "_EXTENSION_PROBE_TIMEOUT_S", 0.01)
+    cancelled: list[bool] = []
+
+    class _HungBackend:
+        async def eval(self, _expr: str):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+    class _FakeRuntime:
+        backend = _HungBackend()
+
+    plugin = plugin_mod.PredicateBrowserUsePlugin()
+    plugin.runtime = _FakeRuntime()  # type: ignore[assignment]
+
+    # pylint: disable=protected-access
+    with pytest.raises(TimeoutError, match="__EVAL_TIMEOUT__"):
+        await plugin._wait_for_extension_ready(timeout_ms=1)
+    assert cancelled  # every timed-out probe was cancelled, not left running
+
+
+@pytest.mark.asyncio
+async def test_snapshot_tool_uses_config_edits_made_after_bind(monkeypatch):
+    from predicate.integrations.browser_use.plugin import PredicateBrowserUsePlugin
+
+    fake_browser_use = types.SimpleNamespace(
+        ActionResult=lambda **kwargs: kwargs, BrowserSession=object
+    )
+    real_import_module = importlib.import_module
+
+    def _fake_import_module(name: str, *args, **kwargs):
+        if name == "browser_use":
+            return fake_browser_use
+        return real_import_module(name, *args, **kwargs)
+
+    monkeypatch.setattr(importlib, "import_module", _fake_import_module)
+
+    class _Tools:
+        def __init__(self):
+            self.actions = {}
+
+        def action(self, _description):
+            def _register(fn):
+                self.actions[fn.__name__] = fn
+                return fn
+
+            return _register
+
+    class _Runtime:
+        def __init__(self):
+            self.calls: list[dict] = []
+
+        async def snapshot(self, **kwargs):
+            self.calls.append(kwargs)
+            return types.SimpleNamespace(url="https://example.com", elements=[])
+
+    session = object()
+    plugin = PredicateBrowserUsePlugin()
+    plugin._bound_session = session  # pylint: disable=protected-access
+    plugin.runtime = _Runtime()  # type: ignore[assignment]
+    plugin.dbg = object()  # type: ignore[assignment]
+    tools = _Tools()
+    plugin.register_tools(tools)
+
+    plugin.config.snapshot_options.limit = 77
+    await tools.actions["predicate_snapshot"](browser_session=session, label="checkout")
+
+    call = plugin.runtime.calls[-1]  # type: ignore[attr-defined]
+    assert call["limit"] == 77
+    assert call["goal"] == "checkout"
+    assert plugin.config.snapshot_options.goal is None
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pytest
 
 from predicate.agent_runtime import AgentRuntime
-from predicate.captcha import PageControlHook
+from predicate.captcha import CaptchaOptions, PageControlHook
 from predicate.models import CaptchaDiagnostics, CaptchaEvidence, Snapshot, SnapshotDiagnostics
 
 
@@ -54,3 +54,53 @@ async def test_captcha_context_page_control_evaluate_js() -> None:
 
     result = await ctx.page_control.evaluate_js("1+1")
     assert result == "ok"
+
+
+@pytest.mark.parametrize(
+    ("hits", "blocked"),
+    [
+        ({"iframe_src_hits": ["https://www.google.com/recaptcha/api2/anchor"]}, False),
+        ({"iframe_src_hits": ["https://www.google.com/recaptcha/api2/bframe"]}, True),
+        ({"text_hits": ["Verify you are human"]}, True),
+        ({"text_hits": ["human", "verification"]}, True),
+        ({"url_hits": ["recaptcha"], "selector_hits": ["#g-recaptcha-response"]}, True),
+        ({"text_hits": ["captcha", "Sign in"]}, True),
+        ({"selector_hits": ["#cf-turnstile-response"]}, False),
+    ],
+)
+def test_is_captcha_detected_requires_interactive_evidence(hits: dict, blocked: bool) -> None:
+    runtime = AgentRuntime(backend=EvalBackend(), tracer=MockTracer())
+    runtime.set_captcha_options(CaptchaOptions())
+
+    snapshot = make_captcha_snapshot()
+    snapshot.diagnostics.captcha.evidence = CaptchaEvidence(
+        **{
+            "iframe_src_hits": [],
+            "text_hits": [],
+            "selector_hits": [],
+            "url_hits": [],
+            **hits,
+        }
+    )
+
+    assert runtime._is_captcha_detected(snapshot) is blocked
+
+
+def test_captcha_evidence_scan_stops_at_first_strong_hit() -> None:
+    read: list[str] = []
+
+    class _Evidence:
+        def __getattr__(self, name: str) -> list[str]:
+            read.append(name)
+            return ["https://www.google.com/recaptcha/api2/bframe"]
+
+    assert AgentRuntime._captcha_evidence_is_interactive(_Evidence()) is True
+    assert read == ["iframe_src_hits"]
+
+
+def test_captcha_page_control_is_reused_across_contexts() -> None:
+    runtime = AgentRuntime(backend=EvalBackend(), tracer=MockTracer())
+
+    first = runtime._build_captcha_context(make_captcha_snapshot(), source="gateway")
+    second = runtime._build_captcha_context(make_captcha_snapshot(), source="gateway")
+    assert first.page_control is second.page_control
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest.mock import patch
 
@@ -376,3 +377,13 @@ def test_upload_to_cloud_handles_network_error(tmp_path) -> None:
 
         result = buf.upload_to_cloud(api_key="test-key", persisted_dir=run_dir)
         assert result is None
+
+
+def test_add_frame_async_writes_then_records(tmp_path) -> None:
+    opts = FailureArtifactsOptions(output_dir=str(tmp_path))
+    buf = FailureArtifactBuffer(run_id="run-async", options=opts, time_fn=lambda: 5.0)
+
+    asyncio.run(buf.add_frame_async(b"jpeg-bytes", fmt="jpeg"))
+
+    assert buf.frame_count() == 1
+    assert (buf.temp_dir / "frames" / "frame_5000.jpeg").read_bytes() == b"jpeg-bytes"
@@ -221,3 +221,144 @@ def test_predicate_browser_agent_token_usage_is_opt_in_and_best_effort() -> None
 
     asyncio.run(_run())
 
+
+def test_predicate_browser_agent_batches_action_proposals() -> None:
+    async def _run() -> None:
+        backend = MockBackend()
+        tracer = MockTracer()
+        runtime = AgentRuntime(backend=backend, tracer=tracer)
+
+        s0 = make_snapshot(
+            url="https://example.com/start",
+            elements=[make_clickable_element(1), make_clickable_element(2)],
+        )
+
+        async def fake_snapshot(**_kwargs):
+            runtime.last_snapshot = s0
+            return runtime.last_snapshot
+
+        runtime.snapshot = AsyncMock(side_effect=fake_snapshot)  # type: ignore[method-assign]
+
+        steps = [
+            RuntimeStep(goal="Click first", verifications=[]),
+            RuntimeStep(goal="Click second", verifications=[]),
+            RuntimeStep(goal="Finish", verifications=[]),
+        ]
+        executor = ProviderStub(responses=["[1] CLICK(1)\n[2] CLICK(2)\n[3] FINISH()"])
+
+        agent = PredicateBrowserAgent(
+            runtime=runtime,
+            executor=executor,
+            config=PredicateBrowserAgentConfig(batch_size=3),
+        )
+
+        ok = await agent.run(task_goal="test", steps=steps)
+        assert ok is True
+        # One LLM call for all three steps; both clicks executed.
+        assert len(executor.calls) == 1
+        assert "[1] STEP GOAL: Click first" in executor.calls[0]["user"]
+        assert "[3] STEP GOAL: Finish" in executor.calls[0]["user"]
+        assert len(backend.mouse_clicks) == 2
+        assert runtime.snapshot.await_count == 3
+
+    asyncio.run(_run())
+
+
+def test_predicate_browser_agent_reproposes_batched_action_whose_element_changed() -> None:
+    async def _run() -> None:
+        backend = MockBackend()
+        runtime = AgentRuntime(backend=backend, tracer=MockTracer())
+
+        before = make_snapshot(
+            url="https://example.com/start",
+            elements=[make_clickable_element(1), make_clickable_element(2)],
+        )
+        replaced = make_clickable_element(2).model_copy(update={"role": "link"})
+        after = make_snapshot(
+            url="https://example.com/start", elements=[make_clickable_element(1), replaced]
+        )
+        snaps = iter([before, after])
+
+        async def fake_snapshot(**_kwargs):
+            runtime.last_snapshot = next(snaps, after)
+            return runtime.last_snapshot
+
+        runtime.snapshot = AsyncMock(side_effect=fake_snapshot)  # type: ignore[method-assign]
+
+        steps = [
+            RuntimeStep(goal="Click first", verifications=[]),
+            RuntimeStep(goal="Click second", verifications=[]),
+        ]
+        executor = ProviderStub(responses=["[1] CLICK(1)\n[2] CLICK(2)", "CLICK(1)"])
+
+        agent = PredicateBrowserAgent(
+            runtime=runtime,
+            executor=executor,
+            config=PredicateBrowserAgentConfig(batch_size=2),
+        )
+
+        assert await agent.run(task_goal="test", steps=steps) is True
+        # Element 2 changed role after the first click, so step 2 was proposed again.
+        assert len(executor.calls) == 2
+        assert "[1] STEP GOAL" not in executor.calls[1]["user"]
+        assert len(backend.mouse_clicks) == 2
+
+    asyncio.run(_run())
+
+
+def test_predicate_browser_agent_token_accounting_forwards_generate_batch() -> None:
+    class NativeBatchProvider(TokenProviderStub):
+        batch_calls = 0
+
+        def generate_batch(self, system_prompt, user_prompt, n, **kwargs):
+            NativeBatchProvider.batch_calls += 1
+            return super().generate_batch(system_prompt, user_prompt, n, **kwargs)
+
+    async def _run() -> None:
+        runtime = AgentRuntime(backend=MockBackend(), tracer=MockTracer())
+        s0 = make_snapshot(url="https://example.com/start", elements=[make_clickable_element(1)])
+
+        async def fake_snapshot(**_kwargs):
+            runtime.last_snapshot = s0
+            return runtime.last_snapshot
+
+        runtime.snapshot = AsyncMock(side_effect=fake_snapshot)  # type: ignore[method-assign]
+
+        agent = PredicateBrowserAgent(
+            runtime=runtime,
+            executor=NativeBatchProvider(response="[1] FINISH()\n[2] FINISH()"),
+            config=PredicateBrowserAgentConfig(batch_size=2, token_usage_enabled=True),
+        )
+        steps = [RuntimeStep(goal="a", verifications=[]), RuntimeStep(goal="b", verifications=[])]
+        await agent.run(task_goal="test", steps=steps)
+
+        assert NativeBatchProvider.batch_calls == 1
+        assert agent.get_token_usage()["by_role"]["executor"]["calls"] == 1
+
+    asyncio.run(_run())
+
+
+def test_generate_batch_splits_indexed_reply_and_marks_missing() -> None:
+    executor = TokenProviderStub(response="[2] CLICK(5)\n[1] FINISH()")
+    out = executor.generate_batch("sys", "user", 3)
+    assert [r.content for r in out] == ["FINISH()", "CLICK(5)", ""]
+    assert out[0].total_tokens == 18
+    assert out[1].total_tokens is None
+
+
+def test_predicate_browser_agent_history_summary_is_cached_until_next_step() -> None:
+    runtime = AgentRuntime(backend=MockBackend(), tracer=MockTracer())
+    agent = PredicateBrowserAgent(
+        runtime=runtime,
+        executor=ProviderStub(),
+        config=PredicateBrowserAgentConfig(history_last_n=2),
+    )
+
+    agent._record_step_history(step_goal="Open cart", ok=True)
+    first = agent._get_history_summary()
+    assert first == "- Open cart -> ok"
+    assert agent._get_history_summary() is first
+
+    agent._record_step_history(step_goal="Checkout", ok=False)
+    agent._record_step_history(step_goal="Retry", ok=True)
+    assert agent._get_history_summary() == "- Checkout -> fail\n- Retry -> ok"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -451,3 +452,106 @@ async def test_short_circuit_to_vision_on_canvas_and_low_actionables() -> None:
     assert len(executor.calls) == 0
     assert len(vision.calls) == 1
     assert backend.mouse_clicks == [(100.0, 200.0)]
+
+
+@pytest.mark.asyncio
+async def test_eventually_verifications_poll_concurrently_and_record_in_order() -> None:
+    backend = MockBackend()
+    tracer = MockTracer()
+    runtime = AgentRuntime(backend=backend, tracer=tracer)
+    runtime.begin_step(goal="verify")
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_snapshot(**_kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        runtime.last_snapshot = make_snapshot(url="https://example.com/done", elements=[])
+        return runtime.last_snapshot
+
+    runtime.snapshot = AsyncMock(side_effect=slow_snapshot)  # type: ignore[method-assign]
+    agent = RuntimeAgent(runtime=runtime, executor=ProviderStub(), vision_executor=None)
+
+    def slow_pred(ctx: AssertContext) -> AssertOutcome:
+        # Fails on the first snapshot so the first verification finishes last.
+        ok = runtime.snapshot.await_count > 2
+        return AssertOutcome(passed=ok, reason="", details={})
+
+    def fast_pred(ctx: AssertContext) -> AssertOutcome:
+        return AssertOutcome(passed=True, reason="", details={})
+
+    step = RuntimeStep(
+        goal="verify",
+        verifications=[
+            StepVerification(predicate=slow_pred, label="slow", timeout_s=1.0, poll_s=0.0),
+            StepVerification(predicate=fast_pred, label="fast", timeout_s=1.0, poll_s=0.0),
+        ],
+        parallel_verifications=True,
+    )
+
+    ok = await agent._apply_verifications(step=step)
+    assert ok is True
+    assert max_in_flight == 2
+    assert [a["label"] for a in runtime._assertions_this_step] == ["slow", "fast"]
+
+
+def test_parse_action_grammar() -> None:
+    runtime = AgentRuntime(backend=MockBackend(), tracer=MockTracer())
+    agent = RuntimeAgent(runtime=runtime, executor=ProviderStub(responses=[]))
+
+    assert agent._parse_action("CLICK(12)") == ("click", {"id": 12})
+    assert agent._parse_action("click ( 3 ) ") == ("click", {"id": 3})
+    assert agent._parse_action("TYPE(4, 'hello world')") == (
+        "type",
+        {"id": 4, "text": "hello world"},
+    )
+    assert agent._parse_action('PRESS("Enter")') == ("press", {"key": "Enter"})
+    assert agent._parse_action("FINISH()") == ("finish", {})
+    assert agent._parse_action("CLICK_XY(1.5, -2)") == ("click_xy", {"x": 1.5, "y": -2.0})
+    assert agent._parse_action("CLICK_RECT(1, 2, 3, 4)") == (
+        "click_rect",
+        {"x": 1.0, "y": 2.0, "w": 3.0, "h": 4.0},
+    )
+    for bad in ("CLICK(a)", "CLICK(1) extra", "SCROLL(1)", ""):
+        with pytest.raises(ValueError):
+            agent._parse_action(bad)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parallel", [False, True])
+async def test_one_shot_verification_sees_page_after_eventually_wait(parallel: bool) -> None:
+    runtime = AgentRuntime(backend=MockBackend(), tracer=MockTracer())
+    runtime.begin_step(goal="verify")
+    urls = ["https://example.com/loading", "https://example.com/done"]
+
+    async def slow_snapshot(**_kwargs):
+        await asyncio.sleep(0.02)
+        url = urls.pop(0) if urls else "https://example.com/done"
+        runtime.last_snapshot = make_snapshot(url=url, elements=[])
+        return runtime.last_snapshot
+
+    runtime.snapshot = AsyncMock(side_effect=slow_snapshot)  # type: ignore[method-assign]
+    agent = RuntimeAgent(runtime=runtime, executor=ProviderStub(), vision_executor=None)
+
+    def done(ctx: AssertContext) -> AssertOutcome:
+        return AssertOutcome(passed=(ctx.url or "").endswith("/done"), reason="", details={})
+
+    step = RuntimeStep(
+        goal="verify",
+        verifications=[
+            StepVerification(predicate=done, label="done", timeout_s=1.0, poll_s=0.0),
+            StepVerification(predicate=done, label="done", eventually=False),
+        ],
+        parallel_verifications=parallel,
+    )
+
+    assert await agent._apply_verifications(step=step) is True
+    # Same label twice: records stay in declaration order (the eventually check first).
+    assert [(a["passed"], bool(a.get("eventually"))) for a in runtime._assertions_this_step] == [
+        (True, True),
+        (True, False),
+    ]